@@ -1,23 +1,35 @@
+import time
+STARTUP_TIME = time.perf_counter()
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 from tkcalendar import Calendar
 import datetime
 import os
-import time
+import heapq
+import bisect
+import itertools
+import random
 import base64
 from email.mime.text import MIMEText
+from email.utils import formataddr, make_msgid
+import smtplib
 import threading
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from requests import HTTPError
+import asyncio
+import queue
+from collections import namedtuple
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import importlib
 import os.path
 import json
-import requests
+import array
+import sqlite3
+import uuid
+import weakref
 import sys
 import webbrowser
+import http.server
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -29,83 +41,2251 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
+class StartupReport:
+    # Startup timings in the spirit of python -X importtime. Every phase is printed
+    # with its own and its cumulative time since the process started when the app
+    # is launched with --startup-report, so slow starts are easy to spot
+    def __init__(self, enabled=False, start=STARTUP_TIME):
+        self.enabled = enabled
+        self.start = start
+        self.last = start
+        self.phases = []  # (phase, seconds, seconds since start)
+        self.lock = threading.Lock()
+        if enabled:
+            print("startup: self [ms] | cumulative [ms] | phase")
+
+    def mark(self, phase):
+        # Phase that ran on the main thread since the previous mark
+        now = time.perf_counter()
+        with self.lock:
+            self.add(phase, now - self.last, now)
+            self.last = now
+
+    def record(self, phase, seconds):
+        # Phase that ran on another thread, it does not move the main thread mark
+        with self.lock:
+            self.add(phase, seconds, time.perf_counter())
+
+    def add(self, phase, seconds, now):
+        self.phases.append((phase, seconds, now - self.start))
+        if self.enabled:
+            print(f"startup: {seconds * 1000:10.1f} | {(now - self.start) * 1000:15.1f} | {phase}")
+
+    def save(self, path):
+        # Machine-readable copy of the report, used by benchmark.py
+        with self.lock:
+            phases = [{"phase": phase, "ms": seconds * 1000, "cumulative_ms": cumulative * 1000}
+                      for phase, seconds, cumulative in self.phases]
+        write_json_atomically(path, {"phases": phases})
+
+class GoogleLibraries:
+    # The Google client libraries and requests take a large part of the startup time
+    # and are only needed when a reminder is sent or the settings window is opened.
+    # They are imported on first use, or by preload() on a background thread once
+    # the main window has been painted
+    MODULES = [
+        "requests",
+        "httplib2",
+        "google.oauth2.credentials",
+        "google.auth.transport.requests",
+        "google_auth_oauthlib.flow",
+        "google_auth_httplib2",
+        "googleapiclient.discovery",
+        "googleapiclient.errors"
+    ]
+
+    def __init__(self, report=None):
+        self.report = report
+        self.lock = threading.Lock()
+        self.loaded = False
+
+    def load(self):
+        with self.lock:
+            if not self.loaded:
+                start = time.perf_counter()
+                modules = {}
+                for name in self.MODULES:
+                    module_start = time.perf_counter()
+                    modules[name] = importlib.import_module(name)
+                    if self.report:
+                        self.report.record(f"import {name}", time.perf_counter() - module_start)
+                self.requests = modules["requests"]
+                self.httplib2 = modules["httplib2"]
+                self.Credentials = modules["google.oauth2.credentials"].Credentials
+                self.Request = modules["google.auth.transport.requests"].Request
+                self.InstalledAppFlow = modules["google_auth_oauthlib.flow"].InstalledAppFlow
+                self.AuthorizedHttp = modules["google_auth_httplib2"].AuthorizedHttp
+                self.build = modules["googleapiclient.discovery"].build
+                self.HttpError = modules["googleapiclient.errors"].HttpError
+                self.loaded = True
+                if self.report:
+                    self.report.record("Google libraries", time.perf_counter() - start)
+        return self
+
+    def preload(self):
+        thread = threading.Thread(target=self.load)
+        thread.daemon = True
+        thread.start()
+
+# Shared by every part of the app that talks to Google
+google_libraries = GoogleLibraries()
+
+# Dates are stored as "YYYY-MM-DD HH:MM:SS", ISO 8601 with a space as separator.
+# isoformat and fromisoformat produce and read exactly these strings several times
+# faster than strftime and strptime
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def format_date(date):
+    return date.isoformat(" ", "seconds")
+
+def parse_date(value):
+    # strptime is only the fallback for strings fromisoformat does not understand
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.datetime.strptime(value, DATE_FORMAT)
+
+# Naive dates are kept in memory as whole seconds since this moment, so they fit in
+# an array without the time zone conversions of real epoch timestamps
+EPOCH = datetime.datetime(1970, 1, 1)
+NO_DATE = -2**63  # Stands for a missing notify_date in date arrays
+
+def to_seconds(date):
+    return (date - EPOCH) // datetime.timedelta(seconds=1)
+
+def from_seconds(seconds):
+    return EPOCH + datetime.timedelta(seconds=seconds)
+
+# The same recipients tend to be used for many events, so equal recipient lists
+# share one tuple
+recipient_lists = {}
+
+def intern_recipients(emails):
+    emails = tuple(sys.intern(email) for email in emails)
+    return recipient_lists.setdefault(emails, emails)
+
+class Recurrence:
+    # RRULE-style rule of a recurring event: every interval days, weeks, months or
+    # years from start, ending after count occurrences or after until. Exceptions
+    # are the dates of removed occurrences. Only the rule is stored, occurrences
+    # are generated lazily for the time window that is asked for
+    FREQUENCIES = ("daily", "weekly", "monthly", "yearly")
+    __slots__ = ("frequency", "start", "interval", "count", "until", "exceptions")
+
+    def __init__(self, frequency, start, interval=1, count=None, until=None, exceptions=()):
+        if frequency not in self.FREQUENCIES:
+            raise ValueError(f"Unknown frequency: {frequency}")
+        if interval < 1:
+            raise ValueError("The interval of a recurrence must be at least 1")
+        self.frequency = frequency
+        self.start = start
+        self.interval = interval
+        self.count = count
+        self.until = until
+        self.exceptions = frozenset(exceptions)
+
+    def occurrences(self, window_start=None, window_end=None):
+        # Yields the dates of the occurrences in [window_start, window_end) in order
+        index = self._first_index(window_start)
+        produced = index  # Occurrences before the first index, none of them skipped
+        while self.count is None or produced < self.count:
+            try:
+                date = self._nth(index)
+            except OverflowError:
+                return
+            index += 1
+            if date is None:
+                # The day does not exist in that month, like the 31st of April
+                continue
+            produced += 1
+            if (self.until is not None and date > self.until) or (window_end is not None and date >= window_end):
+                return
+            if (window_start is None or date >= window_start) and date not in self.exceptions:
+                yield date
+
+    def next_after(self, date):
+        # The first occurrence later than date, or None at the end of the series
+        for occurrence in self.occurrences(date):
+            if occurrence > date:
+                return occurrence
+        return None
+
+    def excluding(self, date):
+        return Recurrence(self.frequency, self.start, self.interval, self.count, self.until, self.exceptions | {date})
+
+    def serialize(self):
+        return {
+            "frequency": self.frequency,
+            "start": format_date(self.start),
+            "interval": self.interval,
+            "count": self.count,
+            "until": format_date(self.until) if self.until else None,
+            "exceptions": sorted(format_date(date) for date in self.exceptions)
+        }
+
+    @classmethod
+    def deserialize(cls, data):
+        return cls(data["frequency"], parse_date(data["start"]), data.get("interval", 1), data.get("count"),
+                   parse_date(data["until"]) if data.get("until") else None,
+                   [parse_date(date) for date in data.get("exceptions", [])])
+
+    def _first_index(self, window_start):
+        # Occurrences before the window are skipped arithmetically. A series that can
+        # skip days (the 31st, February 29) and ends after a count is walked from
+        # the start, because skipped days do not count
+        if window_start is None or window_start <= self.start:
+            return 0
+        if self.count is not None and (self.frequency == "monthly" and self.start.day > 28 or
+                                       self.frequency == "yearly" and (self.start.month, self.start.day) == (2, 29)):
+            return 0
+        if self.frequency in ("daily", "weekly"):
+            return (window_start - self.start) // self._step()
+        months = (window_start.year - self.start.year) * 12 + window_start.month - self.start.month
+        return months // self._months()
+
+    def _step(self):
+        return datetime.timedelta(days=self.interval * (7 if self.frequency == "weekly" else 1))
+
+    def _months(self):
+        return self.interval * (12 if self.frequency == "yearly" else 1)
+
+    def _nth(self, index):
+        if self.frequency in ("daily", "weekly"):
+            return self.start + self._step() * index
+        months = self.start.month - 1 + self._months() * index
+        year = self.start.year + months // 12
+        if year > datetime.MAXYEAR:
+            raise OverflowError
+        try:
+            return self.start.replace(year=year, month=months % 12 + 1)
+        except ValueError:
+            return None
+
 class Event:
-    def __init__(self, title, description, date, emails, notify_date = None, sent = False):
+    # Slots instead of a per-instance __dict__; __weakref__ is kept for the
+    # delivery journal. A recurring event is stored once with its rule; date and
+    # notify_date are those of its current occurrence and move on with advance()
+    __slots__ = ("id", "title", "description", "date", "emails", "notify_date", "sent", "recurrence", "__weakref__")
+
+    def __init__(self, title, description, date, emails, notify_date = None, sent = False, id = None, recurrence = None):
+        self.id = id or uuid.uuid4().hex  # Stable identity used by the delivery journal
         self.title = title
         self.description = description
         self.date = date
-        self.emails = emails
+        self.emails = intern_recipients(emails)
         self.notify_date = notify_date  # Add a field to store the date and time of the notification
         self.sent = sent
+        self.recurrence = recurrence
         
     def serialize(self):
         # Converting the event object to a dictionary
         event_dict = {
             "title": self.title,
             "description": self.description,
-            "date": self.date.strftime("%Y-%m-%d %H:%M:%S"),  # Convert date to string
-            "emails": self.emails,
-            "notify_date": self.notify_date.strftime("%Y-%m-%d %H:%M:%S") if self.notify_date else None,  # Convert the notification date to a string
-            "sent": self.sent
+            "date": format_date(self.date),  # Convert date to string
+            "emails": list(self.emails),
+            "notify_date": format_date(self.notify_date) if self.notify_date else None,  # Convert the notification date to a string
+            "sent": self.sent,
+            "id": self.id
         }
+        if self.recurrence:
+            event_dict["recurrence"] = self.recurrence.serialize()
         return event_dict
     
     @classmethod
     def deserialize(cls, event_dict):
         # Create an event object from the dictionary
-        date = datetime.datetime.strptime(event_dict["date"], "%Y-%m-%d %H:%M:%S")
-        notify_date = datetime.datetime.strptime(event_dict["notify_date"], "%Y-%m-%d %H:%M:%S") if event_dict["notify_date"] else None
-        return cls(event_dict["title"], event_dict["description"], date, event_dict["emails"], notify_date, event_dict["sent"])
+        date = parse_date(event_dict["date"])
+        notify_date = parse_date(event_dict["notify_date"]) if event_dict["notify_date"] else None
+        recurrence = Recurrence.deserialize(event_dict["recurrence"]) if event_dict.get("recurrence") else None
+        return cls(event_dict["title"], event_dict["description"], date, event_dict["emails"], notify_date, event_dict["sent"], event_dict.get("id"), recurrence)
+
+    def occurrences(self, window_start=None, window_end=None):
+        # Dates of the event in [window_start, window_end)
+        if self.recurrence:
+            yield from self.recurrence.occurrences(window_start, window_end)
+        elif (window_start is None or self.date >= window_start) and (window_end is None or self.date < window_end):
+            yield self.date
+
+    def advance(self, now=None):
+        # Moves a recurring event on to its next occurrence that has not started yet,
+        # with the reminder the same time before it. Returns False at the end of the
+        # series or for a one-off event
+        if self.recurrence is None:
+            return False
+        date = self.recurrence.next_after(max(self.date, now or datetime.datetime.now()))
+        if date is None:
+            return False
+        if self.notify_date:
+            self.notify_date = date - (self.date - self.notify_date)
+        self.date = date
+        self.sent = False
+        return True
     
-"""
-This is the official English localization.
-"""
+class NotificationScheduler:
+    # Keeps pending reminders in a heap ordered by notify_date and sleeps until the
+    # earliest one is due, instead of rescanning every event once a minute. It runs
+    # on an asyncio event loop in its own thread: every due batch is dispatched as
+    # a task, so batches waiting on the network, the rate limit or a retry backoff
+    # don't hold a thread. Other threads change the heap under the lock and wake
+    # the loop with call_soon_threadsafe
+    def __init__(self, dispatch, on_dispatched=None, retry_interval=60, max_sleep=60):
+        self.dispatch = dispatch  # Coroutine function called with a batch of due events
+        self.on_dispatched = on_dispatched  # Called with the batch once its retries are scheduled
+        self.retry_interval = retry_interval  # Delay before a failed reminder is tried again
+        self.max_sleep = max_sleep  # Upper bound on a single wait so wall clock jumps are noticed
+        self.heap = []
+        self.entries = {}  # id(event) -> heap entry
+        self.in_flight = {}  # id(event) -> event currently being dispatched
+        self.cancelled = 0
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+        self.loop = None
+        self.wakeup = None
+        self.stopping = False
+        self.tasks = set()
+        self.thread = None
+
+    def start(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_until_complete, args=(self.run(),), name="reminders")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self, timeout=10, cancel_timeout=5):
+        # Batches already being sent are finished, so no send is cut off halfway
+        # and its outcome reaches the journal. Batches still running after timeout
+        # are cancelled; their reminders stay pending in the journal and are sent
+        # again on the next start. Returns False if the loop thread did not exit
+        if self.thread is None:
+            return True
+        self.loop.call_soon_threadsafe(self._stop)
+        self.thread.join(timeout)
+        if self.thread.is_alive():
+            print(f"Reminders still being sent after {timeout} s, cancelling them")
+            self.loop.call_soon_threadsafe(self._cancel_tasks)
+            self.thread.join(cancel_timeout)
+            if self.thread.is_alive():
+                return False
+        self.loop.close()
+        return True
+
+    def schedule(self, event, when=None):
+        with self.lock:
+            self._remove(event)
+            if event.notify_date and not event.sent:
+                self._push(event, when or event.notify_date)
+                # Only wake the worker if its next deadline has changed
+                if self.heap[0][-1] is event:
+                    self._notify()
+
+    def schedule_all(self, events):
+        # Bulk load used at startup: heapify is O(n) instead of n pushes
+        with self.lock:
+            for event in events:
+                if event.notify_date and not event.sent and id(event) not in self.entries:
+                    entry = [event.notify_date, next(self.counter), event]
+                    self.entries[id(event)] = entry
+                    self.heap.append(entry)
+            heapq.heapify(self.heap)
+            self._notify()
+
+    def unschedule(self, event):
+        with self.lock:
+            self._remove(event)
+
+    def _notify(self):
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    def _stop(self):
+        self.stopping = True
+        self._wake()
+
+    def _cancel_tasks(self):
+        for task in self.tasks:
+            task.cancel()
+
+    def _push(self, event, when):
+        entry = [when, next(self.counter), event]
+        self.entries[id(event)] = entry
+        heapq.heappush(self.heap, entry)
+
+    def _remove(self, event):
+        self.in_flight.pop(id(event), None)
+        entry = self.entries.pop(id(event), None)
+        if entry is not None:
+            # Cancelled entries stay in the heap and are dropped when they reach the top
+            entry[-1] = None
+            self.cancelled += 1
+            if self.cancelled > 64 and self.cancelled > len(self.heap) // 2:
+                self.heap = [entry for entry in self.heap if entry[-1] is not None]
+                heapq.heapify(self.heap)
+                self.cancelled = 0
+
+    def _pop_due(self, now):
+        due = []
+        while self.heap and (self.heap[0][-1] is None or self.heap[0][0] <= now):
+            entry = heapq.heappop(self.heap)
+            event = entry[-1]
+            if event is None:
+                self.cancelled -= 1
+                continue
+            del self.entries[id(event)]
+            self.in_flight[id(event)] = event
+            due.append(event)
+        return due
+
+    async def run(self):
+        self.wakeup = asyncio.Event()
+        while not self.stopping:
+            # Cleared before looking at the heap: wakeups are only delivered while
+            # the loop waits below, so none can be lost in between
+            self.wakeup.clear()
+            with self.lock:
+                now = datetime.datetime.now()
+                due = self._pop_due(now)
+                delay = (self.heap[0][0] - now).total_seconds() if self.heap else None
+
+            if due:
+                task = asyncio.ensure_future(self._dispatch(due))
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+                continue
+
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), min(delay, self.max_sleep) if delay is not None else None)
+            except asyncio.TimeoutError:
+                pass
+
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def _dispatch(self, due):
+        try:
+            await self.dispatch(due)
+        except Exception as e:
+            print(f"Error sending notifications: {e}")
+
+        # Reminders that could not be sent are retried later, unless they were
+        # edited or deleted while the dispatch was running
+        retry_at = datetime.datetime.now() + datetime.timedelta(seconds=self.retry_interval)
+        with self.lock:
+            for event in due:
+                if self.in_flight.pop(id(event), None) is not None and not event.sent:
+                    self._push(event, retry_at)
+            self._notify()
+        if self.on_dispatched:
+            self.on_dispatched(due)
+
+class GmailSession:
+    # Long-lived Gmail API client for the notification worker. The service is built
+    # once, the access token is refreshed only shortly before it expires and
+    # credentials.json is re-read only when the file on disk changes
+    def __init__(self, path='credentials.json', refresh_margin=300, timeout=10):
+        self.path = path
+        self.refresh_margin = datetime.timedelta(seconds=refresh_margin)
+        self.timeout = timeout
+        self.credentials = None
+        self.service = None
+        self.file_signature = None
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+        # Counters to confirm that the slow paths are not taken on every pass
+        self.credential_loads = 0
+        self.discovery_builds = 0
+        self.token_refreshes = 0
+
+    def get_credentials(self):
+        with self.lock:
+            return self._get_credentials()
+
+    def get_service(self):
+        with self.lock:
+            credentials = self._get_credentials()
+            if self.service is None:
+                self.service = google_libraries.load().build('gmail', 'v1', credentials=credentials)
+                self.discovery_builds += 1
+                print(f"Gmail service built: {self.stats()}")
+            return self.service
+
+    def http(self, timeout=30):
+        # httplib2 connections are not thread-safe, so every dispatch worker gets its
+        # own authorized connection bound to the current credentials
+        credentials = self.get_credentials()
+        if getattr(self.local, 'credentials', None) is not credentials:
+            self.local.credentials = credentials
+            google = google_libraries.load()
+            self.local.http = google.AuthorizedHttp(credentials, http=google.httplib2.Http(timeout=timeout))
+        return self.local.http
+
+    def stats(self):
+        return {
+            "credential_loads": self.credential_loads,
+            "discovery_builds": self.discovery_builds,
+            "token_refreshes": self.token_refreshes
+        }
+
+    def _get_credentials(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            # Logged out: forget everything so a new login starts from scratch
+            self.credentials = None
+            self.service = None
+            self.file_signature = None
+            raise
+
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if signature != self.file_signature:
+            with open(self.path, 'r') as file:
+                creds_data = json.load(file)
+            # credentials.json holds the string produced by Credentials.to_json()
+            if isinstance(creds_data, str):
+                creds_data = json.loads(creds_data)
+            self.credentials = google_libraries.load().Credentials.from_authorized_user_info(creds_data)
+            self.service = None
+            self.file_signature = signature
+            self.credential_loads += 1
+
+        if self._needs_refresh():
+            self.credentials.refresh(self._request())
+            self.token_refreshes += 1
+        return self.credentials
+
+    def _request(self):
+        # google-auth sends the token request without a timeout, so one is added here
+        request = google_libraries.load().Request()
+        def timed_request(*args, **kwargs):
+            kwargs.setdefault('timeout', self.timeout)
+            return request(*args, **kwargs)
+        return timed_request
+
+    def _needs_refresh(self):
+        if not self.credentials.refresh_token:
+            return False
+        if not self.credentials.token:
+            return True
+        if self.credentials.expiry is None:
+            return False
+        # Credentials.expiry is a naive UTC datetime
+        return self.credentials.expiry - datetime.datetime.utcnow() < self.refresh_margin
+
+class UserProfileCache:
+    # Caches the Google account profile (email and display name) shared by the
+    # notification worker and the settings window. The profile is fetched once per
+    # session and, once it is older than the TTL, refreshed in the background while
+    # the cached value keeps being served
+    USERINFO_URL = 'https://www.googleapis.com/oauth2/v3/userinfo'
+
+    def __init__(self, ttl=3600, timeout=10):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.profile = None
+        self.fetched_at = 0
+        self.refreshing = False
+        self.lock = threading.Lock()
+
+    def get(self, credentials):
+        # Returns (email, name), or (None, None) if the profile is unavailable
+        with self.lock:
+            profile = self.profile
+            stale = time.monotonic() - self.fetched_at > self.ttl
+            start_refresh = profile is not None and stale and not self.refreshing
+            if start_refresh:
+                self.refreshing = True
+
+        if profile is None:
+            return self.fetch(credentials)
+        if start_refresh:
+            thread = threading.Thread(target=self.fetch, args=(credentials,))
+            thread.daemon = True
+            thread.start()
+        return profile
+
+    def fetch(self, credentials):
+        headers = {'Authorization': f'Bearer {credentials.token}'}
+        try:
+            response = google_libraries.load().requests.get(self.USERINFO_URL, headers=headers, timeout=self.timeout)
+            if response.status_code != 200:
+                print('Error:', response.status_code)
+                return self._fetch_failed()
+            data = response.json()
+        except Exception as e:
+            print(f"Error getting user info: {e}")
+            return self._fetch_failed()
+
+        profile = (data.get('email'), data.get('name'))
+        with self.lock:
+            self.profile = profile
+            self.fetched_at = time.monotonic()
+            self.refreshing = False
+        return profile
+
+    def invalidate(self):
+        # Called when the user logs in or out of a Google account
+        with self.lock:
+            self.profile = None
+            self.fetched_at = 0
+
+    def _fetch_failed(self):
+        # Keep serving the previous profile if there is one
+        with self.lock:
+            self.refreshing = False
+            return self.profile or (None, None)
+
+class OAuthRedirectHandler(http.server.BaseHTTPRequestHandler):
+    # Receives the redirect of the browser at the end of the Google sign-in
+    def do_GET(self):
+        if "code=" in self.path or "error=" in self.path:
+            self.server.authorization_response = f"http://localhost:{self.server.server_port}{self.path}"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.end_headers()
+        self.wfile.write(b"The sign-in has finished, you may close this window.")
+
+    def log_message(self, format, *args):
+        pass
+
+class AccountStatus:
+    # Resolves the Google account shown in the settings window and runs the sign-in
+    # flow on background threads, so the window never waits for the network.
+    # Callbacks run on the Tk thread. Every settings window has its own instance;
+    # every request gets a ticket, and cancel() or a newer request of the same
+    # window makes the results of its older ones be dropped. The sign-in runs its
+    # own redirect server, which stops listening soon after its ticket is dropped
+    SCOPES = [
+        'https://www.googleapis.com/auth/gmail.send',
+        'https://www.googleapis.com/auth/userinfo.email',
+        'https://www.googleapis.com/auth/userinfo.profile'
+    ]
+
+    def __init__(self, session, profile, main_thread, login_timeout=300, poll_interval=0.5):
+        self.session = session
+        self.profile = profile
+        self.main_thread = main_thread
+        self.login_timeout = login_timeout
+        self.poll_interval = poll_interval  # How soon the redirect server notices cancel()
+        self.ticket = 0
+        self.lock = threading.Lock()
+
+    def resolve(self, callback):
+        # callback(email, name), both are None when logged out or on errors
+        self._start(self._resolve, callback)
+
+    def login(self, callback):
+        # callback(signed_in) once the user finished or abandoned the browser flow
+        self._start(self._login, callback)
+
+    def logout(self):
+        self.cancel()
+        if os.path.exists(self.session.path):
+            os.remove(self.session.path)
+        self.profile.invalidate()
+
+    def cancel(self):
+        with self.lock:
+            self.ticket += 1
+
+    def is_current(self, ticket):
+        with self.lock:
+            return ticket == self.ticket
+
+    def _start(self, target, callback):
+        with self.lock:
+            self.ticket += 1
+            ticket = self.ticket
+        thread = threading.Thread(target=target, args=(ticket, callback))
+        thread.daemon = True
+        thread.start()
+
+    def _deliver(self, ticket, callback, *args):
+        # The ticket is checked again on the Tk thread, where cancel() is called
+        if self.is_current(ticket):
+            self.main_thread.call(self._finish, ticket, callback, args)
+
+    def _finish(self, ticket, callback, args):
+        if self.is_current(ticket):
+            callback(*args)
+
+    def _resolve(self, ticket, callback):
+        email = name = None
+        if os.path.exists(self.session.path):
+            try:
+                email, name = self.profile.get(self.session.get_credentials())
+            except Exception as e:
+                print(f"Error getting Google account: {e}")
+        self._deliver(ticket, callback, email, name)
+
+    def _login(self, ticket, callback):
+        os.environ['OAUTHLIB_RELAX_TOKEN_SCOPE'] = '1'
+        try:
+            flow = google_libraries.load().InstalledAppFlow.from_client_secrets_file(resource_path('your_client_secret.json'), scopes=self.SCOPES)
+            credentials = self._run_flow(ticket, flow)
+        except Exception as e:
+            print(f"Error signing in to Google account: {e}")
+            credentials = None
+        # A cancelled sign-in is not saved
+        if credentials is not None and self.is_current(ticket):
+            write_json_atomically(self.session.path, credentials.to_json())
+            self.profile.invalidate()
+        self._deliver(ticket, callback, credentials is not None)
+
+    def _run_flow(self, ticket, flow):
+        # Like InstalledAppFlow.run_local_server, but the server is closed as soon
+        # as the request is cancelled or login_timeout has passed
+        server = http.server.HTTPServer(("localhost", 0), OAuthRedirectHandler)
+        server.authorization_response = None
+        server.timeout = self.poll_interval
+        try:
+            flow.redirect_uri = f"http://localhost:{server.server_port}/"
+            authorization_url, state = flow.authorization_url()
+            webbrowser.open(authorization_url, new=1, autoraise=True)
+            deadline = time.monotonic() + self.login_timeout
+            while server.authorization_response is None:
+                if not self.is_current(ticket) or time.monotonic() > deadline:
+                    return None
+                server.handle_request()
+        finally:
+            server.server_close()
+        # oauthlib only accepts https redirects; the local one never leaves the machine
+        flow.fetch_token(authorization_response=server.authorization_response.replace("http", "https", 1))
+        return flow.credentials
+
+class TokenBucket:
+    # Token bucket rate limiter shared by the dispatch tasks
+    def __init__(self, rate, capacity):
+        self.rate = rate  # Tokens added per second
+        self.capacity = capacity  # Largest allowed burst
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        # Books the next token and returns how long to wait until it is there, 0 if
+        # it is there now. The count goes negative for tokens booked ahead, so every
+        # caller gets its own slot and sleeps once instead of polling for tokens
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0, -self.tokens / self.rate)
+
+class DateIndex:
+    # Index of event dates for time-range queries. One-off events are kept as
+    # (seconds, id, title) in a sorted list, so a query is two bisections plus the
+    # results; recurring events are kept by rule and expanded over the queried
+    # range only. Updated by LazyEventList on every change
+    def __init__(self, entries, recurring):
+        self.entries = sorted(entries)
+        self.recurring = dict(recurring)  # id -> (Recurrence, title)
+
+    def add(self, seconds, event_id, title, recurrence=None):
+        if recurrence:
+            self.recurring[event_id] = (recurrence, title)
+        else:
+            bisect.insort(self.entries, (seconds, event_id, title))
+
+    def remove(self, seconds, event_id, title):
+        if self.recurring.pop(event_id, None) is None:
+            position = bisect.bisect_left(self.entries, (seconds, event_id, title))
+            if position < len(self.entries) and self.entries[position][1] == event_id:
+                del self.entries[position]
+
+    def between(self, start, end):
+        # (date, id, title) of the events and occurrences in [start, end), by date
+        low = bisect.bisect_left(self.entries, (to_seconds(start),))
+        high = bisect.bisect_left(self.entries, (to_seconds(end),))
+        found = [(from_seconds(seconds), event_id, title) for seconds, event_id, title in self.entries[low:high]]
+        if self.recurring:
+            for event_id, (recurrence, title) in self.recurring.items():
+                found.extend((date, event_id, title) for date in recurrence.occurrences(start, end))
+            found.sort()
+        return found
+
+# Immutable copy of the list columns at one version of the list
+EventSnapshot = namedtuple("EventSnapshot", ["version", "ids", "titles", "dates", "notify_dates", "sent"])
+
+class LazyEventList:
+    # The list of events shown in the app. At startup only a summary of every event
+    # is kept, in parallel columns: ids and titles in lists, date and notify_date as
+    # seconds in arrays and the sent flags in a bytearray. The full Event with its
+    # description and emails is materialized from the store on first access and
+    # then kept, so the same object is shared with the scheduler.
+    # Changes are made under a lock and bump the version; other threads read
+    # through snapshot(), which they can iterate without holding the lock.
+    # The date index for range queries is built on the first query
+    def __init__(self, store, summaries):
+        # summaries are (id, title, date, notify_date, sent, recurrence) with dates
+        # as stored strings
+        self.store = store
+        self.ids = []
+        self.titles = []
+        self.dates = array.array("q")
+        self.notify_dates = array.array("q")
+        self.sent = bytearray()
+        self.id_set = set()
+        self.materialized = {}  # id -> Event
+        self.recurrences = {}  # id -> Recurrence of the recurring events
+        self.date_index = None
+        self.lock = threading.RLock()
+        self.version = 0
+        self.last_snapshot = None
+        for event_id, title, date, notify_date, sent, recurrence in summaries:
+            self.ids.append(event_id)
+            self.titles.append(title)
+            self.dates.append(to_seconds(parse_date(date)))
+            self.notify_dates.append(to_seconds(parse_date(notify_date)) if notify_date else NO_DATE)
+            self.sent.append(bool(sent))
+            if recurrence:
+                # SQLite keeps the rule as JSON text
+                self.recurrences[event_id] = Recurrence.deserialize(json.loads(recurrence) if isinstance(recurrence, str) else recurrence)
+        self.id_set.update(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        # Materializes every event, avoid on large lists
+        for event_id in list(self.ids):
+            yield self.get(event_id)
+
+    def __getitem__(self, index):
+        return self.get(self.ids[index])
+
+    def __setitem__(self, index, event):
+        with self.lock:
+            old_id = self.ids[index]
+            self._unindex(index)
+            if old_id != event.id:
+                self.id_set.discard(old_id)
+                self.materialized.pop(old_id, None)
+            self.ids[index] = event.id
+            self.titles[index] = event.title
+            self.dates[index] = to_seconds(event.date)
+            self.notify_dates[index] = to_seconds(event.notify_date) if event.notify_date else NO_DATE
+            self.sent[index] = bool(event.sent)
+            self._track(event)
+
+    def __delitem__(self, index):
+        with self.lock:
+            self._unindex(index)
+            event_id = self.ids.pop(index)
+            del self.titles[index]
+            del self.dates[index]
+            del self.notify_dates[index]
+            del self.sent[index]
+            self.id_set.discard(event_id)
+            self.materialized.pop(event_id, None)
+            self.version += 1
+
+    def append(self, event):
+        with self.lock:
+            self.ids.append(event.id)
+            self.titles.append(event.title)
+            self.dates.append(to_seconds(event.date))
+            self.notify_dates.append(to_seconds(event.notify_date) if event.notify_date else NO_DATE)
+            self.sent.append(bool(event.sent))
+            self._track(event)
+
+    def get(self, event_id):
+        with self.lock:
+            event = self.materialized.get(event_id)
+            if event is None:
+                event = Event.deserialize(self.store.fetch(event_id))
+                self.materialized[event_id] = event
+            return event
+
+    def find(self, event_id):
+        # Returns the event with this id, or None if it is not in the list
+        with self.lock:
+            if event_id not in self.id_set:
+                return None
+            return self.get(event_id)
+
+    def index(self, event_id):
+        # Current position of the event, raises ValueError if it was deleted
+        with self.lock:
+            return self.ids.index(event_id)
+
+    def refresh(self, events):
+        # Copies events changed in place (sent, or moved on to their next occurrence)
+        # into the columns, skipping events that were replaced or deleted meanwhile.
+        # All positions are found in one pass over the ids; returns id -> position
+        with self.lock:
+            current = {event.id: event for event in events if self.materialized.get(event.id) is event}
+            positions = {}
+            if current:
+                for index, event_id in enumerate(self.ids):
+                    if event_id in current:
+                        self[index] = current[event_id]
+                        positions[event_id] = index
+            return positions
+
+    def snapshot(self):
+        # The copy is made at most once per version
+        with self.lock:
+            if self.last_snapshot is None or self.last_snapshot.version != self.version:
+                self.last_snapshot = EventSnapshot(self.version, tuple(self.ids), tuple(self.titles),
+                                                   array.array("q", self.dates), array.array("q", self.notify_dates),
+                                                   bytes(self.sent))
+            return self.last_snapshot
+
+    def between(self, start, end):
+        # (date, id, title) of the events and occurrences in [start, end), by date,
+        # without materializing any event
+        with self.lock:
+            if self.date_index is None:
+                entries = []
+                recurring = {}
+                for index, event_id in enumerate(self.ids):
+                    if event_id in self.recurrences:
+                        recurring[event_id] = (self.recurrences[event_id], self.titles[index])
+                    else:
+                        entries.append((self.dates[index], event_id, self.titles[index]))
+                self.date_index = DateIndex(entries, recurring)
+            return self.date_index.between(start, end)
+
+    def label(self, index):
+        # Text of the list entry, available without materializing the event
+        return f"{self.titles[index]} - {format_date(from_seconds(self.dates[index]))}"
+
+    def pending_reminders(self):
+        # Only events with an unsent reminder are materialized for the scheduler,
+        # from records the store reads in one query instead of one fetch per event.
+        # Events already in memory win, they may have been marked sent since
+        pending = []
+        with self.lock:
+            for data in self.store.due_reminders():
+                event_id = data["id"]
+                if event_id not in self.id_set:
+                    continue
+                event = self.materialized.get(event_id)
+                if event is None:
+                    event = self.materialized[event_id] = Event.deserialize(data)
+                if event.notify_date and not event.sent:
+                    pending.append(event)
+        return pending
+
+    def _track(self, event):
+        # Called once the columns hold the event
+        self.id_set.add(event.id)
+        self.materialized[event.id] = event
+        if event.recurrence:
+            self.recurrences[event.id] = event.recurrence
+        if self.date_index is not None:
+            self.date_index.add(to_seconds(event.date), event.id, event.title, event.recurrence)
+        self.version += 1
+
+    def _unindex(self, index):
+        # Called before the event at index leaves the columns
+        event_id = self.ids[index]
+        self.recurrences.pop(event_id, None)
+        if self.date_index is not None:
+            self.date_index.remove(self.dates[index], event_id, self.titles[index])
+
+def write_json_atomically(path, data):
+    # Writes to a temporary file and renames it over the target, so readers and
+    # crashes only ever see the old or the new file
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+class EventStore:
+    # Append-only storage for events. Every create, update and delete is appended to
+    # events.log as it happens, so a single edit costs O(1) I/O. events.json is a
+    # snapshot in the original format that a background compaction rewrites
+    # atomically once the log has grown as large as the snapshot
+    def __init__(self, snapshot_path="events.json", log_path="events.log", min_compact=256):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.min_compact = min_compact
+        self.records = {}  # id -> serialized event, in list order
+        self.log = None
+        self.log_records = 0
+        self.compaction = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        # Returns the events of the snapshot with the log replayed on top of it,
+        # as a LazyEventList
+        needs_ids = False
+        if os.path.exists(self.snapshot_path) and os.path.getsize(self.snapshot_path) > 0:
+            with open(self.snapshot_path, "r") as f:
+                for data in json.load(f):
+                    if not data.get("id"):
+                        # Files written before events had ids
+                        data["id"] = uuid.uuid4().hex
+                        needs_ids = True
+                    self.records[data["id"]] = data
+
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "rb") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn write at the end of the log after a crash
+                        continue
+                    if record["op"] == "put":
+                        self.records[record["event"]["id"]] = record["event"]
+                    elif record["op"] == "delete":
+                        self.records.pop(record["id"], None)
+                    self.log_records += 1
+
+        self.log = open(self.log_path, "ab")
+        if needs_ids:
+            # The generated ids must be stored before the log refers to them
+            self.compact()
+        # The records are already parsed, but Events are only built on demand
+        return LazyEventList(self, [(data["id"], data["title"], data["date"], data["notify_date"], data["sent"],
+                                     data.get("recurrence")) for data in self.records.values()])
+
+    def fetch(self, event_id):
+        with self.lock:
+            return self.records[event_id]
+
+    def due_reminders(self, now=None):
+        # Same as SqliteEventStore.due_reminders; the stored dates sort as strings
+        limit = format_date(now) if now else None
+        with self.lock:
+            records = [data for data in self.records.values()
+                       if data["notify_date"] and not data["sent"] and (limit is None or data["notify_date"] <= limit)]
+        return sorted(records, key=lambda data: data["notify_date"])
+
+    def put(self, event):
+        # Records a created or updated event
+        data = event.serialize()
+        with self.lock:
+            self.records[event.id] = data
+            self._append({"op": "put", "event": data})
+
+    def delete(self, event):
+        with self.lock:
+            self.records.pop(event.id, None)
+            self._append({"op": "delete", "id": event.id})
+
+    def flush(self):
+        # Makes every change appended so far durable
+        with self.lock:
+            self.log.flush()
+            os.fsync(self.log.fileno())
+
+    def replace(self, records):
+        # Makes records the whole content of the store, called before load(). The log
+        # is removed first, as it only holds changes to the old snapshot
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        write_json_atomically(self.snapshot_path, records)
+
+    def _append(self, record):
+        self.log.write((json.dumps(record) + "\n").encode("utf-8"))
+        self.log.flush()
+        self.log_records += 1
+        if self.compaction is None and self.log_records >= max(self.min_compact, len(self.records)):
+            self.compaction = threading.Thread(target=self.compact)
+            self.compaction.daemon = True
+            self.compaction.start()
+
+    def compact(self):
+        # Serialized records are replaced, never mutated, so the copy can be written
+        # without holding the lock
+        with self.lock:
+            snapshot = list(self.records.values())
+            self.log.flush()
+            offset = self.log.tell()
+
+        write_json_atomically(self.snapshot_path, snapshot)
+
+        # Keep only the changes made while the snapshot was being written
+        with self.lock:
+            self.log.flush()
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                tail = f.read()
+            tmp_path = self.log_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(tail)
+                f.flush()
+                os.fsync(f.fileno())
+            self.log.close()
+            os.replace(tmp_path, self.log_path)
+            self.log = open(self.log_path, "ab")
+            self.log_records = tail.count(b"\n")
+            self.compaction = None
+
+    def close(self):
+        compaction = self.compaction
+        if compaction is not None:
+            compaction.join()
+        self.flush()
+        self.log.close()
+
+class SqliteEventStore:
+    # SQLite storage backend with the same interface as EventStore. Every edit is a
+    # single-row write, and the indexes on date, (sent, notify_date) and title turn
+    # the queries into index lookups. On first use, and with remigrate after the app
+    # ran on the JSON store, the events of the JSON store are migrated into the database
+    COLUMNS = "id, title, description, date, emails, notify_date, sent, recurrence"
+
+    def __init__(self, path="events.db", snapshot_path="events.json", log_path="events.log", remigrate=False):
+        self.path = path
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.remigrate = remigrate
+        self.connection = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        migrate = self.remigrate or not os.path.exists(self.path)
+        # Events are written from the Tk thread and the notification worker
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS events (
+                id TEXT PRIMARY KEY,
+                position INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                date TEXT NOT NULL,
+                emails TEXT NOT NULL,
+                notify_date TEXT,
+                sent INTEGER NOT NULL DEFAULT 0,
+                recurrence TEXT
+            );
+            CREATE INDEX IF NOT EXISTS events_position ON events (position);
+            CREATE INDEX IF NOT EXISTS events_date ON events (date);
+            CREATE INDEX IF NOT EXISTS events_notify_date ON events (sent, notify_date);
+            CREATE INDEX IF NOT EXISTS events_title ON events (title COLLATE NOCASE);
+        """)
+
+        if migrate and (os.path.exists(self.snapshot_path) or os.path.exists(self.log_path)):
+            # The JSON files are left in place as a backup. Rows from an earlier run
+            # on SQLite are replaced in the same transaction
+            json_store = EventStore(self.snapshot_path, self.log_path)
+            json_store.load()
+            json_store.close()
+            with self.lock, self.connection:
+                self.connection.execute("DELETE FROM events")
+                self.connection.executemany(
+                    f"INSERT INTO events (position, {self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(position, *self._row(data)) for position, data in enumerate(json_store.records.values())])
+            print(f"Migrated {len(json_store.records)} events to {self.path}")
+
+        # Only the columns needed for the list and the scheduler are read at startup
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT id, title, date, notify_date, sent, recurrence FROM events ORDER BY position").fetchall()
+        return LazyEventList(self, rows)
+
+    def fetch(self, event_id):
+        with self.lock:
+            row = self.connection.execute(f"SELECT {self.COLUMNS} FROM events WHERE id = ?", (event_id,)).fetchone()
+        return self._record(row)
+
+    def put(self, event):
+        # Updates keep the position of the event in the list, new events go last
+        with self.lock, self.connection:
+            self.connection.execute(f"""
+                INSERT INTO events (position, {self.COLUMNS})
+                VALUES ((SELECT COALESCE(MAX(position), -1) + 1 FROM events), ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    title = excluded.title, description = excluded.description, date = excluded.date,
+                    emails = excluded.emails, notify_date = excluded.notify_date, sent = excluded.sent,
+                    recurrence = excluded.recurrence
+            """, self._row(event.serialize()))
+
+    def delete(self, event):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM events WHERE id = ?", (event.id,))
+
+    def flush(self):
+        # Every change is committed as it is made
+        with self.lock:
+            self.connection.commit()
+
+    def due_reminders(self, now=None):
+        # Records of the events with an unsent reminder due by now (all of them
+        # without now), by notify_date, read in one go through the notify_date index
+        if now is None:
+            query, parameters = "sent = 0 AND notify_date IS NOT NULL", ()
+        else:
+            query, parameters = "sent = 0 AND notify_date <= ?", (format_date(now),)
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT {self.COLUMNS} FROM events WHERE {query} ORDER BY notify_date", parameters).fetchall()
+        return [self._record(row) for row in rows]
+
+    def events_between(self, start, end):
+        return self._ids("SELECT id FROM events WHERE date >= ? AND date < ? ORDER BY date",
+                         (format_date(start), format_date(end)))
+
+    def search_title(self, prefix):
+        # A prefix LIKE can use the NOCASE title index
+        pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return self._ids("SELECT id FROM events WHERE title LIKE ? ESCAPE '\\' ORDER BY title COLLATE NOCASE", (pattern,))
+
+    def close(self):
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
+
+    def export(self):
+        # Records of all events in list order, for switching back to the JSON store
+        connection = sqlite3.connect(self.path)
+        try:
+            rows = connection.execute(f"SELECT {self.COLUMNS} FROM events ORDER BY position").fetchall()
+        finally:
+            connection.close()
+        return [self._record(row) for row in rows]
+
+    def _ids(self, query, parameters):
+        with self.lock:
+            return [row[0] for row in self.connection.execute(query, parameters)]
+
+    def _row(self, data):
+        return (data["id"], data["title"], data["description"], data["date"],
+                json.dumps(data["emails"]), data["notify_date"], int(data["sent"]),
+                json.dumps(data["recurrence"]) if data.get("recurrence") else None)
+
+    def _record(self, row):
+        record = {
+            "id": row[0],
+            "title": row[1],
+            "description": row[2],
+            "date": row[3],
+            "emails": json.loads(row[4]),
+            "notify_date": row[5],
+            "sent": bool(row[6])
+        }
+        if row[7]:
+            record["recurrence"] = json.loads(row[7])
+        return record
+
+def create_event_store(backend="json", previous=""):
+    # The "storage" setting selects the backend. previous is the backend that held
+    # the events on the last run: after a switch the events are copied over from
+    # it, since the files of the other backend stopped being updated back then
+    if backend == "sqlite":
+        return SqliteEventStore(remigrate=previous == "json")
+    store = EventStore()
+    if previous == "sqlite" and os.path.exists("events.db"):
+        store.replace(SqliteEventStore().export())
+    return store
+
+class DeliveryJournal:
+    # Append-only journal of reminder delivery state. A "pending" record is written
+    # before a reminder is sent and a "sent" or "failed" record after it, so a crash
+    # before the next save does not lose Event.sent. Records are fsync'd in small
+    # batches and the journal is emptied once the events file holds the same state
+    def __init__(self, path="delivery_journal.log", batch_size=16):
+        self.path = path
+        self.batch_size = batch_size
+        self.unsynced = 0
+        self.delivered = {}  # id -> event sent since the last compaction
+        self.cancelled = weakref.WeakSet()  # Events edited or deleted since they were scheduled
+        self.lock = threading.RLock()
+        self.file = open(path, "a", encoding="utf-8")
+
+    def record(self, event, state):
+        # state is one of "pending", "sent", "failed" or "cancelled"
+        entry = {
+            "id": event.id,
+            "notify_date": format_date(event.notify_date) if event.notify_date else None,
+            "state": state
+        }
+        with self.lock:
+            if state == "cancelled":
+                self.cancelled.add(event)
+                self.delivered.pop(event.id, None)
+            elif event in self.cancelled:
+                # A reminder that was in flight while its event was edited or deleted
+                # must not overwrite the new version
+                if state == "sent":
+                    event.sent = True
+                return
+
+            self.file.write(json.dumps(entry) + "\n")
+            # Updated under the lock so a concurrent compaction sees both or neither
+            if state == "sent":
+                event.sent = True
+                self.delivered[event.id] = event
+            self.unsynced += 1
+            if self.unsynced >= self.batch_size:
+                self.commit()
+
+    def commit(self):
+        with self.lock:
+            if self.unsynced:
+                self.file.flush()
+                os.fsync(self.file.fileno())
+                self.unsynced = 0
+
+    def replay(self, events):
+        # Applies the journal to freshly loaded events. Only the last record of an
+        # event counts, and only if it is for the event's current notification date
+        last_states = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn write at the end of the journal after a crash
+                    continue
+                last_states[entry["id"]] = entry
+
+        recovered = []
+        for event_id, entry in last_states.items():
+            if entry["state"] != "sent":
+                continue
+            event = events.find(event_id)
+            if event and event.notify_date and not event.sent \
+                    and entry["notify_date"] == format_date(event.notify_date):
+                event.sent = True
+                # The next occurrence of a recurring event is scheduled instead
+                event.advance()
+                # Stored with the next compaction
+                self.delivered[event.id] = event
+                recovered.append(event)
+        events.refresh(recovered)
+        return len(recovered)
+
+    def compact(self, save):
+        # Passes the events delivered since the last compaction to save(), which must
+        # store them durably, and then empties the journal without letting a
+        # delivery slip in between
+        with self.lock:
+            save(list(self.delivered.values()))
+            self.file.truncate(0)
+            self.file.seek(0)
+            self.unsynced = 0
+            self.delivered.clear()
+
+    def close(self):
+        with self.lock:
+            self.commit()
+            self.file.close()
+
+class MailTransport(ABC):
+    # Interface for delivering reminder emails. send() takes a MIMEText message and
+    # returns an id for the delivered message, raising an exception on failure
+    rate = None  # Sends per second allowed by the backend, None for no limit
+    burst = 1
+
+    @abstractmethod
+    def send(self, message):
+        pass
+
+    def sender(self):
+        # Name used in the "From ... using Event Planner" line of reminders
+        return None
+
+    def ready(self):
+        # Whether reminders can be sent, used to enable the Notify checkbox
+        return True
+
+    def is_transient(self, error):
+        return isinstance(error, OSError)
+
+    def close(self):
+        # Called once no more messages will be sent
+        pass
+
+class GmailTransport(MailTransport):
+    # The Gmail API allows 250 quota units per user per second and messages.send
+    # costs 100 units, so the limiter is tuned to 2.5 sends per second
+    rate = 2.5
+    burst = 5
+    TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, session, profile):
+        self.session = session
+        self.profile = profile
+
+    def send(self, message):
+        body = {'raw': base64.urlsafe_b64encode(message.as_bytes()).decode()}
+        service = self.session.get_service()
+        request = service.users().messages().send(userId="me", body=body)
+        return request.execute(http=self.session.http())["id"]
+
+    def sender(self):
+        email, name = self.profile.get(self.session.get_credentials())
+        return name or email
+
+    def ready(self):
+        return os.path.exists(self.session.path)
+
+    def is_transient(self, error):
+        google = google_libraries.load()
+        if isinstance(error, google.HttpError):
+            return error.resp.status in self.TRANSIENT_STATUSES
+        return isinstance(error, (OSError, google.httplib2.HttpLib2Error))
+
+class SmtpTransport(MailTransport):
+    # Sends reminders through a plain SMTP relay. Every dispatch worker keeps its
+    # own connection open between messages until close()
+    def __init__(self, host="localhost", port=25, username=None, password=None, starttls=False,
+                 from_address="event-planner@localhost", sender_name=None, rate=None, burst=1, timeout=30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.from_address = from_address
+        self.sender_name = sender_name
+        self.rate = rate
+        self.burst = burst
+        self.timeout = timeout
+        self.local = threading.local()
+        self.connections = []  # Open connections of all workers, for close()
+        self.lock = threading.Lock()
+
+    def connect(self):
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            connection.starttls()
+        if self.username:
+            connection.login(self.username, self.password)
+        with self.lock:
+            self.connections.append(connection)
+        return connection
+
+    def send(self, message):
+        if 'From' not in message:
+            message['From'] = formataddr((self.sender_name or "", self.from_address))
+        if 'Message-ID' not in message:
+            message['Message-ID'] = make_msgid()
+
+        connection = getattr(self.local, 'connection', None)
+        try:
+            if connection is None:
+                raise smtplib.SMTPServerDisconnected()
+            connection.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # The relay dropped an idle connection, reconnect once
+            if connection is not None:
+                self.disconnect(connection)
+            self.local.connection = connection = self.connect()
+            connection.send_message(message)
+        return message['Message-ID']
+
+    def disconnect(self, connection):
+        with self.lock:
+            if connection in self.connections:
+                self.connections.remove(connection)
+        try:
+            connection.quit()
+        except (OSError, smtplib.SMTPException):
+            # Already dropped by the relay
+            connection.close()
+
+    def close(self):
+        with self.lock:
+            connections = list(self.connections)
+        for connection in connections:
+            self.disconnect(connection)
+
+    def sender(self):
+        return self.sender_name
+
+    def is_transient(self, error):
+        # A refused sender or recipient is refused again on every retry.
+        # SMTPRecipientsRefused is an OSError without an SMTP code
+        if isinstance(error, (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused)):
+            return False
+        if isinstance(error, smtplib.SMTPResponseException):
+            return 400 <= error.smtp_code < 500
+        return isinstance(error, (OSError, smtplib.SMTPServerDisconnected))
+
+class SinkTransport(MailTransport):
+    # Keeps delivered messages in memory and optionally appends them to an mbox
+    # file, so the notification path can be benchmarked without a mail server
+    def __init__(self, path=None, sender_name=None):
+        self.path = path
+        self.sender_name = sender_name
+        self.messages = []
+        self.lock = threading.Lock()
+
+    def send(self, message):
+        with self.lock:
+            message_id = f"sink-{len(self.messages)}"
+            self.messages.append(message)
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(f"From event-planner {time.asctime()}\n{message.as_string()}\n\n")
+        return message_id
+
+    def sender(self):
+        return self.sender_name
+
+def create_mail_transport(session, profile, path="mail_transport.json"):
+    # Gmail is used unless mail_transport.json selects another backend, e.g.
+    # {"type": "smtp", "host": "localhost", "port": 1025} or {"type": "sink", "path": "sent.mbox"}
+    if not os.path.exists(path):
+        return GmailTransport(session, profile)
+    try:
+        with open(path, "r") as f:
+            config = json.load(f)
+        transport_type = config.pop("type", "gmail")
+        if transport_type == "smtp":
+            return SmtpTransport(**config)
+        elif transport_type == "sink":
+            return SinkTransport(**config)
+    except Exception as e:
+        # A broken config must not keep the app from starting
+        print(f"Error reading {path}, using Gmail: {e}")
+    return GmailTransport(session, profile)
+
+class NotificationDispatcher:
+    # Sends a batch of reminders through a mail transport with bounded concurrency,
+    # limited to the transport's send rate. Transient failures are retried with
+    # jittered exponential backoff and every outcome is recorded in the journal.
+    # Used from the scheduler's event loop: the transports are blocking, so their
+    # calls run in a small executor while the waits between them are coroutines.
+    # After stop() no new send is started and the waits end at once, so a batch
+    # being dispatched at shutdown finishes with what is already on the wire
+    def __init__(self, transport, journal, max_workers=4, max_attempts=5, base_delay=1.0, max_delay=32.0):
+        self.transport = transport
+        self.journal = journal
+        self.limiter = TokenBucket(transport.rate, transport.burst) if transport.rate else None
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reminder-send")
+        self.last_report = None
+        self.stopping = False
+        self.loop = None
+        self.stop_requested = None  # asyncio.Event, set on the loop by stop()
+
+    async def send_all(self, messages):
+        # messages is a list of (event, MIMEText) pairs. Events that were delivered
+        # are marked as sent; the rest are left for the scheduler to retry
+        start = time.monotonic()
+        if self.stop_requested is None:
+            self.loop = asyncio.get_running_loop()
+            self.stop_requested = asyncio.Event()
+
+        # Write-ahead: every reminder is durably marked pending before it is sent
+        for event, message in messages:
+            self.journal.record(event, "pending")
+        self.journal.commit()
+
+        results = await asyncio.gather(*(self.send(message) for event, message in messages), return_exceptions=True)
+
+        latencies = []
+        failed = 0
+        for (event, message), result in zip(messages, results):
+            if isinstance(result, BaseException):
+                print(F'An error occurred: {result}')
+                self.journal.record(event, "failed")
+                failed += 1
+                continue
+
+            # Mark the event as sent
+            message_id, latency = result
+            self.journal.record(event, "sent")
+            latencies.append(latency)
+            print(F'sent message to {", ".join(event.emails)} Message Id: {message_id} ({latency:.2f} s)')
+
+        self.journal.commit()
+
+        elapsed = time.monotonic() - start
+        self.last_report = {
+            "sent": len(latencies),
+            "failed": failed,
+            "elapsed": elapsed,
+            "throughput": len(latencies) / elapsed if elapsed > 0 else 0.0,
+            "latency_avg": sum(latencies) / len(latencies) if latencies else 0.0,
+            "latency_max": max(latencies, default=0.0)
+        }
+        if messages:
+            print("Dispatched {sent} reminders ({failed} failed) in {elapsed:.2f} s, "
+                  "{throughput:.2f} messages/s, latency avg {latency_avg:.2f} s, max {latency_max:.2f} s".format(**self.last_report))
+        return self.last_report
+
+    async def send(self, message):
+        # Returns the message id and the time it took including retries
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            if self.limiter and not self.stopping:
+                wait = self.limiter.reserve()
+                if wait and not await self.pause(wait):
+                    raise RuntimeError("Not sent, the application is closing")
+            if self.stopping:
+                raise RuntimeError("Not sent, the application is closing")
+            try:
+                return await self.run_blocking(self.transport.send, message), time.monotonic() - start
+            except Exception as error:
+                attempt += 1
+                if attempt >= self.max_attempts or not self.transport.is_transient(error):
+                    raise
+                # Full jitter keeps a 9:00 batch from retrying in lockstep
+                if not await self.pause(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))):
+                    raise
+
+    async def pause(self, delay):
+        # Sleeps for a backoff or the rate limit; returns False, at once, if the
+        # dispatcher is stopped before the delay is over
+        if self.stopping:
+            return False
+        try:
+            await asyncio.wait_for(self.stop_requested.wait(), delay)
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    async def run_blocking(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    def stop(self):
+        # Thread-safe; reminders that were not sent yet are left for the next start
+        self.stopping = True
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.stop_requested.set)
+
+    def close(self, wait=True):
+        # Without wait, sends still blocked in the transport are abandoned and the
+        # transport is left open, since a worker may still be using it
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+        if wait:
+            self.transport.close()
+
+class VirtualEventList(tk.Frame):
+    # Event list that only has labels for the rows that fit on screen. The pool of
+    # labels is reused while scrolling and one context menu is shared by all rows,
+    # so the cost of rendering or updating the list does not depend on the number
+    # of events
+    def __init__(self, master, on_select, on_context_menu, font=("Segoe UI Semibold", 12)):
+        super().__init__(master, bg='white')
+        self.font = font
+        self.on_select = on_select
+        self.on_context_menu = on_context_menu
+        self.events = None
+        self.first = 0  # Index of the event shown in the top row
+        self.selected = None
+        self.colors = {
+            "background": "white",
+            "item_background": "#FCF7C9",
+            "item_foreground": "#323232",
+            "selected_background": "#323232",
+            "selected_foreground": "white"
+        }
+
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.rows_frame = tk.Frame(self, bg='white')
+        # The rows must not resize the list, the list decides how many rows fit
+        self.rows_frame.pack_propagate(False)
+        self.rows_frame.pack(side="left", expand=True, fill="both")
+        self.rows_frame.bind("<Configure>", self.on_resize)
+        self.rows_frame.bind("<Button-3>", lambda e: self.on_context_menu(e, None))
+        self.bind_scroll(self.rows_frame)
+
+        self.rows = []
+        self.add_row()
+
+        # Keyboard navigation once the list has focus
+        self.bind("<Up>", lambda e: self.move_selection(-1))
+        self.bind("<Down>", lambda e: self.move_selection(1))
+        self.bind("<Prior>", lambda e: self.move_selection(-self.visible_rows()))
+        self.bind("<Next>", lambda e: self.move_selection(self.visible_rows()))
+        self.bind("<Home>", lambda e: self.move_selection(-self.count()))
+        self.bind("<End>", lambda e: self.move_selection(self.count()))
+
+    def add_row(self):
+        position = len(self.rows)
+        label = tk.Label(self.rows_frame, font=self.font)
+        label.pack(fill=tk.X)
+        label.bind("<Button-1>", lambda e, pos=position: self.row_clicked(pos))
+        label.bind("<Button-3>", lambda e, pos=position: self.row_context_menu(e, pos))
+        self.bind_scroll(label)
+        self.rows.append(label)
+
+    def bind_scroll(self, widget):
+        widget.bind("<MouseWheel>", lambda e: self.scroll_to(self.first - 3 * (e.delta // 120)))
+        widget.bind("<Button-4>", lambda e: self.scroll_to(self.first - 3))
+        widget.bind("<Button-5>", lambda e: self.scroll_to(self.first + 3))
+
+    def count(self):
+        return len(self.events) if self.events is not None else 0
+
+    def visible_rows(self):
+        return max(1, self.rows_frame.winfo_height() // self.rows[0].winfo_reqheight())
+
+    def on_resize(self, event):
+        # One extra row for the partially visible one at the bottom
+        needed = max(1, event.height // self.rows[0].winfo_reqheight() + 1)
+        while len(self.rows) < needed:
+            self.add_row()
+        while len(self.rows) > needed:
+            self.rows.pop().destroy()
+        self.refresh()
+
+    def show(self, events):
+        self.events = events
+        self.first = 0
+        self.selected = None
+        self.refresh()
+
+    def refresh(self):
+        # Renders every visible row, O(visible rows)
+        self.first = max(0, min(self.first, self.count() - self.visible_rows()))
+        for position in range(len(self.rows)):
+            self.render_row(position)
+        self.update_scrollbar()
+
+    def render_row(self, position):
+        label = self.rows[position]
+        index = self.first + position
+        if index < self.count():
+            if index == self.selected:
+                label.config(text=self.events.label(index), bg=self.colors["selected_background"], fg=self.colors["selected_foreground"])
+            else:
+                label.config(text=self.events.label(index), bg=self.colors["item_background"], fg=self.colors["item_foreground"])
+        else:
+            label.config(text="", bg=self.colors["background"])
+
+    def refresh_row(self, index):
+        # An edited event only touches its own row
+        if self.first <= index < self.first + len(self.rows):
+            self.render_row(index - self.first)
+
+    def inserted(self, index):
+        if self.selected is not None and index <= self.selected:
+            self.selected += 1
+        self.refresh()
+
+    def deleted(self, index):
+        if self.selected == index:
+            self.selected = None
+        elif self.selected is not None and index < self.selected:
+            self.selected -= 1
+        self.refresh()
+
+    def select(self, index):
+        # Only the previously and newly selected rows are recolored, unless the list
+        # has to scroll to show the new selection
+        previous = self.selected
+        self.selected = index
+        if index is not None and not self.first <= index < self.first + self.visible_rows():
+            self.see(index)
+            self.refresh()
+            return
+        if previous is not None:
+            self.refresh_row(previous)
+        if index is not None:
+            self.refresh_row(index)
+
+    def move_selection(self, amount):
+        count = self.count()
+        if not count:
+            return
+        if self.selected is None:
+            index = 0 if amount > 0 else count - 1
+        else:
+            index = max(0, min(count - 1, self.selected + amount))
+        if index != self.selected:
+            self.on_select(index)
+
+    def see(self, index):
+        visible = self.visible_rows()
+        if index < self.first:
+            self.first = index
+        elif index >= self.first + visible:
+            self.first = index - visible + 1
+
+    def scroll_to(self, first):
+        first = max(0, min(first, self.count() - self.visible_rows()))
+        if first != self.first:
+            self.first = first
+            self.refresh()
+
+    def yview(self, *args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", amount, "units"/"pages")
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * self.count()))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self.visible_rows()
+            self.scroll_to(self.first + amount)
+
+    def update_scrollbar(self):
+        count = self.count()
+        if count:
+            self.scrollbar.set(self.first / count, min(1.0, (self.first + self.visible_rows()) / count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def set_colors(self, **colors):
+        self.colors.update(colors)
+        self.config(bg=self.colors["background"])
+        self.rows_frame.config(bg=self.colors["background"])
+        self.refresh()
+
+    def row_clicked(self, position):
+        self.focus_set()
+        index = self.first + position
+        if index < self.count():
+            self.on_select(index)
+
+    def row_context_menu(self, event, position):
+        index = self.first + position
+        self.on_context_menu(event, index if index < self.count() else None)
+
+class Settings:
+    # User settings in a single file, settings.json, read once at startup and then
+    # served from memory. Values are checked against the type of their default and
+    # the allowed choices. Changes are written atomically after a short delay, so a
+    # burst of changes (holding Ctrl+=) costs one write, and listeners let the
+    # theme, language and scaling react in place
+    DEFAULTS = {
+        "theme": "light",
+        "language": "english",
+        "scaling": 1.33,
+        "storage": "json",
+        "active_storage": ""  # Backend that holds the events, "" if not known yet
+    }
+    CHOICES = {
+        "theme": ("light", "dark"),
+        "language": ("english", "ukrainian"),
+        "storage": ("json", "sqlite"),
+        "active_storage": ("", "json", "sqlite")
+    }
+    # One file per setting was used before settings.json, they are migrated once
+    LEGACY_FILES = {
+        "theme": "current_theme.txt",
+        "language": "current_language.txt",
+        "scaling": "current_scaling.txt"
+    }
+
+    def __init__(self, path="settings.json", save_delay=0.5):
+        self.path = path
+        self.save_delay = save_delay
+        self.values = dict(self.DEFAULTS)
+        self.listeners = {}  # key -> [callback(value)]
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.timer = None
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+            except ValueError as e:
+                print(f"Error reading {self.path}: {e}")
+                data = {}
+            for key, value in data.items():
+                self._load_value(key, value)
+        else:
+            for key, legacy_path in self.LEGACY_FILES.items():
+                if os.path.exists(legacy_path):
+                    with open(legacy_path, "r") as f:
+                        self._load_value(key, f.read().strip())
+            self.save()
+
+    def coerce(self, key, value):
+        # Converts the value to the type of the default, raises ValueError if it is
+        # not allowed
+        if key not in self.DEFAULTS:
+            raise KeyError(key)
+        value = type(self.DEFAULTS[key])(value)
+        if key in self.CHOICES and value not in self.CHOICES[key]:
+            raise ValueError(f"Invalid {key}: {value!r}")
+        return value
+
+    def _load_value(self, key, value):
+        try:
+            self.values[key] = self.coerce(key, value)
+        except (KeyError, TypeError, ValueError):
+            print(f"Ignoring setting {key}={value!r}")
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def set(self, key, value):
+        value = self.coerce(key, value)
+        with self.lock:
+            if self.values[key] == value:
+                return
+            self.values[key] = value
+            if self.timer:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.save_delay, self.save)
+            self.timer.daemon = True
+            self.timer.start()
+        for callback in self.listeners.get(key, []):
+            callback(value)
+
+    def add_listener(self, key, callback):
+        self.listeners.setdefault(key, []).append(callback)
+
+    def save(self):
+        with self.lock:
+            self.timer = None
+            values = dict(self.values)
+        with self.write_lock:
+            write_json_atomically(self.path, values)
+
+    def flush(self):
+        # Writes a pending change right away, used on exit
+        with self.lock:
+            timer = self.timer
+        if timer:
+            timer.cancel()
+            self.save()
+
+class MainThreadQueue:
+    # Tk may only be used from the thread running the mainloop. Worker threads put
+    # calls on this queue and the Tk thread runs them from a root.after poll
+    def __init__(self, root, interval=100):
+        self.root = root
+        self.interval = interval
+        self.calls = queue.Queue()
+        self.root.after(self.interval, self.poll)
+
+    def call(self, function, *args):
+        # Safe to use from any thread
+        self.calls.put((function, args))
+
+    def poll(self):
+        self.drain()
+        self.root.after(self.interval, self.poll)
+
+    def drain(self):
+        # Runs the queued calls on the calling thread, which must be the Tk thread.
+        # Also used at shutdown once the worker threads have stopped
+        while True:
+            try:
+                function, args = self.calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                function(*args)
+            except Exception as e:
+                print(f"Error in a call from a worker thread: {e}")
+
+# Color palettes of the themes, widgets refer to the colors by their role
+THEMES = {
+    "light": {
+        "window": "white",
+        "surface": "white",
+        "panel": "white",
+        "entry_background": "white",
+        "entry_foreground": "black",
+        "title": "black",
+        "text": "#262626",
+        "list_background": "white",
+        "list_item_background": "#FCF7C9",
+        "list_item_foreground": "#323232",
+        "list_selected_background": "#323232",
+        "list_selected_foreground": "white",
+        "button_background": "#FCF7C9",
+        "button_foreground": "#323232",
+        "button_active_background": "#323232",
+        "button_active_foreground": "white"
+    },
+    "dark": {
+        "window": "#414141",
+        "surface": "#323232",
+        "panel": "#414141",
+        "entry_background": "#414141",
+        "entry_foreground": "white",
+        "title": "white",
+        "text": "white",
+        "list_background": "#323232",
+        "list_item_background": "#323232",
+        "list_item_foreground": "white",
+        "list_selected_background": "#FCF7C9",
+        "list_selected_foreground": "#323232",
+        "button_background": "#323232",
+        "button_foreground": "white",
+        "button_active_background": "#FCF7C9",
+        "button_active_foreground": "#323232"
+    }
+}
+
+class WidgetRegistry:
+    # Widgets kept with the options to update in place later. Widgets of closed
+    # windows are dropped whenever the registry has doubled since the last cleanup
+    # and before every update
+    def __init__(self):
+        self.entries = []  # (widget, options)
+        self.live_count = 0  # Size after the last cleanup
+
+    def add(self, widget, options):
+        self.entries.append((widget, options))
+        if len(self.entries) > 2 * self.live_count + 64:
+            self.forget_destroyed()
+
+    def forget_destroyed(self):
+        self.entries = [(widget, options) for widget, options in self.entries if widget.winfo_exists()]
+        self.live_count = len(self.entries)
+
+    def live(self):
+        self.forget_destroyed()
+        return self.entries
+
+class ThemeManager:
+    # Switches the color theme in place. ttk widgets follow the styles, classic Tk
+    # widgets are kept in a registry together with the palette roles of their
+    # color options, and anything else (text tags, the event list) is recolored
+    # by listeners
+    def __init__(self, style, theme="light", button_font=("Segoe UI Semibold", 12)):
+        self.style = style
+        self.button_font = button_font
+        self.theme = theme if theme in THEMES else "light"
+        self.widgets = WidgetRegistry()  # (widget, {option: role})
+        self.listeners = []
+        self.configure_styles()
+
+    def palette(self):
+        return THEMES[self.theme]
+
+    def register(self, widget, **options):
+        # Colors the widget with the current palette and keeps it for later switches
+        palette = self.palette()
+        widget.configure(**{option: palette[role] for option, role in options.items()})
+        self.widgets.add(widget, options)
+        return widget
+
+    def add_listener(self, callback):
+        callback(self.palette())
+        self.listeners.append(callback)
+
+    def configure_styles(self):
+        palette = self.palette()
+        self.style.configure("Yellow.TButton",
+                        foreground=palette["button_foreground"],
+                        background=palette["button_background"],
+                        font=self.button_font,
+                        padding=10,
+                        )
+        self.style.map("Yellow.TButton",
+                foreground=[("active", palette["button_active_foreground"])],
+                background=[("active", palette["button_active_background"])],
+                )
+
+    def apply(self, theme):
+        self.theme = theme if theme in THEMES else "light"
+        palette = self.palette()
+        self.configure_styles()
+        for widget, options in self.widgets.live():
+            widget.configure(**{option: palette[role] for option, role in options.items()})
+        for callback in self.listeners:
+            callback(palette)
+
+class ScaledFonts:
+    # Named fonts shared by all windows. Sizes are given in points and converted to
+    # pixels with the current scaling, so reconfiguring these few fonts resizes the
+    # text of every widget at once without recreating anything. Tk's default fonts,
+    # used by ttk widgets without a font option, are scaled the same way
+    DEFAULT_FONTS = ("TkDefaultFont", "TkTextFont", "TkFixedFont", "TkMenuFont", "TkHeadingFont",
+                     "TkCaptionFont", "TkSmallCaptionFont", "TkIconFont", "TkTooltipFont")
+
+    def __init__(self, root, scaling):
+        self.root = root
+        self.scaling = scaling
+        self.fonts = {}  # (family, points): tkfont.Font
+        self.widgets = WidgetRegistry()  # Widgets that copy their font, like the calendar
+        # Sizes of the default fonts in points, taken before the scaling changes
+        tk_scaling = float(self.root.tk.call('tk', 'scaling'))
+        self.defaults = {}  # tkfont.Font: points
+        for name in self.DEFAULT_FONTS:
+            font = tkfont.nametofont(name)
+            size = int(font.actual("size"))
+            if size:
+                self.defaults[font] = size if size > 0 else -size / tk_scaling
+        self.root.tk.call('tk', 'scaling', scaling)
+        for font, size in self.defaults.items():
+            font.configure(size=self.pixels(size))
+
+    def get(self, family, size):
+        font = self.fonts.get((family, size))
+        if font is None:
+            font = tkfont.Font(root=self.root, family=family, size=self.pixels(size))
+            self.fonts[(family, size)] = font
+        return font
+
+    def register(self, widget, family, size):
+        # Gives the widget a copy of the font, which is copied again on every change
+        widget.configure(font=self.get(family, size))
+        self.widgets.add(widget, (family, size))
+        return widget
+
+    def pixels(self, size):
+        # Negative sizes are pixels for Tk
+        return -max(1, round(size * self.scaling))
+
+    def set_scaling(self, scaling):
+        self.scaling = scaling
+        # Paddings and other distances of new widgets follow tk scaling
+        self.root.tk.call('tk', 'scaling', scaling)
+        for (family, size), font in self.fonts.items():
+            font.configure(size=self.pixels(size))
+        for font, size in self.defaults.items():
+            font.configure(size=self.pixels(size))
+        for widget, (family, size) in self.widgets.live():
+            widget.configure(font=self.get(family, size))
+
+# Message catalog of the interface. English strings are the keys, so a missing
+# translation falls back to English
+TRANSLATIONS = {
+    "english": {},
+    "ukrainian": {
+        "New event": "Нова подія",
+        "Settings": "Налаштування",
+        "Save": "Зберегти",
+        "Edit": "Редагувати",
+        "Delete": "Видалити",
+        "Creation of event": "Створення події",
+        "Editing of event": "Редагування події",
+        "Event name:": "Назва події:",
+        "Event description:": "Опис події:",
+        "Event date and time:": "Дата та час події:",
+        "Hours:": "Години:",
+        "Minutes:": "Хвилини:",
+        "List of emails (comma-separated):": "Список електронних адрес (через кому):",
+        "Notify": "Нагадати",
+        "To use notifications, please sign in to your Google Account.": "Щоб користуватися нагадуваннями, увійдіть у свій обліковий запис Google.",
+        "Save changes": "Зберегти зміни",
+        "Error": "Помилка",
+        "Incorrect data: {error}": "Невірні дані: {error}",
+        "Select an event to edit.": "Виберіть подію для редагування.",
+        "Select an event to delete.": "Виберіть подію для видалення.",
+        "Select an event to display its details.": "Виберіть подію, щоб відобразити її деталі.",
+        "Name: {title}": "Назва: {title}",
+        "Description: {description}": "Опис: {description}",
+        "Date: {date}": "Дата: {date}",
+        "Emails: {emails}": "Електронні адреси: {emails}",
+        "Notification date: {date}": "Дата нагадування: {date}",
+        "The notification was sent successfully!": "Нагадування успішно надіслано!",
+        "Notification will be sent when notification time arrives.": "Нагадування буде надіслано, коли настане час сповіщення.",
+        "The notification was not sent because an error occurred. Check your Internet connection and the correctness of the entered data. A notification will be sent as soon as the issue is resolved.": "Нагадування не надіслано через помилку. Перевірте підключення до Інтернету та правильність введених даних. Нагадування буде надіслано, щойно проблему буде вирішено.",
+        "{description}\nFrom {sender} using Event Planner.": "{description}\nВід {sender} за допомогою Event Planner.",
+        "{description}\nSent using Event Planner.": "{description}\nНадіслано за допомогою Event Planner.",
+        "Reminder that event {title} will start on {date}!": "Нагадуємо, що подія {title} розпочнеться {date}!",
+        "Google account settings:": "Налаштування облікового запису Google:",
+        "Email:": "Електронна пошта:",
+        "Username:": "Ім'я користувача:",
+        "Log out of your account": "Вийти зі свого облікового запису",
+        "Sign in to Google Account": "Увійти в обліковий запис Google",
+        "Checking Google account...": "Перевірка облікового запису Google...",
+        "Waiting for sign-in in the browser...": "Очікування входу в браузері...",
+        "Cancel": "Скасувати",
+        "Help": "Довідка",
+        "Change color theme": "Змінити кольорову тему",
+        "Change language": "Змінити мову",
+        "Repeat:": "Повторювати:",
+        "Never": "Ніколи",
+        "Daily": "Щодня",
+        "Weekly": "Щотижня",
+        "Monthly": "Щомісяця",
+        "Yearly": "Щороку",
+        "Repeats: {frequency}": "Повторюється: {frequency}",
+        "Skip this occurrence": "Пропустити це повторення"
+    }
+}
+
+class Translator:
+    # Looks up interface strings in the message catalog. Widgets are registered
+    # with the English text of their options and are relabeled in place when the
+    # language changes, anything else (menus, the details pane) is updated by
+    # listeners
+    def __init__(self, language="english"):
+        self.language = language if language in TRANSLATIONS else "english"
+        self.catalog = TRANSLATIONS[self.language]
+        self.widgets = WidgetRegistry()  # (widget, {option: English text})
+        self.listeners = []
+
+    def get(self, text):
+        return self.catalog.get(text, text)
+
+    def register(self, widget, **options):
+        # Labels the widget in the current language and keeps it for later switches
+        self.relabel(widget, options)
+        self.widgets.add(widget, options)
+        return widget
+
+    def relabel(self, widget, options):
+        for option, text in options.items():
+            if option == "title":
+                widget.title(self.get(text))
+            else:
+                widget.configure(**{option: self.get(text)})
+
+    def add_listener(self, callback):
+        callback()
+        self.listeners.append(callback)
+
+    def set_language(self, language):
+        self.language = language if language in TRANSLATIONS else "english"
+        self.catalog = TRANSLATIONS[self.language]
+        for widget, options in self.widgets.live():
+            self.relabel(widget, options)
+        for callback in self.listeners:
+            callback()
+
 
 class EventPlannerApp:
-    def __init__(self, root):
+    def __init__(self, root, startup_report=None):
+        self.startup_report = startup_report or StartupReport()
         self.load_fonts()
-        self.run_notification_loop()
+        self.startup_report.mark("load_fonts")
         
         self.root = root
         self.root.title("Event Planner")
         self.style = ttk.Style()
         self.style.theme_use("clam")
         
+        # Settings are read once, later changes reach the interface through listeners
+        self.settings = Settings()
+        
+        # Text of all windows is rescaled in place through named fonts
+        self.fonts = ScaledFonts(self.root, self.settings["scaling"])
+        self.root.geometry(self.scaled_geometry(800, 600))
+        
         # Bind the event save function to the window close event
         self.root.protocol("WM_DELETE_WINDOW", self.close_application)
         
-        # Check if theme file exists
-        if os.path.exists("current_theme.txt"):
-            with open("current_theme.txt", "r") as f:
-                self.current_theme = f.read()
-        else:
-            # Set the default theme if the file does not exist
-            self.current_theme = "light"
+        # Labels of all windows are translated in place through the message catalog
+        self.i18n = Translator(self.settings["language"])
         
-        self.style.configure("Yellow.TButton",
-                        foreground="#323232",
-                        background="#FCF7C9",
-                        font=("Segoe UI Semibold", 12),
-                        padding=10,
-                        )
-        self.style.map("Yellow.TButton",
-                foreground=[("active", "white")],
-                background=[("active", "#323232")],
-                )
+        # Colors of all windows are switched in place by the theme manager
+        self.theme = ThemeManager(self.style, self.settings["theme"], button_font=self.fonts.get("Segoe UI Semibold", 12))
+        
+        self.settings.add_listener("theme", self.change_theme)
+        self.settings.add_listener("language", self.change_language)
+        self.settings.add_listener("scaling", self.change_scaling)
+        self.theme.register(self.root, bg="window")
 
-        self.main_frame = tk.Frame(self.root, bg='white')
+        self.main_frame = self.theme.register(tk.Frame(self.root), bg="window")
         self.main_frame.pack(expand=True, fill="both")
         
-        self.toolbar_frame = tk.Frame(self.main_frame, bg='white')
+        self.toolbar_frame = self.theme.register(tk.Frame(self.main_frame), bg="window")
         self.toolbar_frame.pack(side="top", fill="x")
 
-        self.new_event_button = ttk.Button(self.toolbar_frame, text="New event", style="Yellow.TButton", command=self.create_event_window)
+        self.new_event_button = self.i18n.register(ttk.Button(self.toolbar_frame, style="Yellow.TButton", command=self.create_event_window), text="New event")
         self.new_event_button.pack(side="left")
 
-        self.settings_button = ttk.Button(self.toolbar_frame, text="Settings", style="Yellow.TButton", command=self.open_settings)
+        self.settings_button = self.i18n.register(ttk.Button(self.toolbar_frame, style="Yellow.TButton", command=self.open_settings), text="Settings")
         self.settings_button.pack(side="right")
         
-        self.save_button = ttk.Button(self.toolbar_frame, text="Save", style="Yellow.TButton", command=self.save_events_to_file)
+        self.save_button = self.i18n.register(ttk.Button(self.toolbar_frame, style="Yellow.TButton", command=self.save_events_to_file), text="Save")
         self.save_button.pack(side="right", padx=5)  # Add a small gap between the buttons
         
         ttk.Separator(self.main_frame, orient="horizontal").pack(fill="x")
@@ -116,23 +2296,25 @@ class EventPlannerApp:
         self.events_frame = ttk.Frame(self.paned_window)
         self.paned_window.add(self.events_frame, weight=1)
 
-        self.events_listbox = tk.Listbox(self.events_frame, selectmode="single")
+        self.events_listbox = VirtualEventList(self.events_frame, self.show_event_details, self.show_context_menu, font=self.fonts.get("Segoe UI Semibold", 12))
         self.events_listbox.pack(expand=True, fill="both")
-
-        self.events_listbox.bind("<Button-3>", self.show_context_menu)
-        self.events_listbox.bind("<<ListboxSelect>>", self.on_event_selected)
-
-        self.context_menu = tk.Menu(self.root, tearoff=0, bg='white')
-        self.context_menu.add_command(label="Edit", command=self.edit_event)
-        self.context_menu.add_command(label="Delete", command=self.delete_event)
+        self.theme.add_listener(self.configure_list_colors)
+
+        # One context menu shared by every row of the list
+        self.context_event_index = None
+        self.context_menu = self.theme.register(tk.Menu(self.root, tearoff=0), bg="window", fg="button_foreground")
+        self.context_menu.add_command(label="Edit", command=lambda: self.edit_event(self.context_event_index))
+        self.context_menu.add_command(label="Delete", command=lambda: self.delete_event(self.context_event_index))
+        self.context_menu.add_command(label="Skip this occurrence", command=lambda: self.skip_occurrence(self.context_event_index))
+        self.i18n.add_listener(self.translate_context_menu)
         
         ttk.Separator(self.paned_window, orient="vertical").pack(side="left", fill="y")
 
         self.details_frame = ttk.Frame(self.paned_window)
         self.paned_window.add(self.details_frame, weight=2)
 
-        self.details_text = tk.Text(self.details_frame, wrap="word", font=("Segoe UI", 12), spacing1=8, spacing2=8, spacing3=8, bg='white')
-        self.details_text.config(foreground="#262626")
+        self.details_text = tk.Text(self.details_frame, wrap="word", font=self.fonts.get("Segoe UI", 12), spacing1=8, spacing2=8, spacing3=8)
+        self.theme.register(self.details_text, bg="window", fg="text")
 
         scrollbar = tk.Scrollbar(self.details_frame, orient="vertical", command=self.details_text.yview)
         scrollbar.pack(side="right", fill="y")
@@ -140,34 +2322,54 @@ class EventPlannerApp:
         self.details_text.config(yscrollcommand=scrollbar.set)
 
         self.details_text.pack(expand=True, fill="both")
+        self.theme.add_listener(self.configure_details_tags)
+        self.i18n.add_listener(self.translate_event_details)
+
+        # Calendars of the open event windows, their busy days follow the theme
+        self.busy_calendars = WidgetRegistry()
+        self.theme.add_listener(self.configure_busy_days)
 
         self.paned_window.bind("<B1-Motion>")
+        self.startup_report.mark("widgets")
         
-        # Load events from a file if the file exists
-        if os.path.exists("events.json") and os.path.getsize("events.json") > 0:
-            with open("events.json", "r") as f:
-                events_data = json.load(f)
-            self.events = [Event.deserialize(data) for data in events_data]
-            self.update_events_listbox()
-        else:
-            self.events = []
+        # Load events from the snapshot and the change log
+        self.event_store = create_event_store(self.settings["storage"], self.settings["active_storage"])
+        # Includes parsing the dates of the list summaries
+        self.events = self.event_store.load()
+        self.startup_report.mark("event store load")
+        # Written at once: after a crash the next start must not copy the events again
+        self.settings.set("active_storage", self.settings["storage"])
+        self.settings.flush()
+        self.update_events_listbox()
+        self.startup_report.mark("update_events_listbox")
+
+        # Results of the notification worker are applied on the Tk thread
+        self.main_thread = MainThreadQueue(self.root)
+
+        # Google account profile shared by the notification worker and the settings window
+        self.user_profile = UserProfileCache()
+        self.gmail_session = GmailSession()
+        self.run_notification_loop()
+        # Journal replay, transport setup and the scheduler start; pending reminders
+        # and recurring events are the only events deserialized at startup
+        self.startup_report.mark("scheduler start")
 
         if not self.events:
             self.show_event_details(-1)
             
-        if self.current_theme == "dark":
-            self.change_theme()
-            
-        if os.path.exists("current_scaling.txt"):
-            with open("current_scaling.txt", "r") as f:
-                self.current_scaling = float(f.read())
-        else:
-            self.current_scaling = 1.33
-            
         # Bind zoom functions to keypress events
         self.root.bind("<Control-equal>", self.zoom_in)
         self.root.bind("<Control-minus>", self.zoom_out)
+        
+        self.startup_report.mark("window")
+        self.root.after(0, self.after_first_paint)
             
+    def after_first_paint(self):
+        self.root.update_idletasks()
+        self.startup_report.mark("first idle")
+        # The Google libraries are imported only now so they do not delay the window
+        google_libraries.preload()
+
     def load_fonts(self):
         font_folder = resource_path("fonts")
         if not os.path.exists(font_folder):
@@ -191,57 +2393,62 @@ class EventPlannerApp:
         return os.path.exists('credentials.json')
     
     def save_events_to_file(self):
-        with open("events.json", "w") as f:
-            json.dump([event.serialize() for event in self.events], f)
+        # Edits are logged as they happen, so saving only has to store the delivery
+        # state from the journal and make the log durable
+        self.delivery_journal.compact(self.store_delivered_events)
+
+    def store_delivered_events(self, delivered_events):
+        for event in delivered_events:
+            self.event_store.put(event)
+        self.event_store.flush()
             
     def close_application(self):
+        # Reminders being sent are finished and journaled before the journal is
+        # closed; no new sends, retries or rate limit waits are started
+        self.notification_dispatcher.stop()
+        stopped = self.notification_scheduler.stop()
+        self.notification_dispatcher.close(wait=stopped)
+        # Results of the last batches, recurring events move on to their next occurrence
+        self.main_thread.drain()
         # Saving events before closing the application
         self.save_events_to_file()
+        # A loop thread that did not exit could still write to the journal
+        if stopped:
+            self.delivery_journal.close()
+        self.event_store.close()
+        self.settings.flush()
         # Close the application
         self.root.destroy()
         
     def zoom_in(self, event):
-        response = messagebox.askquestion("Warning", "You want to zoom in on the interface. To do this, the application will be restarted. Continue?")
-        if response == 'yes':                
-            new_scaling = self.current_scaling + 0.33
-            
-            # Save the current theme to a file
-            with open("current_scaling.txt", "w") as f:
-                f.write(str(new_scaling))
-                
-            self.save_events_to_file
-                
-            # Restart application
-            python = sys.executable
-            os.execl(python, python, *sys.argv)
+        self.set_scaling(self.settings["scaling"] + 0.33)
+
     def zoom_out(self, event):
-        response = messagebox.askquestion("Warning", "You want to zoom out on the interface. To do this, the application will be restarted. Continue?")
-        if response == 'yes':
-            new_scaling = self.current_scaling - 0.33
-            
-            # Save the current theme to a file
-            with open("current_scaling.txt", "w") as f:
-                f.write(str(new_scaling))
-                
-            self.save_events_to_file
-                
-            # Restart application
-            python = sys.executable
-            os.execl(python, python, *sys.argv)
+        self.set_scaling(self.settings["scaling"] - 0.33)
+
+    def set_scaling(self, scaling):
+        self.settings.set("scaling", round(min(3.31, max(0.67, scaling)), 2))
+
+    def change_scaling(self, scaling):
+        # Rescales the interface in place, the events are not touched
+        self.fonts.set_scaling(scaling)
+        self.root.geometry(self.scaled_geometry(800, 600))
+
+    def scaled_geometry(self, width, height):
+        # Window sizes are designed for the default scaling of 1.33
+        scaling = self.settings["scaling"]
+        return f"{int(width/(1.33/scaling))}x{int(height/(1.33/scaling))}"
 
     def create_event_window(self):
         create_window = tk.Toplevel(self.root)
-        create_window.title("Creation of event")
-        create_window.geometry(f"{int(800/(1.33/self.current_scaling))}x{int(600/(1.33/self.current_scaling))}")
+        self.i18n.register(create_window, title="Creation of event")
+        create_window.geometry(self.scaled_geometry(800, 600))
         create_window.iconphoto(False, tk.PhotoImage(file=resource_path('EP_cover.png')))
 
         padx = 10
         pady = 5
 
-        if self.current_theme == 'light':
-            canvas = tk.Canvas(create_window, bg='white')
-        elif self.current_theme == 'dark':
-            canvas = tk.Canvas(create_window, bg='#323232')
+        canvas = self.theme.register(tk.Canvas(create_window), bg="surface")
         canvas.pack(side="left", fill="both", expand=True)
 
         scrollbar = tk.Scrollbar(create_window, orient="vertical", command=canvas.yview)
@@ -250,10 +2457,7 @@ class EventPlannerApp:
         canvas.configure(yscrollcommand=scrollbar.set)
         canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
 
-        if self.current_theme == 'light':
-            content_frame = tk.Frame(canvas, bg='white')
-        elif self.current_theme == 'dark':
-            content_frame = tk.Frame(canvas, bg='#323232')
+        content_frame = self.theme.register(tk.Frame(canvas), bg="surface")
         canvas.create_window((0, 0), window=content_frame, anchor="nw")
         
         def update_scroll_region(event):
@@ -268,27 +2472,18 @@ class EventPlannerApp:
         content_frame.bind("<Configure>", update_scroll_region)
         create_window.bind("<MouseWheel>", on_mousewheel)
 
-        ttk.Label(content_frame, text="Event name:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-        if self.current_theme == 'light':
-            title_entry = tk.Entry(content_frame, font=("Segoe UI Black", 16), bg='white', fg='black')
-        elif self.current_theme == 'dark':
-            title_entry = tk.Entry(content_frame, font=("Segoe UI Black", 16), bg='#414141', fg='white')
+        self.i18n.register(ttk.Label(content_frame, font=self.fonts.get("Segoe UI", 12)), text="Event name:").pack(pady=pady, padx=padx, anchor="w")
+        title_entry = self.theme.register(tk.Entry(content_frame, font=self.fonts.get("Segoe UI Black", 16)), bg="entry_background", fg="entry_foreground")
         title_entry.pack(pady=pady, padx=padx, fill="x")
 
-        ttk.Label(content_frame, text="Event description:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
+        self.i18n.register(ttk.Label(content_frame, font=self.fonts.get("Segoe UI", 12)), text="Event description:").pack(pady=pady, padx=padx, anchor="w")
 
         # Creating a frame for the text field and scrollbar
-        if self.current_theme == 'light':
-            description_frame = tk.Frame(content_frame, bg='white')
-        elif self.current_theme == 'dark':
-            description_frame = tk.Frame(content_frame, bg='#323232')
+        description_frame = self.theme.register(tk.Frame(content_frame), bg="surface")
         description_frame.pack(fill="both", expand=True)
 
         # Create a field to describe the event
-        if self.current_theme == 'light':
-            description_entry = tk.Text(description_frame, wrap="word", height=10, font=("Segoe UI", 12), bg='white', fg='black')
-        elif self.current_theme == 'dark':
-            description_entry = tk.Text(description_frame, wrap="word", height=10, font=("Segoe UI", 12), bg='#414141', fg='white')
+        description_entry = self.theme.register(tk.Text(description_frame, wrap="word", height=10, font=self.fonts.get("Segoe UI", 12)), bg="entry_background", fg="entry_foreground")
 
         # Adding a vertical scrollbar
         scrollbar = ttk.Scrollbar(description_frame, orient="vertical", command=description_entry.yview)
@@ -299,38 +2494,32 @@ class EventPlannerApp:
 
         description_entry.pack(pady=pady, padx=padx, fill="both", expand=True)
 
-        ttk.Label(content_frame, text="Event date and time:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-        if self.current_theme == 'light':
-            date_time_frame = tk.Frame(content_frame, bg='white')
-        elif self.current_theme == 'dark':
-            date_time_frame = tk.Frame(content_frame, bg='#414141')
+        self.i18n.register(ttk.Label(content_frame, font=self.fonts.get("Segoe UI", 12)), text="Event date and time:").pack(pady=pady, padx=padx, anchor="w")
+        date_time_frame = self.theme.register(tk.Frame(content_frame), bg="panel")
         date_time_frame.pack(pady=pady, padx=padx, fill="x")
 
-        calendar = Calendar(date_time_frame, selectmode="day", year=datetime.datetime.now().year, month=datetime.datetime.now().month, day=datetime.datetime.now().day)
+        calendar = self.fonts.register(Calendar(date_time_frame, selectmode="day", year=datetime.datetime.now().year, month=datetime.datetime.now().month, day=datetime.datetime.now().day), "Segoe UI", 9)
         calendar.pack(side="left", padx=(0, 10))
+        self.show_busy_days(calendar)
 
-        if self.current_theme == 'light':
-            time_frame = tk.Frame(date_time_frame, bg='white')
-        elif self.current_theme == 'dark':
-            time_frame = tk.Frame(date_time_frame, bg='#414141')
+        time_frame = self.theme.register(tk.Frame(date_time_frame), bg="panel")
         time_frame.pack(side="left")
 
         hour_var = tk.StringVar(value=str(datetime.datetime.now().hour).zfill(2))
         minute_var = tk.StringVar(value=str(datetime.datetime.now().minute).zfill(2))
 
-        ttk.Label(time_frame, text="Hours:", font=("Segoe UI", 14)).pack(anchor="w")
-        hour_spinbox = ttk.Spinbox(time_frame, from_=0, to=23, textvariable=hour_var, width=2, font=("Segoe UI", 14))
+        self.i18n.register(ttk.Label(time_frame, font=self.fonts.get("Segoe UI", 14)), text="Hours:").pack(anchor="w")
+        hour_spinbox = ttk.Spinbox(time_frame, from_=0, to=23, textvariable=hour_var, width=2, font=self.fonts.get("Segoe UI", 14))
         hour_spinbox.pack(anchor="w", pady=(0, 5))
 
-        ttk.Label(time_frame, text="Minutes:", font=("Segoe UI", 14)).pack(anchor="w")
-        minute_spinbox = ttk.Spinbox(time_frame, from_=0, to=59, textvariable=minute_var, width=2, font=("Segoe UI", 14))
+        self.i18n.register(ttk.Label(time_frame, font=self.fonts.get("Segoe UI", 14)), text="Minutes:").pack(anchor="w")
+        minute_spinbox = ttk.Spinbox(time_frame, from_=0, to=59, textvariable=minute_var, width=2, font=self.fonts.get("Segoe UI", 14))
         minute_spinbox.pack(anchor="w")
 
-        ttk.Label(content_frame, text="List of emails (comma-separated):", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-        if self.current_theme == 'light':
-            emails_entry = tk.Entry(content_frame, font=("Segoe UI Semibold", 12), bg='white', fg='black')
-        elif self.current_theme == 'dark':
-            emails_entry = tk.Entry(content_frame, font=("Segoe UI Semibold", 12), bg='#414141', fg='white')
+        repeat_var = self.create_repeat_widgets(content_frame, padx, pady)
+
+        self.i18n.register(ttk.Label(content_frame, font=self.fonts.get("Segoe UI", 12)), text="List of emails (comma-separated):").pack(pady=pady, padx=padx, anchor="w")
+        emails_entry = self.theme.register(tk.Entry(content_frame, font=self.fonts.get("Segoe UI Semibold", 12)), bg="entry_background", fg="entry_foreground")
         emails_entry.pack(pady=pady, padx=padx, fill="x")
 
         notify_var = tk.BooleanVar(value=False)
@@ -343,17 +2532,14 @@ class EventPlannerApp:
                 
             update_scroll_region(None)
 
-        notify_checkbox = ttk.Checkbutton(content_frame, text="Notify", variable=notify_var, command=toggle_notify)
+        notify_checkbox = self.i18n.register(ttk.Checkbutton(content_frame, variable=notify_var, command=toggle_notify), text="Notify")
         notify_checkbox.pack(pady=pady, padx=padx, anchor="w")
 
-        if self.current_theme == 'light':
-            notify_frame = tk.Frame(content_frame, bg='white')
-        elif self.current_theme == 'dark':
-            notify_frame = tk.Frame(content_frame, bg='#414141')
+        notify_frame = self.theme.register(tk.Frame(content_frame), bg="panel")
         notify_frame.pack(pady=pady, padx=padx, fill="x", anchor="w")
 
-        # Check if the user is signed in to a Google account
-        if self.is_google_account_authenticated():
+        # Check if reminders can be sent (for Gmail, if the user is signed in to a Google account)
+        if self.mail_transport.ready():
             # If you are logged in, then we allow the use of notifications
             notify_checkbox.config(state="normal")
         else:
@@ -361,27 +2547,25 @@ class EventPlannerApp:
             notify_checkbox.config(state="disabled")
 
             # Create a label indicating that you need to sign in to your Google account
-            notify_label = ttk.Label(content_frame, text="To use notifications, please sign in to your Google Account.", foreground="red")
+            notify_label = self.i18n.register(ttk.Label(content_frame, foreground="red"), text="To use notifications, please sign in to your Google Account.")
             notify_label.pack(pady=(0, 10), padx=padx, anchor="w")
 
-        notify_calendar = Calendar(notify_frame, selectmode="day", year=datetime.datetime.now().year, month=datetime.datetime.now().month, day=datetime.datetime.now().day)
+        notify_calendar = self.fonts.register(Calendar(notify_frame, selectmode="day", year=datetime.datetime.now().year, month=datetime.datetime.now().month, day=datetime.datetime.now().day), "Segoe UI", 9)
         notify_calendar.pack(side="left", padx=(0, 10))
+        self.show_busy_days(notify_calendar)
 
-        if self.current_theme == 'light':
-            notify_time_frame = tk.Frame(notify_frame, bg='white')
-        elif self.current_theme == 'dark':
-            notify_time_frame = tk.Frame(notify_frame, bg='#414141')
+        notify_time_frame = self.theme.register(tk.Frame(notify_frame), bg="panel")
         notify_time_frame.pack(side="left")
 
         notify_hour_var = tk.StringVar(value=str(datetime.datetime.now().hour).zfill(2))
         notify_minute_var = tk.StringVar(value=str(datetime.datetime.now().minute).zfill(2))
 
-        ttk.Label(notify_time_frame, text="Hours:", font=("Segoe UI", 14)).pack(anchor="w")
-        notify_hour_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=23, textvariable=notify_hour_var, width=2, font=("Segoe UI", 14))
+        self.i18n.register(ttk.Label(notify_time_frame, font=self.fonts.get("Segoe UI", 14)), text="Hours:").pack(anchor="w")
+        notify_hour_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=23, textvariable=notify_hour_var, width=2, font=self.fonts.get("Segoe UI", 14))
         notify_hour_spinbox.pack(anchor="w", pady=(0, 5))
 
-        ttk.Label(notify_time_frame, text="Minutes:", font=("Segoe UI", 14)).pack(anchor="w")
-        notify_minute_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=59, textvariable=notify_minute_var, width=2, font=("Segoe UI", 14))
+        self.i18n.register(ttk.Label(notify_time_frame, font=self.fonts.get("Segoe UI", 14)), text="Minutes:").pack(anchor="w")
+        notify_minute_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=59, textvariable=notify_minute_var, width=2, font=self.fonts.get("Segoe UI", 14))
         notify_minute_spinbox.pack(anchor="w")
 
         toggle_notify()  # Hide/show notification widgets depending on initial state
@@ -404,142 +2588,132 @@ class EventPlannerApp:
 
                 new_event = Event(title, description, date, emails)
                 new_event.notify_date = notify_date  # Save the notification date
+                if repeat_var.get() != "never":
+                    new_event.recurrence = Recurrence(repeat_var.get(), date)
 
                 self.events.append(new_event)
+                self.event_store.put(new_event)
+                self.notification_scheduler.schedule(new_event)
 
-                self.update_events_listbox()
+                self.events_listbox.inserted(len(self.events) - 1)
 
                 create_window.destroy()
 
                 self.show_event_details(len(self.events) - 1)
             except ValueError as e:
-                messagebox.showerror("Error", f"Incorrect data: {e}")
+                messagebox.showerror(self.i18n.get("Error"), self.i18n.get("Incorrect data: {error}").format(error=e))
 
-        save_button = ttk.Button(content_frame, style="Yellow.TButton", text="Save", command=save_event)
+        save_button = self.i18n.register(ttk.Button(content_frame, style="Yellow.TButton", command=save_event), text="Save")
         save_button.pack(pady=10, padx=padx, side="right")
   
-    def create_event_widgets(self, index, formatted_event):
-        label = tk.Label(self.events_listbox, text=formatted_event, bg='#FCF7C9', fg='#323232', font=("Segoe UI Semibold", 12))
-        label.pack(fill=tk.X)
-
-        label.bind("<Button-1>", lambda e, idx=index: self.show_event_details(idx))
-        
-        context_menu = tk.Menu(self.root, tearoff=0)
-        context_menu.add_command(label="Edit", command=lambda idx=index: self.edit_event(idx))
-        context_menu.add_command(label="Delete", command=lambda idx=index: self.delete_event(idx))
-        label.bind("<Button-3>", lambda e, menu=context_menu: menu.post(e.x_root, e.y_root))
+    def show_busy_days(self, calendar):
+        # Marks the days with events in the month shown by the calendar. Only that
+        # month is looked up in the date index, again whenever the month changes
+        def mark_month(event=None):
+            calendar.calevent_remove("all")
+            month, year = calendar.get_displayed_month()
+            # The grid also shows the last days of the previous and the first days of the next month
+            start = datetime.datetime(year, month, 1) - datetime.timedelta(days=7)
+            end = start + datetime.timedelta(days=52)
+            # One calendar event per day, with the titles of all events on that day
+            days = {}
+            for date, event_id, title in self.events.between(start, end):
+                days.setdefault(date.date(), []).append(title)
+            for day, titles in days.items():
+                calendar.calevent_create(day, "\n".join(titles), "busy")
+
+        calendar.bind("<<CalendarMonthChanged>>", mark_month)
+        mark_month()
+        self.busy_calendars.add(calendar, None)
+        self.configure_busy_days(self.theme.palette())
+
+    def configure_busy_days(self, palette):
+        for calendar, options in self.busy_calendars.live():
+            calendar.tag_config("busy", background=palette["list_selected_background"], foreground=palette["list_selected_foreground"])
+
+    def create_repeat_widgets(self, content_frame, padx, pady, frequency="never"):
+        # Radio buttons for the recurrence of an event, returns the variable holding the frequency
+        self.i18n.register(ttk.Label(content_frame, font=self.fonts.get("Segoe UI", 12)), text="Repeat:").pack(pady=pady, padx=padx, anchor="w")
+        repeat_frame = self.theme.register(tk.Frame(content_frame), bg="surface")
+        repeat_frame.pack(pady=pady, padx=padx, anchor="w")
+        repeat_var = tk.StringVar(value=frequency)
+        for value in ("never",) + Recurrence.FREQUENCIES:
+            self.i18n.register(ttk.Radiobutton(repeat_frame, variable=repeat_var, value=value), text=value.capitalize()).pack(side="left", padx=(0, 10))
+        return repeat_var
 
     def update_events_listbox(self):
-        for widget in self.events_listbox.winfo_children():
-            widget.destroy()
-
-        for index, event in enumerate(self.events):
-            formatted_event = f"{event.title} - {event.date.strftime('%Y-%m-%d %H:%M:%S')}"
-            self.create_event_widgets(index, formatted_event)
+        # Only the visible rows are rendered; their labels come from the event
+        # summaries, so events are not materialized here
+        self.events_listbox.show(self.events)
+
+    def configure_details_tags(self, palette):
+        # Tag styles only depend on the theme, so they are configured once per theme
+        # instead of on every selection
+        self.details_text.tag_configure("date", font=self.fonts.get("Segoe UI Semibold", 14), foreground="red")
+        self.details_text.tag_configure("title", font=self.fonts.get("Segoe UI Black", 16), foreground=palette["title"])
+        self.details_text.tag_configure("description", font=self.fonts.get("Segoe UI", 12), foreground=palette["text"])
+        self.details_text.tag_configure("emails", font=self.fonts.get("Segoe UI Semibold", 12), foreground=palette["text"])
+        self.details_text.tag_configure("status_not_sent_ok", font=self.fonts.get("Segoe UI Black", 10), foreground=palette["title"])
+        self.details_text.tag_configure("status_sent", font=self.fonts.get("Segoe UI Black", 10), foreground="green")
+        self.details_text.tag_configure("status_not_sent_bad", font=self.fonts.get("Segoe UI Black", 10), foreground="red")
 
     def show_event_details(self, event_index):
         if event_index is not None and 0 <= event_index < len(self.events):
             selected_event = self.events[event_index]
             
-            self.details_text.tag_configure("date", font=("Segoe UI Semibold", 14), foreground="red")
-            if self.current_theme == 'light':
-                self.details_text.tag_configure("title", font=("Segoe UI Black", 16), foreground="black")
-                self.details_text.tag_configure("description", font=("Segoe UI", 12), foreground="#262626")
-                self.details_text.tag_configure("emails", font=("Segoe UI Semibold", 12), foreground="#262626")
-                self.details_text.tag_configure("status_not_sent_ok", font=("Segoe UI Black", 10), foreground="black")
-            elif self.current_theme == 'dark':
-                self.details_text.tag_configure("title", font=("Segoe UI Black", 16), foreground="white")
-                self.details_text.tag_configure("description", font=("Segoe UI", 12), foreground="white")
-                self.details_text.tag_configure("emails", font=("Segoe UI Semibold", 12), foreground="white")
-                self.details_text.tag_configure("status_not_sent_ok", font=("Segoe UI Black", 10), foreground="white")
-            
-            self.details_text.tag_configure("status_sent", font=("Segoe UI Black", 10), foreground="green")
-            self.details_text.tag_configure("status_not_sent_bad", font=("Segoe UI Black", 10), foreground="red")
-
+            # Every line is inserted together with its tag, so tag ranges are known
+            # without searching the text
             details_text_lines = [
-                f"Name: {selected_event.title}",
-                f"Description: {selected_event.description}",
-                f"Date: {selected_event.date.strftime('%Y-%m-%d %H:%M:%S')}",
-                f"Emails: {', '.join(selected_event.emails)}"
+                (self.i18n.get("Name: {title}").format(title=selected_event.title), "title"),
+                (self.i18n.get("Description: {description}").format(description=selected_event.description), "description"),
+                (self.i18n.get("Date: {date}").format(date=format_date(selected_event.date)), "date"),
+                (self.i18n.get("Emails: {emails}").format(emails=', '.join(selected_event.emails)), "emails")
             ]
+
+            if selected_event.recurrence:
+                details_text_lines.append((self.i18n.get("Repeats: {frequency}").format(frequency=self.i18n.get(selected_event.recurrence.frequency.capitalize())), "emails"))
             
             if selected_event.notify_date:  # Check if notification date exists
-                details_text_lines.append(f"Notification date: {selected_event.notify_date.strftime('%Y-%m-%d %H:%M:%S')}")
+                details_text_lines.append((self.i18n.get("Notification date: {date}").format(date=format_date(selected_event.notify_date)), "date"))
                 
                 # Checking the notification sending status
                 if selected_event.sent:
-                    details_text_lines.append("The notification was sent successfully!")
+                    details_text_lines.append((self.i18n.get("The notification was sent successfully!"), "status_sent"))
                 else:
                     if datetime.datetime.now() < selected_event.notify_date + datetime.timedelta(minutes=1):
-                        details_text_lines.append("Notification will be sent when notification time arrives.")
+                        details_text_lines.append((self.i18n.get("Notification will be sent when notification time arrives."), "status_not_sent_ok"))
                     else:
-                        details_text_lines.append("The notification was not sent because an error occurred. "
-                                                "Check your Internet connection and the correctness of the entered data. "
-                                                "A notification will be sent as soon as the issue is resolved.")
+                        details_text_lines.append((self.i18n.get("The notification was not sent because an error occurred. "
+                                                                 "Check your Internet connection and the correctness of the entered data. "
+                                                                 "A notification will be sent as soon as the issue is resolved."), "status_not_sent_bad"))
 
             self.details_text.config(state="normal")
             self.details_text.delete("1.0", tk.END)
 
-            for line in details_text_lines:
-                self.details_text.insert(tk.END, line + "\n")
-
-                if line.startswith("Name:"):
-                    start_index = self.details_text.search("Name:", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("title", start_index, end_index)
-                elif line.startswith("Date:"):
-                    start_index = self.details_text.search("Date:", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("date", start_index, end_index)
-                elif line.startswith("Emails:"):
-                    start_index = self.details_text.search("Emails:", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("emails", start_index, end_index)
-                elif line.startswith("Notification date:"):  # Check if a string matches the notification date
-                    start_index = self.details_text.search("Notification date:", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("date", start_index, end_index)
-                    
-                elif line.startswith("The notification was sent"):
-                    start_index = self.details_text.search("The notification was sent", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("status_sent", start_index, end_index)
-                elif line.startswith("Notification will"):
-                    start_index = self.details_text.search("Notification will", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("status_not_sent_ok", start_index, end_index)
-                elif line.startswith("The notification was not"):
-                    start_index = self.details_text.search("The notification was not", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("status_not_sent_bad", start_index, end_index)
-                    
-                else:
-                    start_index = self.details_text.search(line, "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("description", start_index, end_index)
+            for line, tag in details_text_lines:
+                self.details_text.insert(tk.END, line, tag, "\n")
 
             self.details_text.config(state="disabled")
 
-            for widget in self.events_listbox.winfo_children():
-                if self.current_theme == 'light':
-                    widget.config(bg='#FCF7C9', fg='#323232')
-                elif self.current_theme == 'dark':
-                    widget.config(bg='#323232', fg='white')
-            if self.current_theme == 'light':
-                self.events_listbox.winfo_children()[event_index].config(bg='#323232', fg='white')
-            elif self.current_theme == 'dark':
-                self.events_listbox.winfo_children()[event_index].config(bg='#FCF7C9', fg='#323232')
+            self.events_listbox.select(event_index)
         else:
+            self.events_listbox.select(None)
             self.details_text.config(state="normal")
             self.details_text.delete("1.0", tk.END)
-            self.details_text.insert(tk.END, "Select an event to display its details.")
+            self.details_text.insert(tk.END, self.i18n.get("Select an event to display its details."))
             self.details_text.tag_add("center", "1.0", "end")
             self.details_text.config(state="disabled")
-            
-    def on_event_selected(self, event):
-        selected_index = self.events_listbox.curselection()
-        if selected_index:
-            self.show_event_details(selected_index[0])
+
+    def translate_event_details(self):
+        # Renders the details pane again in the new language, if anything is shown
+        if self.details_text.get("1.0", "end-1c"):
+            selected = self.events_listbox.selected
+            self.show_event_details(selected if selected is not None else -1)
+
+    def translate_context_menu(self):
+        self.context_menu.entryconfigure(0, label=self.i18n.get("Edit"))
+        self.context_menu.entryconfigure(1, label=self.i18n.get("Delete"))
+        self.context_menu.entryconfigure(2, label=self.i18n.get("Skip this occurrence"))
             
     def edit_event(self, event_index=None):
         if event_index is not None and 0 <= event_index < len(self.events):
@@ -547,18 +2721,15 @@ class EventPlannerApp:
 
             # Creating an editing window
             edit_window = tk.Toplevel(self.root)
-            edit_window.title("Editing of event")
-            edit_window.geometry(f"{int(800/(1.33/self.current_scaling))}x{int(600/(1.33/self.current_scaling))}")
+            self.i18n.register(edit_window, title="Editing of event")
+            edit_window.geometry(self.scaled_geometry(800, 600))
             edit_window.iconphoto(False, tk.PhotoImage(file=resource_path('EP_cover.png')))
 
             # Form elements for editing
             padx = 10
             pady = 5
 
-            if self.current_theme == 'light':
-                canvas = tk.Canvas(edit_window, bg='white')
-            elif self.current_theme == 'dark':
-                canvas = tk.Canvas(edit_window, bg='#323232')
+            canvas = self.theme.register(tk.Canvas(edit_window), bg="surface")
             canvas.pack(side="left", fill="both", expand=True)
 
             scrollbar = tk.Scrollbar(edit_window, orient="vertical", command=canvas.yview)
@@ -567,10 +2738,7 @@ class EventPlannerApp:
             canvas.configure(yscrollcommand=scrollbar.set)
             canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
 
-            if self.current_theme == 'light':
-                content_frame = tk.Frame(canvas, bg='white')
-            elif self.current_theme == 'dark':
-                content_frame = tk.Frame(canvas, bg='#323232')
+            content_frame = self.theme.register(tk.Frame(canvas), bg="surface")
             canvas.create_window((0, 0), window=content_frame, anchor="nw")
 
             def update_scroll_region(event):
@@ -585,28 +2753,19 @@ class EventPlannerApp:
             content_frame.bind("<Configure>", update_scroll_region)
             edit_window.bind("<MouseWheel>", on_mousewheel)
 
-            ttk.Label(content_frame, text="Event name:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-            if self.current_theme == 'light':
-                title_entry = tk.Entry(content_frame, font=("Segoe UI Black", 16), bg='white', fg='black')
-            elif self.current_theme == 'dark':
-                title_entry = tk.Entry(content_frame, font=("Segoe UI Black", 16), bg='#414141', fg='white')
+            self.i18n.register(ttk.Label(content_frame, font=self.fonts.get("Segoe UI", 12)), text="Event name:").pack(pady=pady, padx=padx, anchor="w")
+            title_entry = self.theme.register(tk.Entry(content_frame, font=self.fonts.get("Segoe UI Black", 16)), bg="entry_background", fg="entry_foreground")
             title_entry.insert(0, selected_event.title)
             title_entry.pack(pady=pady, padx=padx, fill="x")
 
-            ttk.Label(content_frame, text="Event description:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
+            self.i18n.register(ttk.Label(content_frame, font=self.fonts.get("Segoe UI", 12)), text="Event description:").pack(pady=pady, padx=padx, anchor="w")
 
             # Creating a frame for the text field and scrollbar
-            if self.current_theme == 'light':
-                description_frame = tk.Frame(content_frame, bg='white')
-            elif self.current_theme == 'dark':
-                description_frame = tk.Frame(content_frame, bg='#323232')
+            description_frame = self.theme.register(tk.Frame(content_frame), bg="surface")
             description_frame.pack(fill="both", expand=True)
 
             # Create a field to describe the event
-            if self.current_theme == 'light':
-                description_entry = tk.Text(description_frame, wrap="word", height=10, font=("Segoe UI", 12), bg='white', fg='black')
-            elif self.current_theme == 'dark':
-                description_entry = tk.Text(description_frame, wrap="word", height=10, font=("Segoe UI", 12), bg='#414141', fg='white')
+            description_entry = self.theme.register(tk.Text(description_frame, wrap="word", height=10, font=self.fonts.get("Segoe UI", 12)), bg="entry_background", fg="entry_foreground")
             description_entry.insert("1.0", selected_event.description)
 
             # Adding a vertical scrollbar
@@ -619,38 +2778,32 @@ class EventPlannerApp:
             description_entry.pack(pady=pady, padx=padx, fill="both", expand=True)
 
 
-            ttk.Label(content_frame, text="Event date and time:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-            if self.current_theme == 'light':
-                date_time_frame = tk.Frame(content_frame, bg='white')
-            elif self.current_theme == 'dark':
-                date_time_frame = tk.Frame(content_frame, bg='#414141')
+            self.i18n.register(ttk.Label(content_frame, font=self.fonts.get("Segoe UI", 12)), text="Event date and time:").pack(pady=pady, padx=padx, anchor="w")
+            date_time_frame = self.theme.register(tk.Frame(content_frame), bg="panel")
             date_time_frame.pack(pady=pady, padx=padx, fill="x")
 
-            calendar = Calendar(date_time_frame, selectmode="day", year=selected_event.date.year, month=selected_event.date.month, day=selected_event.date.day)
+            calendar = self.fonts.register(Calendar(date_time_frame, selectmode="day", year=selected_event.date.year, month=selected_event.date.month, day=selected_event.date.day), "Segoe UI", 9)
             calendar.pack(side="left", padx=(0, 10))
+            self.show_busy_days(calendar)
 
-            if self.current_theme == 'light':
-                time_frame = tk.Frame(date_time_frame, bg='white')
-            elif self.current_theme == 'dark':
-                time_frame = tk.Frame(date_time_frame, bg='#414141')
+            time_frame = self.theme.register(tk.Frame(date_time_frame), bg="panel")
             time_frame.pack(side="left")
 
             hour_var = tk.StringVar(value=str(selected_event.date.hour).zfill(2))
             minute_var = tk.StringVar(value=str(selected_event.date.minute).zfill(2))
 
-            ttk.Label(time_frame, text="Hours:", font=("Segoe UI", 14)).pack(anchor="w")
-            hour_spinbox = ttk.Spinbox(time_frame, from_=0, to=23, textvariable=hour_var, width=2, font=("Segoe UI", 14))
+            self.i18n.register(ttk.Label(time_frame, font=self.fonts.get("Segoe UI", 14)), text="Hours:").pack(anchor="w")
+            hour_spinbox = ttk.Spinbox(time_frame, from_=0, to=23, textvariable=hour_var, width=2, font=self.fonts.get("Segoe UI", 14))
             hour_spinbox.pack(anchor="w", pady=(0, 5))
 
-            ttk.Label(time_frame, text="Minutes:", font=("Segoe UI", 14)).pack(anchor="w")
-            minute_spinbox = ttk.Spinbox(time_frame, from_=0, to=59, textvariable=minute_var, width=2, font=("Segoe UI", 14))
+            self.i18n.register(ttk.Label(time_frame, font=self.fonts.get("Segoe UI", 14)), text="Minutes:").pack(anchor="w")
+            minute_spinbox = ttk.Spinbox(time_frame, from_=0, to=59, textvariable=minute_var, width=2, font=self.fonts.get("Segoe UI", 14))
             minute_spinbox.pack(anchor="w")
 
-            ttk.Label(content_frame, text="List of emails (comma-separated):", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-            if self.current_theme == 'light':
-                emails_entry = tk.Entry(content_frame, font=("Segoe UI Semibold", 12), bg='white', fg='black')
-            elif self.current_theme == 'dark':
-                emails_entry = tk.Entry(content_frame, font=("Segoe UI Semibold", 12), bg='#414141', fg='white')
+            repeat_var = self.create_repeat_widgets(content_frame, padx, pady, selected_event.recurrence.frequency if selected_event.recurrence else "never")
+
+            self.i18n.register(ttk.Label(content_frame, font=self.fonts.get("Segoe UI", 12)), text="List of emails (comma-separated):").pack(pady=pady, padx=padx, anchor="w")
+            emails_entry = self.theme.register(tk.Entry(content_frame, font=self.fonts.get("Segoe UI Semibold", 12)), bg="entry_background", fg="entry_foreground")
             emails_entry.insert(0, ', '.join(selected_event.emails))
             emails_entry.pack(pady=pady, padx=padx, fill="x")
             
@@ -664,17 +2817,14 @@ class EventPlannerApp:
 
                 update_scroll_region(None)
 
-            notify_checkbox = ttk.Checkbutton(content_frame, text="Notify", variable=notify_var, command=toggle_notify)
+            notify_checkbox = self.i18n.register(ttk.Checkbutton(content_frame, variable=notify_var, command=toggle_notify), text="Notify")
             notify_checkbox.pack(pady=pady, padx=padx, anchor="w")
 
-            if self.current_theme == 'light':
-                notify_frame = tk.Frame(content_frame, bg='white')
-            elif self.current_theme == 'dark':
-                notify_frame = tk.Frame(content_frame, bg='#414141')
+            notify_frame = self.theme.register(tk.Frame(content_frame), bg="panel")
             notify_frame.pack(pady=pady, padx=padx, fill="x", anchor="w")
 
-            # Check if the user is signed in to a Google account
-            if self.is_google_account_authenticated():
+            # Check if reminders can be sent (for Gmail, if the user is signed in to a Google account)
+            if self.mail_transport.ready():
                 # If you are logged in, then we allow the use of notifications
                 notify_checkbox.config(state="normal")
             else:
@@ -682,30 +2832,28 @@ class EventPlannerApp:
                 notify_checkbox.config(state="disabled")
 
                 # Create a label indicating that you need to sign in to your Google account
-                notify_label = ttk.Label(content_frame, text="To use notifications, please sign in to your Google Account.", foreground="red")
+                notify_label = self.i18n.register(ttk.Label(content_frame, foreground="red"), text="To use notifications, please sign in to your Google Account.")
                 notify_label.pack(pady=(0, 10), padx=padx, anchor="w")
 
             if selected_event.notify_date:
-                notify_calendar = Calendar(notify_frame, selectmode="day", year=selected_event.notify_date.year, month=selected_event.notify_date.month, day=selected_event.notify_date.day)
+                notify_calendar = self.fonts.register(Calendar(notify_frame, selectmode="day", year=selected_event.notify_date.year, month=selected_event.notify_date.month, day=selected_event.notify_date.day), "Segoe UI", 9)
             else:
-                notify_calendar = Calendar(notify_frame, selectmode="day", year=datetime.datetime.now().year, month=datetime.datetime.now().month, day=datetime.datetime.now().day)
+                notify_calendar = self.fonts.register(Calendar(notify_frame, selectmode="day", year=datetime.datetime.now().year, month=datetime.datetime.now().month, day=datetime.datetime.now().day), "Segoe UI", 9)
             notify_calendar.pack(side="left", padx=(0, 10))
+            self.show_busy_days(notify_calendar)
 
-            if self.current_theme == 'light':
-                notify_time_frame = tk.Frame(notify_frame, bg='white')
-            elif self.current_theme == 'dark':
-                notify_time_frame = tk.Frame(notify_frame, bg='#414141')
+            notify_time_frame = self.theme.register(tk.Frame(notify_frame), bg="panel")
             notify_time_frame.pack(side="left")
 
             notify_hour_var = tk.StringVar(value=str(selected_event.notify_date.hour).zfill(2) if selected_event.notify_date else str(datetime.datetime.now().hour).zfill(2))
             notify_minute_var = tk.StringVar(value=str(selected_event.notify_date.minute).zfill(2) if selected_event.notify_date else str(datetime.datetime.now().minute).zfill(2))
 
-            ttk.Label(notify_time_frame, text="Hours:", font=("Segoe UI", 14)).pack(anchor="w")
-            notify_hour_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=23, textvariable=notify_hour_var, width=2, font=("Segoe UI", 14))
+            self.i18n.register(ttk.Label(notify_time_frame, font=self.fonts.get("Segoe UI", 14)), text="Hours:").pack(anchor="w")
+            notify_hour_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=23, textvariable=notify_hour_var, width=2, font=self.fonts.get("Segoe UI", 14))
             notify_hour_spinbox.pack(anchor="w", pady=(0, 5))
 
-            ttk.Label(notify_time_frame, text="Minutes:", font=("Segoe UI", 14)).pack(anchor="w")
-            notify_minute_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=59, textvariable=notify_minute_var, width=2, font=("Segoe UI", 14))
+            self.i18n.register(ttk.Label(notify_time_frame, font=self.fonts.get("Segoe UI", 14)), text="Minutes:").pack(anchor="w")
+            notify_minute_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=59, textvariable=notify_minute_var, width=2, font=self.fonts.get("Segoe UI", 14))
             notify_minute_spinbox.pack(anchor="w")
 
             toggle_notify()  # Hide/show notification widgets depending on the initial state of the checkbox
@@ -716,7 +2864,7 @@ class EventPlannerApp:
                     edited_date = datetime.datetime.strptime(edited_date_str, "%m/%d/%y")
                     edited_date = edited_date.replace(hour=int(hour_var.get()), minute=int(minute_var.get()))
                     edited_emails = [email.strip() for email in emails_entry.get().split(',')]
-                    edited_event = Event(title_entry.get(), description_entry.get("1.0", tk.END).strip(), edited_date, edited_emails)
+                    edited_event = Event(title_entry.get(), description_entry.get("1.0", tk.END).strip(), edited_date, edited_emails, id=selected_event.id)
 
                     edited_event.notify_date = None  # Set the notification date to None by default
 
@@ -726,291 +2874,274 @@ class EventPlannerApp:
                         notify_minute = int(notify_minute_var.get())
                         edited_event.notify_date = datetime.datetime.strptime(notify_selected_date, '%m/%d/%y').replace(hour=notify_hour, minute=notify_minute)
 
-                    self.events[event_index] = edited_event
+                    # The series keeps its rule and exceptions unless its frequency or date changed
+                    repeat = repeat_var.get()
+                    if selected_event.recurrence and repeat == selected_event.recurrence.frequency and edited_date == selected_event.date:
+                        edited_event.recurrence = selected_event.recurrence
+                    elif repeat != "never":
+                        edited_event.recurrence = Recurrence(repeat, edited_date)
+
+                    # Events may have been added or deleted while the window was open,
+                    # so the position is looked up again
+                    try:
+                        current_index = self.events.index(selected_event.id)
+                    except ValueError:
+                        edit_window.destroy()
+                        return
+
+                    # The edited event keeps its id but has to be notified again
+                    self.notification_scheduler.unschedule(selected_event)
+                    self.delivery_journal.record(selected_event, "cancelled")
+                    self.events[current_index] = edited_event
+                    self.event_store.put(edited_event)
+                    self.notification_scheduler.schedule(edited_event)
 
-                    self.update_events_listbox()
+                    self.events_listbox.refresh_row(current_index)
 
                     edit_window.destroy()
 
-                    self.show_event_details(event_index)
+                    self.show_event_details(current_index)
                 except ValueError as e:
-                    messagebox.showerror("Error", f"Incorrect data: {e}")                    
+                    messagebox.showerror(self.i18n.get("Error"), self.i18n.get("Incorrect data: {error}").format(error=e))
         # Create a button to save changes
-            save_button = ttk.Button(content_frame, style="Yellow.TButton", text="Save changes", command=save_changes)
+            save_button = self.i18n.register(ttk.Button(content_frame, style="Yellow.TButton", command=save_changes), text="Save changes")
             save_button.pack(pady=10, padx=padx, side="right")
         else:
-            messagebox.showinfo("Error", "Select an event to edit.")
+            messagebox.showinfo(self.i18n.get("Error"), self.i18n.get("Select an event to edit."))
 
     def delete_event(self, event_index=None):
         if event_index is not None and 0 <= event_index < len(self.events):
+            deleted_event = self.events[event_index]
+            self.notification_scheduler.unschedule(deleted_event)
+            self.delivery_journal.record(deleted_event, "cancelled")
             del self.events[event_index]
+            self.event_store.delete(deleted_event)
 
-            self.update_events_listbox()
+            self.events_listbox.deleted(event_index)
 
             self.show_event_details(-1)
         else:
-            messagebox.showinfo("Error", "Select an event to delete.")
-
-    def show_context_menu(self, event):
+            messagebox.showinfo(self.i18n.get("Error"), self.i18n.get("Select an event to delete."))
+
+    def skip_occurrence(self, event_index=None):
+        # Removes the current occurrence of a recurring event and moves it on to the next one
+        if event_index is None or not 0 <= event_index < len(self.events):
+            return
+        selected_event = self.events[event_index]
+        if selected_event.recurrence is None:
+            return
+        next_event = Event(selected_event.title, selected_event.description, selected_event.date, selected_event.emails,
+                           selected_event.notify_date, selected_event.sent, selected_event.id,
+                           selected_event.recurrence.excluding(selected_event.date))
+        if not next_event.advance():
+            # That was the last occurrence, so there is nothing left to remind of
+            next_event.sent = True
+
+        self.notification_scheduler.unschedule(selected_event)
+        self.delivery_journal.record(selected_event, "cancelled")
+        self.events[event_index] = next_event
+        self.event_store.put(next_event)
+        self.notification_scheduler.schedule(next_event)
+
+        self.events_listbox.refresh_row(event_index)
+        self.show_event_details(event_index)
+
+    def reminders_dispatched(self, events):
+        # Runs on the Tk thread after the worker tried to send these reminders
+        delivered = [event for event in events if event.sent and self.events.find(event.id) is event]
+        # Only the next occurrence of a recurring event is scheduled
+        advanced = [event for event in delivered if event.advance()]
+        positions = self.events.refresh(delivered)
+        for event in advanced:
+            self.event_store.put(event)
+            self.notification_scheduler.schedule(event)
+            self.events_listbox.refresh_row(positions[event.id])
+        selected = self.events_listbox.selected
+        if selected is not None and self.events.ids[selected] in {event.id for event in events}:
+            self.show_event_details(selected)
+
+    def show_context_menu(self, event, event_index):
+        self.context_event_index = event_index
+        recurring = event_index is not None and self.events[event_index].recurrence is not None
+        self.context_menu.entryconfigure(2, state="normal" if recurring else "disabled")
         self.context_menu.post(event.x_root, event.y_root)
         
-    def send_notifications(self):
+    async def send_notifications(self, events):
+        # Runs on the scheduler's event loop
         try:
-            # Loading credentials from a file
-            with open('credentials.json', 'r') as file:
-                creds_data = json.load(file)
-            # Converting a string to a dictionary
-            creds_data = json.loads(creds_data)
-            creds = Credentials(
-                token=creds_data['token'],
-                refresh_token=creds_data['refresh_token'],
-                token_uri=creds_data['token_uri'],
-                client_id=creds_data['client_id'],
-                client_secret=creds_data['client_secret']
-            )
-            
-            # Creating a Credential Object
-            name_credentials = Credentials.from_authorized_user_info(creds_data)
-            # Checking if the access token needs updating
-            if name_credentials.expired and name_credentials.refresh_token:
-                name_credentials.refresh(Request())
-            
-            service = build('gmail', 'v1', credentials=creds)
-
-            # Checking all user events
-            for event in self.events:
-                # Checking whether the event has a notification and whether its time has come
-                if event.notify_date and datetime.datetime.now() >= event.notify_date and not event.sent:
-                    url = 'https://www.googleapis.com/oauth2/v3/userinfo'
-                    headers = {'Authorization': f'Bearer {name_credentials.token}'}
-                    response = requests.get(url, headers=headers)
-                    if response.status_code == 200:
-                        data = response.json()
-                        name = data.get('name')
-                    
+            # The sender name is looked up once per batch, for Gmail from the shared profile cache.
+            # It may refresh the token or fetch the profile, so it runs in the executor
+            sender = await self.notification_dispatcher.run_blocking(self.mail_transport.sender)
+
+            # Building messages for the reminders the scheduler found to be due
+            messages = []
+            for event in events:
+                if event.notify_date and not event.sent:
                     # Make message
-                    message = MIMEText(f"{event.description}\nFrom {name} using Event Planner.")
+                    if sender:
+                        message = MIMEText(self.i18n.get("{description}\nFrom {sender} using Event Planner.").format(description=event.description, sender=sender))
+                    else:
+                        message = MIMEText(self.i18n.get("{description}\nSent using Event Planner.").format(description=event.description))
                     message['to'] = ", ".join(event.emails)
-                    message['subject'] = f"Reminder that event {event.title} will start on {event.date}!"
+                    # A deterministic Message-ID lets mail clients drop the duplicate if
+                    # a reminder is resent after a crash between sending and journaling
+                    message['Message-ID'] = f"<{event.id}.{int(event.notify_date.timestamp())}@event-planner>"
+                    message['subject'] = self.i18n.get("Reminder that event {title} will start on {date}!").format(title=event.title, date=event.date)
+                    messages.append((event, message))
 
-                    create_message = {'raw': base64.urlsafe_b64encode(message.as_bytes()).decode()}
-
-                    try:
-                        message = (service.users().messages().send(userId="me", body=create_message).execute())
-                        print(F'sent message to {message} Message Id: {message["id"]}')
-                        
-                        # Mark the event as sent
-                        event.sent = True
-                    except HTTPError as error:
-                        print(F'An error occurred: {error}')
-                        message = None
+            # Sending concurrently within the transport's rate limit
+            await self.notification_dispatcher.send_all(messages)
 
         except Exception as e:
             print(f"Error sending notifications: {e}")
         
     def run_notification_loop(self):
-        def notification_thread():
-            while True:
-                self.send_notifications()
-                time.sleep(60)
-
-        thread = threading.Thread(target=notification_thread)
-        thread.daemon = True
-        thread.start()
+        # The scheduler's event loop sleeps until the next reminder is due and is
+        # woken whenever an event is created, edited or deleted
+        self.delivery_journal = DeliveryJournal()
+        recovered = self.delivery_journal.replay(self.events)
+        if recovered:
+            print(f"Recovered delivery state of {recovered} reminders from the journal")
+        self.advance_recurring_events()
+        self.mail_transport = create_mail_transport(self.gmail_session, self.user_profile)
+        self.notification_dispatcher = NotificationDispatcher(self.mail_transport, self.delivery_journal)
+        # The list and the details pane are only touched on the Tk thread
+        self.notification_scheduler = NotificationScheduler(self.send_notifications,
+                                                            lambda events: self.main_thread.call(self.reminders_dispatched, events))
+        self.notification_scheduler.schedule_all(self.events.pending_reminders())
+        self.notification_scheduler.start()
+
+    def advance_recurring_events(self):
+        # Recurring events stored as sent, or whose occurrence passed while the
+        # application was closed, are moved on to their next occurrence
+        now = datetime.datetime.now()
+        advanced = []
+        for event_id in list(self.events.recurrences):
+            event = self.events.find(event_id)
+            if event and (event.sent or event.date <= now) and event.advance(now):
+                self.event_store.put(event)
+                advanced.append(event)
+        for index in self.events.refresh(advanced).values():
+            self.events_listbox.refresh_row(index)
 
     def open_settings(self):
-        settings_window = SettingsWindow(self, self.current_theme)
+        settings_window = SettingsWindow(self)
         
-    def change_theme(self):
-        # Changing the colors of controls depending on the selected theme
-        if self.current_theme == "dark":  # Dark theme
-            # Colors for dark theme
-            background_color = "#414141"
-            details_text_color = 'white'
-            listbox_background_color = "#323232"
-            listbox_item_background_color = "#323232"
-            listbox_item_foreground_color = "white"
-            button_background_color = "#323232"
-            button_foreground_color = "white"
-            button_active_background_color = "#FCF7C9"
-            button_active_foreground_color = "#323232"
-        else: # Light theme
-            # Light Theme Colors
-            background_color = "white"
-            details_text_color = '#262626'
-            listbox_background_color = "white"
-            listbox_item_background_color = "#FCF7C9"
-            listbox_item_foreground_color = "#323232"
-            button_background_color = "#FCF7C9"
-            button_foreground_color = "#323232"
-            button_active_background_color = "#323232"
-            button_active_foreground_color = "white"
-
-        # Applying colors to controls
-        self.root.configure(bg=background_color)
-        self.toolbar_frame.configure(bg=background_color)
-        self.events_listbox.configure(bg=listbox_background_color)
-        for widget in self.events_listbox.winfo_children():
-                widget.config(bg=listbox_item_background_color, fg=listbox_item_foreground_color)
-        self.context_menu.configure(bg=background_color, fg=button_foreground_color)
-        self.details_text.configure(bg=background_color, fg=details_text_color)
-        self.style.configure("Yellow.TButton", background=button_background_color, foreground=button_foreground_color)
-        self.style.map("Yellow.TButton", background=[("active", button_active_background_color)], foreground=[("active", button_active_foreground_color)])
+    def change_language(self, language):
+        # Relabels every open window in place, nothing is recreated or reloaded
+        self.i18n.set_language(language)
+
+    def change_theme(self, theme):
+        # Recolors every open window in place, nothing is recreated or reloaded
+        self.theme.apply(theme)
+
+    def configure_list_colors(self, palette):
+        self.events_listbox.set_colors(background=palette["list_background"],
+                                       item_background=palette["list_item_background"],
+                                       item_foreground=palette["list_item_foreground"],
+                                       selected_background=palette["list_selected_background"],
+                                       selected_foreground=palette["list_selected_foreground"])
 
     def run(self):
         self.root.mainloop()
         
 class SettingsWindow:
-    def __init__(self, parent, current_theme):
+    def __init__(self, parent):
         self.parent = parent
         self.settings_window = tk.Toplevel(parent.root)
-        self.settings_window.title("Settings")
+        self.parent.i18n.register(self.settings_window, title="Settings")
         self.settings_window.iconphoto(False, tk.PhotoImage(file=resource_path('EP_cover.png')))
         
-        self.current_theme = current_theme
-        
-        if self.current_theme == 'light':
-            self.settings_window.configure(bg='white')
-        elif self.current_theme == 'dark':
-            self.settings_window.configure(bg='#414141')
-        
-        self.credentials = None
+        self.parent.theme.register(self.settings_window, bg="window")
+        # Requests of this window only, other settings windows keep their own
+        self.account_status = AccountStatus(parent.gmail_session, parent.user_profile, parent.main_thread)
         
         self.create_widgets()
+        # Results for a closed window are dropped
+        self.settings_window.bind("<Destroy>", self.on_destroy)
+        self.refresh_account()
 
     def create_widgets(self):
         # Adding Controls
-        if self.current_theme == 'light':
-            self.settings_frame = tk.Frame(self.settings_window, bg='white')
-        elif self.current_theme == 'dark':
-            self.settings_frame = tk.Frame(self.settings_window, bg='#414141')
+        self.settings_frame = self.parent.theme.register(tk.Frame(self.settings_window), bg="window")
         self.settings_frame.pack(pady=5, padx=10)
 
         # Google Account Zone
-        if self.current_theme == 'light':
-            self.google_account_frame = tk.Frame(self.settings_frame, bg='white')
-        elif self.current_theme == 'dark':
-            self.google_account_frame = tk.Frame(self.settings_frame, bg='#414141')
+        self.google_account_frame = self.parent.theme.register(tk.Frame(self.settings_frame), bg="window")
         self.google_account_frame.pack(side="left", padx=10)
 
-        tk.Label(self.google_account_frame, text="Google account settings:", font=("Segoe UI Semibold", 12)).pack(pady=10, anchor="w")
+        self.parent.i18n.register(tk.Label(self.google_account_frame, font=self.parent.fonts.get("Segoe UI Semibold", 12)), text="Google account settings:").pack(pady=10, anchor="w")
 
-        # Checking if Google Account data is saved
-        if os.path.exists('credentials.json'):
-            # Loading credentials from a file
-            with open('credentials.json', 'r') as file:
-                creds_data = json.load(file)
-            # Converting a string to a dictionary
-            creds_data = json.loads(creds_data)
-            # Creating a Credential Object
-            self.credentials = Credentials.from_authorized_user_info(creds_data)
-            # Checking if credentials are valid
-            if not self.credentials.valid:
-                # Checking if the access token needs updating
-                if self.credentials.expired and self.credentials.refresh_token:
-                    self.credentials.refresh(Request())
-                    # Display Google account information
-                    email, name = self.get_user_info()
-                    if email and name:
-                        ttk.Label(self.google_account_frame, text="Email:", font=("Segoe UI", 12)).pack(anchor="w")
-                        ttk.Label(self.google_account_frame, text=email, font=("Segoe UI", 12)).pack(anchor="w")
-                        ttk.Label(self.google_account_frame, text="Username:", font=("Segoe UI", 12)).pack(anchor="w")
-                        ttk.Label(self.google_account_frame, text=name, font=("Segoe UI", 12)).pack(anchor="w")
-                        # Logout button
-                        ttk.Button(self.google_account_frame, style="Yellow.TButton", text="Log out of your account", command=self.logout_google_account).pack(pady=10, anchor="w")
-                    else:
-                        # If we were unable to obtain information, we display the login button
-                        ttk.Button(self.google_account_frame, style="Yellow.TButton", text="Sign in to Google Account", command=self.login_google_account).pack(pady=10, anchor="w")
-                else:
-                    # Credentials are invalid, you need to log in again
-                    self.login_google_account()
-            else:
-                # Display Google account information
-                email, name = self.get_user_info()
-                if email and name:
-                    ttk.Label(self.google_account_frame, text="Email:", font=("Segoe UI", 12)).pack(anchor="w")
-                    ttk.Label(self.google_account_frame, text=email, font=("Segoe UI", 12)).pack(anchor="w")
-                    ttk.Label(self.google_account_frame, text="Username:", font=("Segoe UI", 12)).pack(anchor="w")
-                    ttk.Label(self.google_account_frame, text=name, font=("Segoe UI", 12)).pack(anchor="w")
-                    # Logout button
-                    ttk.Button(self.google_account_frame, style="Yellow.TButton", text="Log out of your account", command=self.logout_google_account).pack(pady=10, anchor="w")
-                else:
-                    # If we were unable to obtain information, we display the login button
-                    ttk.Button(self.google_account_frame, style="Yellow.TButton", text="Sign in to Google Account", command=self.login_google_account).pack(pady=10, anchor="w")
-        else:
-            # If there are no credentials, we display the login button
-            ttk.Button(self.google_account_frame, style="Yellow.TButton", text="Sign in to Google Account", command=self.login_google_account).pack(pady=10, anchor="w")
+        # Filled in by refresh_account once the account is resolved in the background
+        self.account_frame = self.parent.theme.register(tk.Frame(self.google_account_frame), bg="window")
+        self.account_frame.pack(anchor="w")
 
         # Zone of buttons for changing theme and language
-        if self.current_theme == 'light':
-            self.theme_language_frame = tk.Frame(self.settings_frame, bg='white')
-        elif self.current_theme == 'dark':            
-            self.theme_language_frame = tk.Frame(self.settings_frame, bg='#414141')
+        self.theme_language_frame = self.parent.theme.register(tk.Frame(self.settings_frame), bg="window")
         self.theme_language_frame.pack(side="right", padx=10)
         
         # Adding help button centered in the zone
-        ttk.Button(self.theme_language_frame, style="Yellow.TButton", text="Help", command=lambda: webbrowser.open("https://docs.google.com/document/d/1yQYKMG--Q4hUG8daiSD0xcQOntGQ_f_nzOiG34x_KQE/edit?usp=sharing")).pack(side="top", padx=5)
+        self.parent.i18n.register(ttk.Button(self.theme_language_frame, style="Yellow.TButton", command=lambda: webbrowser.open("https://docs.google.com/document/d/1yQYKMG--Q4hUG8daiSD0xcQOntGQ_f_nzOiG34x_KQE/edit?usp=sharing")), text="Help").pack(side="top", padx=5)
 
         # Adding buttons to change theme and language
-        ttk.Button(self.theme_language_frame, style="Yellow.TButton", text="Change color theme", command=self.save_and_change_theme).pack(side="left", padx=5)
-        ttk.Button(self.theme_language_frame, style="Yellow.TButton", text="Change language", command=self.change_language).pack(side="bottom", pady=10)
+        self.parent.i18n.register(ttk.Button(self.theme_language_frame, style="Yellow.TButton", command=self.save_and_change_theme), text="Change color theme").pack(side="left", padx=5)
+        self.parent.i18n.register(ttk.Button(self.theme_language_frame, style="Yellow.TButton", command=self.change_language), text="Change language").pack(side="bottom", pady=10)
         
-        tk.Label(self.settings_window, text="© 2024 Hlib Ishchenko. All rights reserved.", font=("Segoe UI", 12)).pack(pady=10, side="bottom")
+        tk.Label(self.settings_window, text="© 2024 Hlib Ishchenko. All rights reserved.", font=self.parent.fonts.get("Segoe UI", 12)).pack(pady=10, side="bottom")
 
-    def get_user_info(self):
-        url = 'https://www.googleapis.com/oauth2/v3/userinfo'
-        headers = {'Authorization': f'Bearer {self.credentials.token}'}
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            data = response.json()
-            email = data.get('email')
-            name = data.get('name')
-            return email, name
+    def refresh_account(self):
+        self.show_account_placeholder("Checking Google account...")
+        self.account_status.resolve(self.show_account)
+
+    def clear_account(self):
+        for widget in self.account_frame.winfo_children():
+            widget.destroy()
+
+    def show_account_placeholder(self, text, cancel=None):
+        self.clear_account()
+        self.parent.i18n.register(ttk.Label(self.account_frame, font=self.parent.fonts.get("Segoe UI", 12)), text=text).pack(anchor="w")
+        if cancel:
+            self.parent.i18n.register(ttk.Button(self.account_frame, style="Yellow.TButton", command=cancel), text="Cancel").pack(pady=10, anchor="w")
+
+    def show_account(self, email, name):
+        self.clear_account()
+        if email and name:
+            # Display Google account information
+            self.parent.i18n.register(ttk.Label(self.account_frame, font=self.parent.fonts.get("Segoe UI", 12)), text="Email:").pack(anchor="w")
+            ttk.Label(self.account_frame, text=email, font=self.parent.fonts.get("Segoe UI", 12)).pack(anchor="w")
+            self.parent.i18n.register(ttk.Label(self.account_frame, font=self.parent.fonts.get("Segoe UI", 12)), text="Username:").pack(anchor="w")
+            ttk.Label(self.account_frame, text=name, font=self.parent.fonts.get("Segoe UI", 12)).pack(anchor="w")
+            # Logout button
+            self.parent.i18n.register(ttk.Button(self.account_frame, style="Yellow.TButton", command=self.logout_google_account), text="Log out of your account").pack(pady=10, anchor="w")
         else:
-            print('Error:', response.status_code)
-            return None, None
+            # Logged out, or the account could not be resolved
+            self.parent.i18n.register(ttk.Button(self.account_frame, style="Yellow.TButton", command=self.login_google_account), text="Sign in to Google Account").pack(pady=10, anchor="w")
 
     def login_google_account(self):
-        os.environ['OAUTHLIB_RELAX_TOKEN_SCOPE'] = '1'
-        # Creating OAuth2 credentials to access the Gmail API and retrieve user information
-        scopes = [
-            'https://www.googleapis.com/auth/gmail.send',
-            'https://www.googleapis.com/auth/userinfo.email',
-            'https://www.googleapis.com/auth/userinfo.profile'
-        ]
-        flow = InstalledAppFlow.from_client_secrets_file(resource_path('your_client_secret.json'), scopes=scopes)
-        self.credentials = flow.run_local_server(port=0)
-
-        # Saving credentials to a file
-        with open('credentials.json', 'w') as file:
-            json.dump(self.credentials.to_json(), file)
-        
-        # Rebooting the settings window
-        self.settings_window.destroy()
-        self.__init__(self.parent)
+        # The browser flow runs in the background until the user finishes it
+        self.show_account_placeholder("Waiting for sign-in in the browser...", cancel=self.cancel_login)
+        self.account_status.login(self.login_finished)
+
+    def login_finished(self, signed_in):
+        self.refresh_account()
+
+    def cancel_login(self):
+        self.account_status.cancel()
+        self.show_account(None, None)
 
     def logout_google_account(self):
-        # Deleting files with credentials
-        if os.path.exists('credentials.json'):
-            os.remove('credentials.json')
+        # Deleting the file with credentials
+        self.account_status.logout()
+        self.show_account(None, None)
+
+    def on_destroy(self, event):
+        if event.widget is self.settings_window:
+            self.account_status.cancel()
 
-        # Rebooting the settings window
-        self.settings_window.destroy()
-        self.__init__(self.parent)
-        
     def save_and_change_theme(self):
-        response = messagebox.askquestion("Warning", "The application will be restarted to change the theme. Continue?")
-        if response == 'yes':
-            new_theme = "dark" if self.current_theme == "light" else "light"
-            
-            # Save the current theme to a file
-            with open("current_theme.txt", "w") as f:
-                f.write(new_theme)
-                
-            self.parent.save_events_to_file()
-            # Restart application
-            python = sys.executable
-            os.execl(python, python, *sys.argv)
+        new_theme = "dark" if self.parent.settings["theme"] == "light" else "light"
+        # The theme is switched live in all open windows, no restart is needed
+        self.parent.settings.set("theme", new_theme)
 
     def show(self):
         self.settings_window.deiconify()
@@ -1019,1021 +3150,30 @@ class SettingsWindow:
         self.settings_window.withdraw()
     
     def change_language(self):
-        response = messagebox.askquestion("Warning", "The language will change to Ukrainian. The application will be restarted to change the language. Continue?")
-        if response == 'yes':
-            if os.path.exists("current_language.txt"):
-                with open("current_language.txt", "r") as f:
-                    current_language = f.read()
-            else:
-                current_language = "english"
-                
-            new_language = "ukrainian" if current_language == "english" else "english"
+        new_language = "ukrainian" if self.parent.settings["language"] == "english" else "english"
+        # The language is switched live in all open windows, no restart is needed
+        self.parent.settings.set("language", new_language)
             
-            # Save the current theme to a file
-            with open("current_language.txt", "w") as f:
-                f.write(new_language)
-                
-            self.parent.save_events_to_file()
-            # Restart application
-            python = sys.executable
-            os.execl(python, python, *sys.argv)
-            
-"""
-This is the official Ukrainian localization.
-"""
-            
-class EventPlannerAppUKR:
-    def __init__(self, root):
-        self.load_fonts()
-        self.run_notification_loop()
-        
-        self.root = root
-        self.root.title("Event Planner")
-        self.style = ttk.Style()
-        self.style.theme_use("clam")
-        
-        self.root.protocol("WM_DELETE_WINDOW", self.close_application)
-        
-        if os.path.exists("current_theme.txt"):
-            with open("current_theme.txt", "r") as f:
-                self.current_theme = f.read()
-        else:
-            self.current_theme = "light"
-        
-        self.style.configure("Yellow.TButton",
-                        foreground="#323232",
-                        background="#FCF7C9",
-                        font=("Segoe UI Semibold", 12),
-                        padding=10,
-                        )
-        self.style.map("Yellow.TButton",
-                foreground=[("active", "white")],
-                background=[("active", "#323232")],
-                )
-
-        self.main_frame = tk.Frame(self.root, bg='white')
-        self.main_frame.pack(expand=True, fill="both")
-        
-        self.toolbar_frame = tk.Frame(self.main_frame, bg='white')
-        self.toolbar_frame.pack(side="top", fill="x")
-
-        self.new_event_button = ttk.Button(self.toolbar_frame, text="Нова подія", style="Yellow.TButton", command=self.create_event_window)
-        self.new_event_button.pack(side="left")
-
-        self.settings_button = ttk.Button(self.toolbar_frame, text="Налаштування", style="Yellow.TButton", command=self.open_settings)
-        self.settings_button.pack(side="right")
-        
-        self.save_button = ttk.Button(self.toolbar_frame, text="Зберегти", style="Yellow.TButton", command=self.save_events_to_file)
-        self.save_button.pack(side="right", padx=5)  # Add a small gap between the buttons
-        
-        ttk.Separator(self.main_frame, orient="horizontal").pack(fill="x")
-
-        self.paned_window = ttk.PanedWindow(self.main_frame, orient=tk.HORIZONTAL)
-        self.paned_window.pack(expand=True, fill="both")
-
-        self.events_frame = ttk.Frame(self.paned_window)
-        self.paned_window.add(self.events_frame, weight=1)
-
-        self.events_listbox = tk.Listbox(self.events_frame, selectmode="single")
-        self.events_listbox.pack(expand=True, fill="both")
-
-        self.events_listbox.bind("<Button-3>", self.show_context_menu)
-        self.events_listbox.bind("<<ListboxSelect>>", self.on_event_selected)
-
-        self.context_menu = tk.Menu(self.root, tearoff=0, bg='white')
-        self.context_menu.add_command(label="Редагувати", command=self.edit_event)
-        self.context_menu.add_command(label="Видалити", command=self.delete_event)
-        
-        ttk.Separator(self.paned_window, orient="vertical").pack(side="left", fill="y")
-
-        self.details_frame = ttk.Frame(self.paned_window)
-        self.paned_window.add(self.details_frame, weight=2)
-
-        self.details_text = tk.Text(self.details_frame, wrap="word", font=("Segoe UI", 12), spacing1=8, spacing2=8, spacing3=8, bg='white')
-        self.details_text.config(foreground="#262626")
-
-        scrollbar = tk.Scrollbar(self.details_frame, orient="vertical", command=self.details_text.yview)
-        scrollbar.pack(side="right", fill="y")
-
-        self.details_text.config(yscrollcommand=scrollbar.set)
-
-        self.details_text.pack(expand=True, fill="both")
-
-        self.paned_window.bind("<B1-Motion>")
-        
-        if os.path.exists("events.json") and os.path.getsize("events.json") > 0:
-            with open("events.json", "r") as f:
-                events_data = json.load(f)
-            self.events = [Event.deserialize(data) for data in events_data]
-            self.update_events_listbox()
-        else:
-            self.events = []
+if __name__ == "__main__":
+    startup_report = StartupReport("--startup-report" in sys.argv)
+    google_libraries.report = startup_report
+    startup_report.mark("imports")
+    
+    root = tk.Tk()
+    
+    root.iconphoto(False, tk.PhotoImage(file=resource_path('EP_cover.png')))
+    startup_report.mark("Tk")
+    
+    app = EventPlannerApp(root, startup_report)
+    
+    if "--benchmark" in sys.argv:
+        # Used by benchmark.py: the window stays withdrawn and the app quits with
+        # the report saved right after the first idle
+        report_path = sys.argv[sys.argv.index("--benchmark") + 1]
+        root.withdraw()
+        def finish_benchmark():
+            startup_report.save(report_path)
+            app.close_application()
+        root.after(0, finish_benchmark)
 
-        if not self.events:
-            self.show_event_details(-1)
-            
-        if self.current_theme == "dark":
-            self.change_theme()
-            
-        if os.path.exists("current_scaling.txt"):
-            with open("current_scaling.txt", "r") as f:
-                self.current_scaling = float(f.read())
-        else:
-            self.current_scaling = 1.33
-            
-        # Bind zoom functions to keypress events
-        self.root.bind("<Control-equal>", self.zoom_in)
-        self.root.bind("<Control-minus>", self.zoom_out)
-            
-    def load_fonts(self):
-        font_folder = "fonts"
-        if not os.path.exists(font_folder):
-            os.makedirs(font_folder)
-        
-        font_files = {
-            "Segoe UI Black": "SEGUIBL.TTF",
-            "Segoe UI": "SEGOEUI.TTF",
-            "Segoe UI Semibold": "SEGUISB.TTF",
-            "Segoe UI Italic": "SEGOEUII.TTF",
-            "Segoe UI Semibold Italic": "SEGUISBI.TTF"
-        }
-
-        self.loaded_fonts = {}
-        for font_name, font_file in font_files.items():
-            font_path = os.path.join(font_folder, font_file)
-            if os.path.exists(font_path):
-                self.loaded_fonts[font_name] = font_path
-                
-    def is_google_account_authenticated(self):
-        return os.path.exists('credentials.json')
-    
-    def save_events_to_file(self):
-        with open("events.json", "w") as f:
-            json.dump([event.serialize() for event in self.events], f)
-            
-    def close_application(self):
-        self.save_events_to_file()
-        self.root.destroy()
-        
-    def zoom_in(self, event):
-        response = messagebox.askquestion("Увага", "Ви хочете збільшити масштаб інтерфейсу. Для цього програму буде перезапущено. Продовжити?")
-        if response == 'yes':                
-            new_scaling = self.current_scaling + 0.33
-            
-            # Save the current theme to a file
-            with open("current_scaling.txt", "w") as f:
-                f.write(str(new_scaling))
-                
-            self.save_events_to_file
-                
-            # Restart application
-            python = sys.executable
-            os.execl(python, python, *sys.argv)
-    def zoom_out(self, event):
-        response = messagebox.askquestion("Увага", "Ви хочете зменшити масштаб інтерфейсу. Для цього програму буде перезапущено. Продовжити?")
-        if response == 'yes':
-            new_scaling = self.current_scaling - 0.33
-            
-            # Save the current theme to a file
-            with open("current_scaling.txt", "w") as f:
-                f.write(str(new_scaling))
-                
-            self.save_events_to_file
-                
-            # Restart application
-            python = sys.executable
-            os.execl(python, python, *sys.argv)
-
-    def create_event_window(self):
-        create_window = tk.Toplevel(self.root)
-        create_window.title("Створення події")
-        create_window.geometry(f"{int(800/(1.33/self.current_scaling))}x{int(600/(1.33/self.current_scaling))}")
-        create_window.iconphoto(False, tk.PhotoImage(file=resource_path('EP_cover.png')))
-
-        padx = 10
-        pady = 5
-
-        if self.current_theme == 'light':
-            canvas = tk.Canvas(create_window, bg='white')
-        elif self.current_theme == 'dark':
-            canvas = tk.Canvas(create_window, bg='#323232')
-        canvas.pack(side="left", fill="both", expand=True)
-
-        scrollbar = tk.Scrollbar(create_window, orient="vertical", command=canvas.yview)
-        scrollbar.pack(side="right", fill="y")
-
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-
-        if self.current_theme == 'light':
-            content_frame = tk.Frame(canvas, bg='white')
-        elif self.current_theme == 'dark':
-            content_frame = tk.Frame(canvas, bg='#323232')
-        canvas.create_window((0, 0), window=content_frame, anchor="nw")
-        
-        def update_scroll_region(event):
-            canvas.update_idletasks()
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            
-        def on_mousewheel(event):
-            if event.widget == description_entry:
-                return
-            canvas.yview_scroll(-1*(event.delta//120), "units")
-
-        content_frame.bind("<Configure>", update_scroll_region)
-        create_window.bind("<MouseWheel>", on_mousewheel)
-
-        ttk.Label(content_frame, text="Назва події:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-        if self.current_theme == 'light':
-            title_entry = tk.Entry(content_frame, font=("Segoe UI Black", 16), bg='white', fg='black')
-        elif self.current_theme == 'dark':
-            title_entry = tk.Entry(content_frame, font=("Segoe UI Black", 16), bg='#414141', fg='white')
-        title_entry.pack(pady=pady, padx=padx, fill="x")
-
-        ttk.Label(content_frame, text="Опис події:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-
-        # Creating a frame for the text field and scrollbar
-        if self.current_theme == 'light':
-            description_frame = tk.Frame(content_frame, bg='white')
-        elif self.current_theme == 'dark':
-            description_frame = tk.Frame(content_frame, bg='#323232')
-        description_frame.pack(fill="both", expand=True)
-
-        # Create a field to describe the event
-        if self.current_theme == 'light':
-            description_entry = tk.Text(description_frame, wrap="word", height=10, font=("Segoe UI", 12), bg='white', fg='black')
-        elif self.current_theme == 'dark':
-            description_entry = tk.Text(description_frame, wrap="word", height=10, font=("Segoe UI", 12), bg='#414141', fg='white')
-
-        # Adding a vertical scrollbar
-        scrollbar = ttk.Scrollbar(description_frame, orient="vertical", command=description_entry.yview)
-        scrollbar.pack(side="right", fill="y")
-
-        # Linking a scrollbar to a text field
-        description_entry.config(yscrollcommand=scrollbar.set)
-
-        description_entry.pack(pady=pady, padx=padx, fill="both", expand=True)
-
-        ttk.Label(content_frame, text="Дата та час події:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-        if self.current_theme == 'light':
-            date_time_frame = tk.Frame(content_frame, bg='white')
-        elif self.current_theme == 'dark':
-            date_time_frame = tk.Frame(content_frame, bg='#414141')
-        date_time_frame.pack(pady=pady, padx=padx, fill="x")
-
-        calendar = Calendar(date_time_frame, selectmode="day", year=datetime.datetime.now().year, month=datetime.datetime.now().month, day=datetime.datetime.now().day)
-        calendar.pack(side="left", padx=(0, 10))
-
-        if self.current_theme == 'light':
-            time_frame = tk.Frame(date_time_frame, bg='white')
-        elif self.current_theme == 'dark':
-            time_frame = tk.Frame(date_time_frame, bg='#414141')
-        time_frame.pack(side="left")
-
-        hour_var = tk.StringVar(value=str(datetime.datetime.now().hour).zfill(2))
-        minute_var = tk.StringVar(value=str(datetime.datetime.now().minute).zfill(2))
-
-        ttk.Label(time_frame, text="Години:", font=("Segoe UI", 14)).pack(anchor="w")
-        hour_spinbox = ttk.Spinbox(time_frame, from_=0, to=23, textvariable=hour_var, width=2, font=("Segoe UI", 14))
-        hour_spinbox.pack(anchor="w", pady=(0, 5))
-
-        ttk.Label(time_frame, text="Хвилини:", font=("Segoe UI", 14)).pack(anchor="w")
-        minute_spinbox = ttk.Spinbox(time_frame, from_=0, to=59, textvariable=minute_var, width=2, font=("Segoe UI", 14))
-        minute_spinbox.pack(anchor="w")
-
-        ttk.Label(content_frame, text="Список електронних адрес (через кому):", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-        if self.current_theme == 'light':
-            emails_entry = tk.Entry(content_frame, font=("Segoe UI Semibold", 12), bg='white', fg='black')
-        elif self.current_theme == 'dark':
-            emails_entry = tk.Entry(content_frame, font=("Segoe UI Semibold", 12), bg='#414141', fg='white')
-        emails_entry.pack(pady=pady, padx=padx, fill="x")
-
-        notify_var = tk.BooleanVar(value=False)
-
-        def toggle_notify():
-            if notify_var.get():
-                notify_frame.pack(side="top", fill="x", padx=padx, anchor="w", pady=(10, 10))
-            else:
-                notify_frame.pack_forget()
-                
-            update_scroll_region(None)
-
-        notify_checkbox = ttk.Checkbutton(content_frame, text="Нагадати", variable=notify_var, command=toggle_notify)
-        notify_checkbox.pack(pady=pady, padx=padx, anchor="w")
-
-        if self.current_theme == 'light':
-            notify_frame = tk.Frame(content_frame, bg='white')
-        elif self.current_theme == 'dark':
-            notify_frame = tk.Frame(content_frame, bg='#414141')
-        notify_frame.pack(pady=pady, padx=padx, fill="x", anchor="w")
-
-        # Check if the user is signed in to a Google account
-        if self.is_google_account_authenticated():
-            # If you are logged in, then we allow the use of notifications
-            notify_checkbox.config(state="normal")
-        else:
-            # If you are not logged in, then make the widget inactive
-            notify_checkbox.config(state="disabled")
-
-            # Create a label indicating that you need to sign in to your Google account
-            notify_label = ttk.Label(content_frame, text="Щоб користуватися нагадуваннями, увійдіть у свій обліковий запис Google.", foreground="red")
-            notify_label.pack(pady=(0, 10), padx=padx, anchor="w")
-
-        notify_calendar = Calendar(notify_frame, selectmode="day", year=datetime.datetime.now().year, month=datetime.datetime.now().month, day=datetime.datetime.now().day)
-        notify_calendar.pack(side="left", padx=(0, 10))
-
-        if self.current_theme == 'light':
-            notify_time_frame = tk.Frame(notify_frame, bg='white')
-        elif self.current_theme == 'dark':
-            notify_time_frame = tk.Frame(notify_frame, bg='#414141')
-        notify_time_frame.pack(side="left")
-
-        notify_hour_var = tk.StringVar(value=str(datetime.datetime.now().hour).zfill(2))
-        notify_minute_var = tk.StringVar(value=str(datetime.datetime.now().minute).zfill(2))
-
-        ttk.Label(notify_time_frame, text="Години:", font=("Segoe UI", 14)).pack(anchor="w")
-        notify_hour_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=23, textvariable=notify_hour_var, width=2, font=("Segoe UI", 14))
-        notify_hour_spinbox.pack(anchor="w", pady=(0, 5))
-
-        ttk.Label(notify_time_frame, text="Хвилини:", font=("Segoe UI", 14)).pack(anchor="w")
-        notify_minute_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=59, textvariable=notify_minute_var, width=2, font=("Segoe UI", 14))
-        notify_minute_spinbox.pack(anchor="w")
-
-        toggle_notify()  # Hide/show notification widgets depending on initial state
-
-        def save_event():
-            try:
-                title = title_entry.get()
-                description = description_entry.get("1.0", tk.END).strip()
-                selected_date = calendar.get_date()
-                hour = int(hour_var.get())
-                minute = int(minute_var.get())
-                date = datetime.datetime.strptime(selected_date, '%m/%d/%y').replace(hour=hour, minute=minute)
-                emails = [email.strip() for email in emails_entry.get().split(',')]
-                notify_date = None
-                if notify_var.get():
-                    notify_selected_date = notify_calendar.get_date()
-                    notify_hour = int(notify_hour_var.get())
-                    notify_minute = int(notify_minute_var.get())
-                    notify_date = datetime.datetime.strptime(notify_selected_date, '%m/%d/%y').replace(hour=notify_hour, minute=notify_minute)
-
-                new_event = Event(title, description, date, emails)
-                new_event.notify_date = notify_date  # Save the notification date
-
-                self.events.append(new_event)
-
-                self.update_events_listbox()
-
-                create_window.destroy()
-
-                self.show_event_details(len(self.events) - 1)
-            except ValueError as e:
-                messagebox.showerror("Помилка", f"Невірні дані: {e}")
-
-        save_button = ttk.Button(content_frame, style="Yellow.TButton", text="Зберегти", command=save_event)
-        save_button.pack(pady=10, padx=padx, side="right")
-  
-    def create_event_widgets(self, index, formatted_event):
-        label = tk.Label(self.events_listbox, text=formatted_event, bg='#FCF7C9', fg='#323232', font=("Segoe UI Semibold", 12))
-        label.pack(fill=tk.X)
-
-        label.bind("<Button-1>", lambda e, idx=index: self.show_event_details(idx))
-        
-        context_menu = tk.Menu(self.root, tearoff=0)
-        context_menu.add_command(label="Редагувати", command=lambda idx=index: self.edit_event(idx))
-        context_menu.add_command(label="Видалити", command=lambda idx=index: self.delete_event(idx))
-        label.bind("<Button-3>", lambda e, menu=context_menu: menu.post(e.x_root, e.y_root))
-
-    def update_events_listbox(self):
-        for widget in self.events_listbox.winfo_children():
-            widget.destroy()
-
-        for index, event in enumerate(self.events):
-            formatted_event = f"{event.title} - {event.date.strftime('%Y-%m-%d %H:%M:%S')}"
-            self.create_event_widgets(index, formatted_event)
-
-    def show_event_details(self, event_index):
-        if event_index is not None and 0 <= event_index < len(self.events):
-            selected_event = self.events[event_index]
-            
-            self.details_text.tag_configure("date", font=("Segoe UI Semibold", 14), foreground="red")
-            if self.current_theme == 'light':
-                self.details_text.tag_configure("title", font=("Segoe UI Black", 16), foreground="black")
-                self.details_text.tag_configure("description", font=("Segoe UI", 12), foreground="#262626")
-                self.details_text.tag_configure("emails", font=("Segoe UI Semibold", 12), foreground="#262626")
-                self.details_text.tag_configure("status_not_sent_ok", font=("Segoe UI Black", 10), foreground="black")
-            elif self.current_theme == 'dark':
-                self.details_text.tag_configure("title", font=("Segoe UI Black", 16), foreground="white")
-                self.details_text.tag_configure("description", font=("Segoe UI", 12), foreground="white")
-                self.details_text.tag_configure("emails", font=("Segoe UI Semibold", 12), foreground="white")
-                self.details_text.tag_configure("status_not_sent_ok", font=("Segoe UI Black", 10), foreground="white")
-            
-            self.details_text.tag_configure("status_sent", font=("Segoe UI Black", 10), foreground="green")
-            self.details_text.tag_configure("status_not_sent_bad", font=("Segoe UI Black", 10), foreground="red")
-
-            details_text_lines = [
-                f"Назва: {selected_event.title}",
-                f"Опис: {selected_event.description}",
-                f"Дата: {selected_event.date.strftime('%Y-%m-%d %H:%M:%S')}",
-                f"Електронні адреси: {', '.join(selected_event.emails)}"
-            ]
-            
-            if selected_event.notify_date:  # Check if notification date exists
-                details_text_lines.append(f"Дата нагадування: {selected_event.notify_date.strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # Checking the notification sending status
-                if selected_event.sent:
-                    details_text_lines.append("Нагадування успішно надіслано!")
-                else:
-                    if datetime.datetime.now() < selected_event.notify_date + datetime.timedelta(minutes=1):
-                        details_text_lines.append("Нагадування буде надіслано, коли настане час сповіщення.")
-                    else:
-                        details_text_lines.append("Нагадування не надіслано через помилку. "
-                                                "Перевірте підключення до Інтернету та правильність введених даних. "
-                                                "Нагадування буде надіслано, щойно проблему буде вирішено.")
-
-            self.details_text.config(state="normal")
-            self.details_text.delete("1.0", tk.END)
-
-            for line in details_text_lines:
-                self.details_text.insert(tk.END, line + "\n")
-
-                if line.startswith("Назва:"):
-                    start_index = self.details_text.search("Назва:", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("title", start_index, end_index)
-                elif line.startswith("Дата:"):
-                    start_index = self.details_text.search("Дата:", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("date", start_index, end_index)
-                elif line.startswith("Електронні адреси:"):
-                    start_index = self.details_text.search("Електронні адреси:", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("emails", start_index, end_index)
-                elif line.startswith("Дата нагадування:"):  # Check if a string matches the notification date
-                    start_index = self.details_text.search("Дата нагадування:", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("date", start_index, end_index)
-                    
-                elif line.startswith("Нагадуваання успішно"):
-                    start_index = self.details_text.search("Нагадуваання успішно", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("status_sent", start_index, end_index)
-                elif line.startswith("Нагадування буде"):
-                    start_index = self.details_text.search("Нагадування буде", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("status_not_sent_ok", start_index, end_index)
-                elif line.startswith("Нагадування не"):
-                    start_index = self.details_text.search("Нагадування не", "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("status_not_sent_bad", start_index, end_index)
-                    
-                else:
-                    start_index = self.details_text.search(line, "1.0", tk.END)
-                    end_index = self.details_text.index(f"{start_index} lineend")
-                    self.details_text.tag_add("description", start_index, end_index)
-
-            self.details_text.config(state="disabled")
-
-            for widget in self.events_listbox.winfo_children():
-                if self.current_theme == 'light':
-                    widget.config(bg='#FCF7C9', fg='#323232')
-                elif self.current_theme == 'dark':
-                    widget.config(bg='#323232', fg='white')
-            if self.current_theme == 'light':
-                self.events_listbox.winfo_children()[event_index].config(bg='#323232', fg='white')
-            elif self.current_theme == 'dark':
-                self.events_listbox.winfo_children()[event_index].config(bg='#FCF7C9', fg='#323232')
-        else:
-            self.details_text.config(state="normal")
-            self.details_text.delete("1.0", tk.END)
-            self.details_text.insert(tk.END, "Виберіть подію, щоб відобразити її деталі.")
-            self.details_text.tag_add("center", "1.0", "end")
-            self.details_text.config(state="disabled")
-            
-    def on_event_selected(self, event):
-        selected_index = self.events_listbox.curselection()
-        if selected_index:
-            self.show_event_details(selected_index[0])
-            
-    def edit_event(self, event_index=None):
-        if event_index is not None and 0 <= event_index < len(self.events):
-            selected_event = self.events[event_index]
-
-            # Creating an editing window
-            edit_window = tk.Toplevel(self.root)
-            edit_window.title("Редагування події")
-            edit_window.geometry(f"{int(800/(1.33/self.current_scaling))}x{int(600/(1.33/self.current_scaling))}")
-            edit_window.iconphoto(False, tk.PhotoImage(file=resource_path('EP_cover.png')))
-
-            # Form elements for editing
-            padx = 10
-            pady = 5
-
-            if self.current_theme == 'light':
-                canvas = tk.Canvas(edit_window, bg='white')
-            elif self.current_theme == 'dark':
-                canvas = tk.Canvas(edit_window, bg='#323232')
-            canvas.pack(side="left", fill="both", expand=True)
-
-            scrollbar = tk.Scrollbar(edit_window, orient="vertical", command=canvas.yview)
-            scrollbar.pack(side="right", fill="y")
-
-            canvas.configure(yscrollcommand=scrollbar.set)
-            canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-
-            if self.current_theme == 'light':
-                content_frame = tk.Frame(canvas, bg='white')
-            elif self.current_theme == 'dark':
-                content_frame = tk.Frame(canvas, bg='#323232')
-            canvas.create_window((0, 0), window=content_frame, anchor="nw")
-
-            def update_scroll_region(event):
-                canvas.update_idletasks()
-                canvas.configure(scrollregion=canvas.bbox("all"))
-                
-            def on_mousewheel(event):
-                if event.widget == description_entry:
-                    return
-                canvas.yview_scroll(-1*(event.delta//120), "units")
-
-            content_frame.bind("<Configure>", update_scroll_region)
-            edit_window.bind("<MouseWheel>", on_mousewheel)
-
-            ttk.Label(content_frame, text="Назва події:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-            if self.current_theme == 'light':
-                title_entry = tk.Entry(content_frame, font=("Segoe UI Black", 16), bg='white', fg='black')
-            elif self.current_theme == 'dark':
-                title_entry = tk.Entry(content_frame, font=("Segoe UI Black", 16), bg='#414141', fg='white')
-            title_entry.insert(0, selected_event.title)
-            title_entry.pack(pady=pady, padx=padx, fill="x")
-
-            ttk.Label(content_frame, text="Опис події:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-
-            # Creating a frame for the text field and scrollbar
-            if self.current_theme == 'light':
-                description_frame = tk.Frame(content_frame, bg='white')
-            elif self.current_theme == 'dark':
-                description_frame = tk.Frame(content_frame, bg='#323232')
-            description_frame.pack(fill="both", expand=True)
-
-            # Create a field to describe the event
-            if self.current_theme == 'light':
-                description_entry = tk.Text(description_frame, wrap="word", height=10, font=("Segoe UI", 12), bg='white', fg='black')
-            elif self.current_theme == 'dark':
-                description_entry = tk.Text(description_frame, wrap="word", height=10, font=("Segoe UI", 12), bg='#414141', fg='white')
-            description_entry.insert("1.0", selected_event.description)
-
-            # Adding a vertical scrollbar
-            scrollbar = ttk.Scrollbar(description_frame, orient="vertical", command=description_entry.yview)
-            scrollbar.pack(side="right", fill="y")
-
-            # Linking a scrollbar to a text field
-            description_entry.config(yscrollcommand=scrollbar.set)
-
-            description_entry.pack(pady=pady, padx=padx, fill="both", expand=True)
-
-
-            ttk.Label(content_frame, text="Дата і час події:", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-            if self.current_theme == 'light':
-                date_time_frame = tk.Frame(content_frame, bg='white')
-            elif self.current_theme == 'dark':
-                date_time_frame = tk.Frame(content_frame, bg='#414141')
-            date_time_frame.pack(pady=pady, padx=padx, fill="x")
-
-            calendar = Calendar(date_time_frame, selectmode="day", year=selected_event.date.year, month=selected_event.date.month, day=selected_event.date.day)
-            calendar.pack(side="left", padx=(0, 10))
-
-            if self.current_theme == 'light':
-                time_frame = tk.Frame(date_time_frame, bg='white')
-            elif self.current_theme == 'dark':
-                time_frame = tk.Frame(date_time_frame, bg='#414141')
-            time_frame.pack(side="left")
-
-            hour_var = tk.StringVar(value=str(selected_event.date.hour).zfill(2))
-            minute_var = tk.StringVar(value=str(selected_event.date.minute).zfill(2))
-
-            ttk.Label(time_frame, text="Години:", font=("Segoe UI", 14)).pack(anchor="w")
-            hour_spinbox = ttk.Spinbox(time_frame, from_=0, to=23, textvariable=hour_var, width=2, font=("Segoe UI", 14))
-            hour_spinbox.pack(anchor="w", pady=(0, 5))
-
-            ttk.Label(time_frame, text="Хвилини:", font=("Segoe UI", 14)).pack(anchor="w")
-            minute_spinbox = ttk.Spinbox(time_frame, from_=0, to=59, textvariable=minute_var, width=2, font=("Segoe UI", 14))
-            minute_spinbox.pack(anchor="w")
-
-            ttk.Label(content_frame, text="Список електронних адрес (через кому):", font=("Segoe UI", 12)).pack(pady=pady, padx=padx, anchor="w")
-            if self.current_theme == 'light':
-                emails_entry = tk.Entry(content_frame, font=("Segoe UI Semibold", 12), bg='white', fg='black')
-            elif self.current_theme == 'dark':
-                emails_entry = tk.Entry(content_frame, font=("Segoe UI Semibold", 12), bg='#414141', fg='white')
-            emails_entry.insert(0, ', '.join(selected_event.emails))
-            emails_entry.pack(pady=pady, padx=padx, fill="x")
-            
-            notify_var = tk.BooleanVar(value=selected_event.notify_date is not None)  # Set the checkbox value depending on the presence of a notification
-
-            def toggle_notify():
-                if notify_var.get():
-                    notify_frame.pack(side="top", fill="x", padx=padx, anchor="w", pady=(10, 10))
-                else:
-                    notify_frame.pack_forget()
-
-                update_scroll_region(None)
-
-            notify_checkbox = ttk.Checkbutton(content_frame, text="Нагадати", variable=notify_var, command=toggle_notify)
-            notify_checkbox.pack(pady=pady, padx=padx, anchor="w")
-
-            if self.current_theme == 'light':
-                notify_frame = tk.Frame(content_frame, bg='white')
-            elif self.current_theme == 'dark':
-                notify_frame = tk.Frame(content_frame, bg='#414141')
-            notify_frame.pack(pady=pady, padx=padx, fill="x", anchor="w")
-
-            # Check if the user is signed in to a Google account
-            if self.is_google_account_authenticated():
-                # If you are logged in, then we allow the use of notifications
-                notify_checkbox.config(state="normal")
-            else:
-                # If you are not logged in, then make the widget inactive
-                notify_checkbox.config(state="disabled")
-
-                # Create a label indicating that you need to sign in to your Google account
-                notify_label = ttk.Label(content_frame, text="Щоб користуватися нагадуваннями, увійдіть у свій обліковий запис Google.", foreground="red")
-                notify_label.pack(pady=(0, 10), padx=padx, anchor="w")
-
-            if selected_event.notify_date:
-                notify_calendar = Calendar(notify_frame, selectmode="day", year=selected_event.notify_date.year, month=selected_event.notify_date.month, day=selected_event.notify_date.day)
-            else:
-                notify_calendar = Calendar(notify_frame, selectmode="day", year=datetime.datetime.now().year, month=datetime.datetime.now().month, day=datetime.datetime.now().day)
-            notify_calendar.pack(side="left", padx=(0, 10))
-
-            if self.current_theme == 'light':
-                notify_time_frame = tk.Frame(notify_frame, bg='white')
-            elif self.current_theme == 'dark':
-                notify_time_frame = tk.Frame(notify_frame, bg='#414141')
-            notify_time_frame.pack(side="left")
-
-            notify_hour_var = tk.StringVar(value=str(selected_event.notify_date.hour).zfill(2) if selected_event.notify_date else str(datetime.datetime.now().hour).zfill(2))
-            notify_minute_var = tk.StringVar(value=str(selected_event.notify_date.minute).zfill(2) if selected_event.notify_date else str(datetime.datetime.now().minute).zfill(2))
-
-            ttk.Label(notify_time_frame, text="Години:", font=("Segoe UI", 14)).pack(anchor="w")
-            notify_hour_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=23, textvariable=notify_hour_var, width=2, font=("Segoe UI", 14))
-            notify_hour_spinbox.pack(anchor="w", pady=(0, 5))
-
-            ttk.Label(notify_time_frame, text="Хвилини:", font=("Segoe UI", 14)).pack(anchor="w")
-            notify_minute_spinbox = ttk.Spinbox(notify_time_frame, from_=0, to=59, textvariable=notify_minute_var, width=2, font=("Segoe UI", 14))
-            notify_minute_spinbox.pack(anchor="w")
-
-            toggle_notify()  # Hide/show notification widgets depending on the initial state of the checkbox
-
-            def save_changes():
-                try:
-                    edited_date_str = calendar.get_date()
-                    edited_date = datetime.datetime.strptime(edited_date_str, "%m/%d/%y")
-                    edited_date = edited_date.replace(hour=int(hour_var.get()), minute=int(minute_var.get()))
-                    edited_emails = [email.strip() for email in emails_entry.get().split(',')]
-                    edited_event = Event(title_entry.get(), description_entry.get("1.0", tk.END).strip(), edited_date, edited_emails)
-
-                    edited_event.notify_date = None  # Set the notification date to None by default
-
-                    if notify_var.get():
-                        notify_selected_date = notify_calendar.get_date()
-                        notify_hour = int(notify_hour_var.get())
-                        notify_minute = int(notify_minute_var.get())
-                        edited_event.notify_date = datetime.datetime.strptime(notify_selected_date, '%m/%d/%y').replace(hour=notify_hour, minute=notify_minute)
-
-                    self.events[event_index] = edited_event
-
-                    self.update_events_listbox()
-
-                    edit_window.destroy()
-
-                    self.show_event_details(event_index)
-                except ValueError as e:
-                    messagebox.showerror("Помилка", f"Невірні дані: {e}")                    
-        # Create a button to save changes
-            save_button = ttk.Button(content_frame, style="Yellow.TButton", text="Зберегти зміни", command=save_changes)
-            save_button.pack(pady=10, padx=padx, side="right")
-        else:
-            messagebox.showinfo("Помилка", "Виберіть подію для редагування.")
-
-    def delete_event(self, event_index=None):
-        if event_index is not None and 0 <= event_index < len(self.events):
-            del self.events[event_index]
-
-            self.update_events_listbox()
-
-            self.show_event_details(-1)
-        else:
-            messagebox.showinfo("Помилка", "Виберіть подію для видалення.")
-
-    def show_context_menu(self, event):
-        self.context_menu.post(event.x_root, event.y_root)
-        
-    def send_notifications(self):
-        try:
-            # Loading credentials from a file
-            with open('credentials.json', 'r') as file:
-                creds_data = json.load(file)
-            # Converting a string to a dictionary
-            creds_data = json.loads(creds_data)
-            creds = Credentials(
-                token=creds_data['token'],
-                refresh_token=creds_data['refresh_token'],
-                token_uri=creds_data['token_uri'],
-                client_id=creds_data['client_id'],
-                client_secret=creds_data['client_secret']
-            )
-            
-            # Creating a Credential Object
-            name_credentials = Credentials.from_authorized_user_info(creds_data)
-            # Checking if the access token needs updating
-            if name_credentials.expired and name_credentials.refresh_token:
-                name_credentials.refresh(Request())
-            
-            service = build('gmail', 'v1', credentials=creds)
-
-            # Checking all user events
-            for event in self.events:
-                # Checking whether the event has a notification and whether its time has come
-                if event.notify_date and datetime.datetime.now() >= event.notify_date and not event.sent:
-                    url = 'https://www.googleapis.com/oauth2/v3/userinfo'
-                    headers = {'Authorization': f'Bearer {name_credentials.token}'}
-                    response = requests.get(url, headers=headers)
-                    if response.status_code == 200:
-                        data = response.json()
-                        name = data.get('name')
-                    
-                    # Make message
-                    message = MIMEText(f"{event.description}\nВід {name} за допомогою Event Planner.")
-                    message['to'] = ", ".join(event.emails)
-                    message['subject'] = f"Нагадуємо, що подія {event.title} розпочнеться {event.date}!"
-
-                    create_message = {'raw': base64.urlsafe_b64encode(message.as_bytes()).decode()}
-
-                    try:
-                        message = (service.users().messages().send(userId="me", body=create_message).execute())
-                        print(F'sent message to {message} Message Id: {message["id"]}')
-                        
-                        # Mark the event as sent
-                        event.sent = True
-                    except HTTPError as error:
-                        print(F'An error occurred: {error}')
-                        message = None
-
-        except Exception as e:
-            print(f"Error sending notifications: {e}")
-        
-    def run_notification_loop(self):
-        def notification_thread():
-            while True:
-                self.send_notifications()
-                time.sleep(60)
-
-        thread = threading.Thread(target=notification_thread)
-        thread.daemon = True
-        thread.start()
-
-    def open_settings(self):
-        settings_window = SettingsWindowUKR(self, self.current_theme)
-        
-    def change_theme(self):
-        # Changing the colors of controls depending on the selected theme
-        if self.current_theme == "dark":  # Dark theme
-            # Colors for dark theme
-            background_color = "#414141"
-            details_text_color = 'white'
-            listbox_background_color = "#323232"
-            listbox_item_background_color = "#323232"
-            listbox_item_foreground_color = "white"
-            button_background_color = "#323232"
-            button_foreground_color = "white"
-            button_active_background_color = "#FCF7C9"
-            button_active_foreground_color = "#323232"
-        else: # Light theme
-            # Light Theme Colors
-            background_color = "white"
-            details_text_color = '#262626'
-            listbox_background_color = "white"
-            listbox_item_background_color = "#FCF7C9"
-            listbox_item_foreground_color = "#323232"
-            button_background_color = "#FCF7C9"
-            button_foreground_color = "#323232"
-            button_active_background_color = "#323232"
-            button_active_foreground_color = "white"
-
-        # Applying colors to controls
-        self.root.configure(bg=background_color)
-        self.toolbar_frame.configure(bg=background_color)
-        self.events_listbox.configure(bg=listbox_background_color)
-        for widget in self.events_listbox.winfo_children():
-                widget.config(bg=listbox_item_background_color, fg=listbox_item_foreground_color)
-        self.context_menu.configure(bg=background_color, fg=button_foreground_color)
-        self.details_text.configure(bg=background_color, fg=details_text_color)
-        self.style.configure("Yellow.TButton", background=button_background_color, foreground=button_foreground_color)
-        self.style.map("Yellow.TButton", background=[("active", button_active_background_color)], foreground=[("active", button_active_foreground_color)])
-
-    def run(self):
-        self.root.mainloop()
-        
-class SettingsWindowUKR:
-    def __init__(self, parent, current_theme):
-        self.parent = parent
-        self.settings_window = tk.Toplevel(parent.root)
-        self.settings_window.title("Налаштування")
-        self.settings_window.iconphoto(False, tk.PhotoImage(file=resource_path('EP_cover.png')))
-        
-        self.current_theme = current_theme
-        
-        if self.current_theme == 'light':
-            self.settings_window.configure(bg='white')
-        elif self.current_theme == 'dark':
-            self.settings_window.configure(bg='#414141')
-        
-        self.credentials = None
-        
-        self.create_widgets()
-
-    def create_widgets(self):
-        # Adding Controls
-        if self.current_theme == 'light':
-            self.settings_frame = tk.Frame(self.settings_window, bg='white')
-        elif self.current_theme == 'dark':
-            self.settings_frame = tk.Frame(self.settings_window, bg='#414141')
-        self.settings_frame.pack(pady=5, padx=10)
-
-        # Google Account Zone
-        if self.current_theme == 'light':
-            self.google_account_frame = tk.Frame(self.settings_frame, bg='white')
-        elif self.current_theme == 'dark':
-            self.google_account_frame = tk.Frame(self.settings_frame, bg='#414141')
-        self.google_account_frame.pack(side="left", padx=10)
-
-        tk.Label(self.google_account_frame, text="Налаштування облікового запису Google:", font=("Segoe UI Semibold", 12)).pack(pady=10, anchor="w")
-
-        # Checking if Google Account data is saved
-        if os.path.exists('credentials.json'):
-            # Loading credentials from a file
-            with open('credentials.json', 'r') as file:
-                creds_data = json.load(file)
-            # Converting a string to a dictionary
-            creds_data = json.loads(creds_data)
-            # Creating a Credential Object
-            self.credentials = Credentials.from_authorized_user_info(creds_data)
-            # Checking if credentials are valid
-            if not self.credentials.valid:
-                # Checking if the access token needs updating
-                if self.credentials.expired and self.credentials.refresh_token:
-                    self.credentials.refresh(Request())
-                    # Display Google account information
-                    email, name = self.get_user_info()
-                    if email and name:
-                        ttk.Label(self.google_account_frame, text="Електронна пошта:", font=("Segoe UI", 12)).pack(anchor="w")
-                        ttk.Label(self.google_account_frame, text=email, font=("Segoe UI", 12)).pack(anchor="w")
-                        ttk.Label(self.google_account_frame, text="Ім'я користувача:", font=("Segoe UI", 12)).pack(anchor="w")
-                        ttk.Label(self.google_account_frame, text=name, font=("Segoe UI", 12)).pack(anchor="w")
-                        # Logout button
-                        ttk.Button(self.google_account_frame, style="Yellow.TButton", text="Вийти зі свого облікового запису", command=self.logout_google_account).pack(pady=10, anchor="w")
-                    else:
-                        # If we were unable to obtain information, we display the login button
-                        ttk.Button(self.google_account_frame, style="Yellow.TButton", text="Увійти в обліковий запис Google", command=self.login_google_account).pack(pady=10, anchor="w")
-                else:
-                    # Credentials are invalid, you need to log in again
-                    self.login_google_account()
-            else:
-                # Display Google account information
-                email, name = self.get_user_info()
-                if email and name:
-                    ttk.Label(self.google_account_frame, text="Електронна пошта:", font=("Segoe UI", 12)).pack(anchor="w")
-                    ttk.Label(self.google_account_frame, text=email, font=("Segoe UI", 12)).pack(anchor="w")
-                    ttk.Label(self.google_account_frame, text="Ім'я користувача:", font=("Segoe UI", 12)).pack(anchor="w")
-                    ttk.Label(self.google_account_frame, text=name, font=("Segoe UI", 12)).pack(anchor="w")
-                    # Logout button
-                    ttk.Button(self.google_account_frame, style="Yellow.TButton", text="Вийти зі свого облікового запису", command=self.logout_google_account).pack(pady=10, anchor="w")
-                else:
-                    # If we were unable to obtain information, we display the login button
-                    ttk.Button(self.google_account_frame, style="Yellow.TButton", text="Увійти в обліковий запис Google", command=self.login_google_account).pack(pady=10, anchor="w")
-        else:
-            # If there are no credentials, we display the login button
-            ttk.Button(self.google_account_frame, style="Yellow.TButton", text="Увійти в обліковий запис Google", command=self.login_google_account).pack(pady=10, anchor="w")
-
-        # Zone of buttons for changing theme and language
-        if self.current_theme == 'light':
-            self.theme_language_frame = tk.Frame(self.settings_frame, bg='white')
-        elif self.current_theme == 'dark':            
-            self.theme_language_frame = tk.Frame(self.settings_frame, bg='#414141')
-        self.theme_language_frame.pack(side="right", padx=10)
-        
-        # Adding help button centered in the zone
-        ttk.Button(self.theme_language_frame, style="Yellow.TButton", text="Довідка", command=lambda: webbrowser.open("https://docs.google.com/document/d/1yQYKMG--Q4hUG8daiSD0xcQOntGQ_f_nzOiG34x_KQE/edit?usp=sharing")).pack(side="top", padx=5)
-
-        # Adding buttons to change theme and language
-        ttk.Button(self.theme_language_frame, style="Yellow.TButton", text="Змінити кольорову тему", command=self.save_and_change_theme).pack(side="left", padx=5)
-        ttk.Button(self.theme_language_frame, style="Yellow.TButton", text="Змінити мову", command=self.change_language).pack(side="bottom", pady=1)
-        
-        tk.Label(self.settings_window, text="© 2024 Hlib Ishchenko. All rights reserved.", font=("Segoe UI", 12)).pack(pady=10, side="bottom")
-
-    def get_user_info(self):
-        url = 'https://www.googleapis.com/oauth2/v3/userinfo'
-        headers = {'Authorization': f'Bearer {self.credentials.token}'}
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            data = response.json()
-            email = data.get('email')
-            name = data.get('name')
-            return email, name
-        else:
-            print('Error:', response.status_code)
-            return None, None
-
-    def login_google_account(self):
-        os.environ['OAUTHLIB_RELAX_TOKEN_SCOPE'] = '1'
-        # Creating OAuth2 credentials to access the Gmail API and retrieve user information
-        scopes = [
-            'https://www.googleapis.com/auth/gmail.send',
-            'https://www.googleapis.com/auth/userinfo.email',
-            'https://www.googleapis.com/auth/userinfo.profile'
-        ]
-        flow = InstalledAppFlow.from_client_secrets_file(resource_path('your_client_secret.json'), scopes=scopes)
-        self.credentials = flow.run_local_server(port=0)
-
-        # Saving credentials to a file
-        with open('credentials.json', 'w') as file:
-            json.dump(self.credentials.to_json(), file)
-        
-        # Rebooting the settings window
-        self.settings_window.destroy()
-        self.__init__(self.parent)
-
-    def logout_google_account(self):
-        # Deleting files with credentials
-        if os.path.exists('credentials.json'):
-            os.remove('credentials.json')
-
-        # Rebooting the settings window
-        self.settings_window.destroy()
-        self.__init__(self.parent)
-        
-    def save_and_change_theme(self):
-        response = messagebox.askquestion("Увага", "Програму буде перезапущено, щоб змінити тему. Продовжити?")
-        if response == 'yes':
-            new_theme = "dark" if self.current_theme == "light" else "light"
-            
-            # Save the current theme to a file
-            with open("current_theme.txt", "w") as f:
-                f.write(new_theme)
-                
-            self.parent.save_events_to_file()
-            # Restart application
-            python = sys.executable
-            os.execl(python, python, *sys.argv)
-
-    def show(self):
-        self.settings_window.deiconify()
-
-    def hide(self):
-        self.settings_window.withdraw()
-    
-    def change_language(self):
-        response = messagebox.askquestion("Увага", "Мова зміниться на англійську. Програма буде перезапущена, щоб змінити мову. Продовжити?")
-        if response == 'yes':
-            if os.path.exists("current_language.txt"):
-                with open("current_language.txt", "r") as f:
-                    current_language = f.read()
-            else:
-                current_language = "english"
-                
-            new_language = "ukrainian" if current_language == "english" else "english"
-            
-            # Save the current theme to a file
-            with open("current_language.txt", "w") as f:
-                f.write(new_language)
-                
-            self.parent.save_events_to_file()
-            # Restart application
-            python = sys.executable
-            os.execl(python, python, *sys.argv)  
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    
-    root.iconphoto(False, tk.PhotoImage(file=resource_path('EP_cover.png')))
-    
-    if os.path.exists("current_scaling.txt"):
-        with open("current_scaling.txt", "r") as f:
-            current_scaling = float(f.read())
-    else:
-        current_scaling = 1.33
-    root.tk.call('tk', 'scaling', current_scaling)
-    
-    if os.path.exists("current_language.txt"):
-        with open("current_language.txt", "r") as f:
-            current_language = f.read()
-    else:
-        current_language = "english"
-    if current_language == "english":
-        app = EventPlannerApp(root)
-    elif current_language == "ukrainian":
-        app = EventPlannerAppUKR(root)
-    
-    app.root.geometry(f"{int(800/(1.33/current_scaling))}x{int(600/(1.33/current_scaling))}")
     app.run()
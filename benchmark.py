@@ -0,0 +1,275 @@
+"""
+Startup benchmark of Event Planner.
+
+Generates synthetic event stores, starts the app on each of them with a withdrawn
+root window and collects the startup phases reported by the app (imports, Tk,
+load_fonts, widgets, event store load, update_events_listbox, scheduler start,
+window and first idle). Results are written to a JSON file that can be compared across commits:
+
+    python benchmark.py --output before.json
+    python benchmark.py --output after.json --compare before.json
+
+--serialization also times saving and loading the events in-process with the
+current Event.serialize/deserialize against the strftime/strptime versions they
+replaced, and --memory reports the memory used per event.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from EventPlanner import DATE_FORMAT, Event, EventStore, LazyEventList, parse_date
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "EventPlanner.py")
+
+def generate_events(count, seed=0):
+    # Events spread over two years around now, every third one with a reminder and
+    # every one with a long description
+    rng = random.Random(seed)
+    now = datetime.datetime.now().replace(microsecond=0)
+    paragraph = "Agenda, notes and directions for the meeting. " * 40
+    events = []
+    for i in range(count):
+        date = now + datetime.timedelta(minutes=rng.randint(-525600, 525600))
+        notify_date = date - datetime.timedelta(hours=rng.randint(1, 48)) if i % 3 == 0 else None
+        events.append(Event(
+            f"Event {i}",
+            paragraph[:rng.randint(200, len(paragraph))],
+            date,
+            [f"guest{j}@example.com" for j in range(rng.randint(1, 5))],
+            notify_date,
+            notify_date is not None and notify_date < now
+        ))
+    return events
+
+def write_store(directory, count, storage):
+    with open(os.path.join(directory, "events.json"), "w") as f:
+        json.dump([event.serialize() for event in generate_events(count)], f)
+    # The app migrates events.json into events.db on its first (warm-up) run
+    with open(os.path.join(directory, "settings.json"), "w") as f:
+        json.dump({"storage": storage}, f)
+    # Sending is disabled so due reminders never leave the machine
+    with open(os.path.join(directory, "mail_transport.json"), "w") as f:
+        json.dump({"type": "sink"}, f)
+    # Resources are looked up relative to the working directory outside PyInstaller
+    shutil.copy(os.path.join(os.path.dirname(APP), "EP_cover.png"), directory)
+    shutil.copytree(os.path.join(os.path.dirname(APP), "fonts"), os.path.join(directory, "fonts"))
+
+def app_command(report_path):
+    command = [sys.executable, APP, "--benchmark", report_path]
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY") and shutil.which("xvfb-run"):
+        command = ["xvfb-run", "-a"] + command
+    return command
+
+def run_app(directory, timeout):
+    report_path = os.path.join(directory, "startup_report.json")
+    if os.path.exists(report_path):
+        os.remove(report_path)
+    start = time.perf_counter()
+    subprocess.run(app_command(report_path), cwd=directory, timeout=timeout, check=True,
+                   stdout=subprocess.DEVNULL)
+    wall = (time.perf_counter() - start) * 1000
+    with open(report_path, "r") as f:
+        phases = json.load(f)["phases"]
+    return {"wall_ms": wall, "phases": {phase["phase"]: phase["ms"] for phase in phases}}
+
+def summarize(runs):
+    names = []
+    for run in runs:
+        for name in run["phases"]:
+            if name not in names:
+                names.append(name)
+    median = {name: statistics.median(run["phases"][name] for run in runs if name in run["phases"]) for name in names}
+    median["wall"] = statistics.median(run["wall_ms"] for run in runs)
+    return median
+
+def legacy_serialize(event):
+    # Event.serialize as it was before format_date
+    return {
+        "title": event.title,
+        "description": event.description,
+        "date": event.date.strftime(DATE_FORMAT),
+        "emails": event.emails,
+        "notify_date": event.notify_date.strftime(DATE_FORMAT) if event.notify_date else None,
+        "sent": event.sent,
+        "id": event.id
+    }
+
+def legacy_deserialize(event_dict):
+    # Event.deserialize as it was before parse_date
+    date = datetime.datetime.strptime(event_dict["date"], DATE_FORMAT)
+    notify_date = datetime.datetime.strptime(event_dict["notify_date"], DATE_FORMAT) if event_dict["notify_date"] else None
+    return Event(event_dict["title"], event_dict["description"], date, event_dict["emails"], notify_date, event_dict["sent"], event_dict.get("id"))
+
+def benchmark_serialization(count, repeat):
+    # Save is serialize + json.dumps, load is json.loads + deserialize, best of repeat
+    events = generate_events(count)
+    text = json.dumps([event.serialize() for event in events])
+    assert text == json.dumps([legacy_serialize(event) for event in events])
+    codecs = {
+        "legacy": (legacy_serialize, legacy_deserialize),
+        "current": (Event.serialize, Event.deserialize)
+    }
+    timings = {}
+    for name, (serialize, deserialize) in codecs.items():
+        save = load = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            json.dumps([serialize(event) for event in events])
+            save = min(save, time.perf_counter() - start)
+            start = time.perf_counter()
+            [deserialize(event_dict) for event_dict in json.loads(text)]
+            load = min(load, time.perf_counter() - start)
+        timings[name] = {"save_ms": save * 1000, "load_ms": load * 1000}
+    timings["save_speedup"] = timings["legacy"]["save_ms"] / timings["current"]["save_ms"]
+    timings["load_speedup"] = timings["legacy"]["load_ms"] / timings["current"]["load_ms"]
+    return timings
+
+class DictEvent:
+    # Event as it was before __slots__ and shared recipient tuples, for comparison
+    def __init__(self, title, description, date, emails, notify_date=None, sent=False, id=None):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.date = date
+        self.emails = emails
+        self.notify_date = notify_date
+        self.sent = sent
+
+def allocated(build):
+    # Bytes still allocated by build() when it returns, and its result
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+def benchmark_memory(count):
+    directory = tempfile.mkdtemp(prefix=f"event-planner-memory-{count}-")
+    try:
+        snapshot_path = os.path.join(directory, "events.json")
+        with open(snapshot_path, "w") as f:
+            json.dump([event.serialize() for event in generate_events(count)], f)
+        store = EventStore(snapshot_path, os.path.join(directory, "events.log"))
+        store_bytes, events = allocated(store.load)
+        store.close()
+
+        summaries = [(data["id"], data["title"], data["date"], data["notify_date"], data["sent"], data.get("recurrence"))
+                     for data in store.records.values()]
+        # The summary dict that LazyEventList used before the columns
+        dict_summaries_bytes, _ = allocated(lambda: {summary[0]: summary[1:] for summary in summaries})
+        columns_bytes, _ = allocated(lambda: LazyEventList(store, summaries))
+
+        records = list(store.records.values())
+        slots_bytes, _ = allocated(lambda: [Event.deserialize(data) for data in records])
+        dict_bytes, _ = allocated(lambda: [DictEvent(data["title"], data["description"], parse_date(data["date"]),
+                                                     list(data["emails"]),
+                                                     parse_date(data["notify_date"]) if data["notify_date"] else None,
+                                                     data["sent"], data["id"])
+                                           for data in records])
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return {
+        "store_load_bytes_per_event": store_bytes / count,
+        "summary_dict_bytes_per_event": dict_summaries_bytes / count,
+        "summary_columns_bytes_per_event": columns_bytes / count,
+        "event_dict_bytes_per_event": dict_bytes / count,
+        "event_slots_bytes_per_event": slots_bytes / count
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(APP), capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, baseline_path):
+    with open(baseline_path, "r") as f:
+        baseline = json.load(f)
+    previous = {(result["events"], result["storage"]): result["median_ms"] for result in baseline["results"]}
+    print(f"Compared with {baseline_path} ({baseline.get('commit')}):")
+    for result in results["results"]:
+        old = previous.get((result["events"], result["storage"]))
+        if old is None:
+            continue
+        print(f"  {result['events']} events, {result['storage']}:")
+        for name, ms in result["median_ms"].items():
+            if name in old and old[name] > 0:
+                print(f"    {name:24} {old[name]:10.1f} -> {ms:10.1f} ms ({(ms - old[name]) / old[name] * 100:+.1f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the startup time of Event Planner")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--storage", choices=["json", "sqlite"], default="json")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="results of an earlier run to compare with")
+    parser.add_argument("--serialization", action="store_true", help="also time Event serialization in-process")
+    parser.add_argument("--memory", action="store_true", help="also report the memory used per event")
+    args = parser.parse_args()
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": []
+    }
+    for size in args.sizes:
+        directory = tempfile.mkdtemp(prefix=f"event-planner-{size}-")
+        try:
+            write_store(directory, size, args.storage)
+            size_bytes = os.path.getsize(os.path.join(directory, "events.json"))
+            # The warm-up run pays for one-time work like migrations and the OS file cache
+            run_app(directory, args.timeout)
+            runs = [run_app(directory, args.timeout) for _ in range(args.repeat)]
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        median = summarize(runs)
+        results["results"].append({
+            "events": size,
+            "storage": args.storage,
+            "events_json_bytes": size_bytes,
+            "runs": runs,
+            "median_ms": median
+        })
+        print(f"{size} events ({args.storage}): " + ", ".join(f"{name} {ms:.1f} ms" for name, ms in median.items()))
+
+    if args.serialization:
+        results["serialization"] = []
+        for size in args.sizes:
+            timings = benchmark_serialization(size, args.repeat)
+            results["serialization"].append(dict(events=size, **timings))
+            print(f"{size} events serialization: save {timings['legacy']['save_ms']:.1f} -> {timings['current']['save_ms']:.1f} ms "
+                  f"({timings['save_speedup']:.1f}x), load {timings['legacy']['load_ms']:.1f} -> {timings['current']['load_ms']:.1f} ms "
+                  f"({timings['load_speedup']:.1f}x)")
+
+    if args.memory:
+        results["memory"] = []
+        for size in args.sizes:
+            memory = benchmark_memory(size)
+            results["memory"].append(dict(events=size, **memory))
+            print(f"{size} events memory: " + ", ".join(f"{name} {value:.0f}" for name, value in memory.items()))
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()